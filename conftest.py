@@ -0,0 +1,41 @@
+"""
+pytest options for the benchmark suite in test_benchmarks.py, and a
+throwaway statistics database for every test.
+
+Benchmarks are skipped in normal runs:
+
+python -m pytest test_benchmarks.py --bench                 # compare with bench_baseline.json
+python -m pytest test_benchmarks.py --bench --bench-update  # store new numbers, then commit the file
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("bench", "benchmarks")
+    group.addoption("--bench", action="store_true", help="run benchmarks marked with @pytest.mark.bench")
+    group.addoption("--bench-update", action="store_true", help="store the results in the baseline file (commit it afterwards)")
+    group.addoption("--bench-baseline", default="bench_baseline.json", help="baseline file")
+    group.addoption("--bench-threshold", type=float, default=0.25,
+                    help="fail if ops/sec drops by more than this fraction of the baseline")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "bench: performance benchmark, only runs with --bench")
+
+
+@pytest.fixture(autouse=True)
+def stats_file(tmp_path, monkeypatch):
+    """Games played by tests are counted in a throwaway database, not ~/.wordle_stats.sqlite3."""
+    path = tmp_path / "stats.sqlite3"
+    monkeypatch.setenv("WORDLE_STATS", str(path))
+    return path
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench"):
+        return
+    skip = pytest.mark.skip(reason="benchmark, run with --bench")
+    for item in items:
+        if "bench" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,268 @@
+"""
+Benchmarks for the hot paths
+
+python -m pytest test_benchmarks.py --bench -v
+
+Times compare() over all answer pairs, dictionary loading and validation,
+candidate filtering, solver and decision-tree hints, starting a new game in
+every mode, and the cold start of both entry points and of a first game.
+Every benchmark reports ops/sec and the tracemalloc peak, and is checked
+against the baseline in bench_baseline.json, which is committed (see
+conftest.py for options): a drop in ops/sec of more than --bench-threshold
+fails the test. The baseline only changes with --bench-update. A summary
+is written to bench_output.txt. Everything runs offline.
+
+Requirements:
+    - pytest
+    - colorama
+    - numpy (solver benchmarks only)
+"""
+
+import json
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from wordle_dictionary import Dictionary, get_dictionary
+from wordle_index import WordIndex
+from wordle_score import ALL_CORRECT, score
+from wordle_session import GameSession
+from wordle_terminal import compare
+
+pytestmark = pytest.mark.bench
+
+BASE_PATH = Path(__file__).resolve().parent
+
+
+class Recorder:
+    """Collects results, compares them with the baseline and saves both."""
+
+    def __init__(self, config):
+        self.path = BASE_PATH / config.getoption("--bench-baseline")
+        self.update = config.getoption("--bench-update")
+        self.threshold = config.getoption("--bench-threshold")
+        self.baseline = json.loads(self.path.read_text()) if self.path.exists() else {}
+        self.results = {}
+
+    def measure(self, name, func, ops, rounds=3, traced=None, memory=None):
+        """
+        Run func rounds times and keep the best time; ops is the number of
+        operations one call performs. traced (default func) is run once more
+        under tracemalloc for the memory peak, unless memory is given: a
+        function returning the peak in bytes itself.
+        """
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+
+        if memory:
+            peak = memory()
+        else:
+            tracemalloc.start()
+            (traced or func)()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        result = {"ops_per_sec": ops / best, "seconds": best, "peak_kb": peak / 1024}
+        self.results[name] = result
+        baseline = self.baseline.get(name)
+        if baseline and not self.update:
+            floor = baseline["ops_per_sec"] * (1 - self.threshold)
+            assert result["ops_per_sec"] >= floor, (
+                f"{name} regressed: {result['ops_per_sec']:.1f} ops/sec, "
+                f"baseline {baseline['ops_per_sec']:.1f}"
+            )
+        return result
+
+    def save(self):
+        # the baseline is committed, only --bench-update changes it
+        if self.update and self.results:
+            self.path.write_text(json.dumps({**self.baseline, **self.results}, indent=2, sort_keys=True) + "\n")
+        lines = [f"{'benchmark':32} {'ops/sec':>14} {'seconds':>10} {'peak KB':>10} {'baseline':>14}"]
+        for name, r in sorted(self.results.items()):
+            base = self.baseline.get(name, {}).get("ops_per_sec")
+            lines.append(f"{name:32} {r['ops_per_sec']:14.1f} {r['seconds']:10.4f} "
+                         f"{r['peak_kb']:10.1f} {base if base is None else round(base, 1)!s:>14}")
+        (BASE_PATH / "bench_output.txt").write_text("\n".join(lines) + "\n")
+        print("\n" + "\n".join(lines))
+
+
+@pytest.fixture(scope="module")
+def bench(request):
+    recorder = Recorder(request.config)
+    yield recorder
+    recorder.save()
+
+
+@pytest.fixture(scope="module")
+def answers():
+    return get_dictionary().answers
+
+
+@pytest.fixture(scope="module")
+def pairs(answers):
+    rng = random.Random(0)
+    guesses = get_dictionary().guesses
+    return [(rng.choice(guesses), rng.choice(answers)) for _ in range(2000)]
+
+
+class TestScoring:
+
+    def test_compare_all_pairs(self, bench, answers):
+        def run(rows=answers):
+            for guess in rows:
+                for answer in answers:
+                    compare(guess, answer)
+
+        bench.measure("compare_all_pairs", run, len(answers) ** 2, rounds=1,
+                      traced=lambda: run(answers[:50]))
+
+    def test_score_all_pairs(self, bench, answers):
+        def run(rows=answers):
+            for guess in rows:
+                for answer in answers:
+                    score(guess, answer)
+
+        bench.measure("score_all_pairs", run, len(answers) ** 2, rounds=1,
+                      traced=lambda: run(answers[:50]))
+
+
+    def test_score_batch_full_matrix(self, bench, answers):
+        patterns = pytest.importorskip("wordle_patterns")
+        guesses = patterns.encode_words(get_dictionary().guesses)
+        encoded = patterns.encode_words(answers)
+        bench.measure("score_batch_full_matrix", lambda: patterns.score_batch(guesses, encoded),
+                      len(guesses) * len(answers), rounds=1,
+                      traced=lambda: patterns.score_batch(guesses[:512], encoded))
+
+
+class TestDictionary:
+
+    def test_load(self, bench):
+        bench.measure("dictionary_load", lambda: Dictionary().allowed, 1, rounds=5)
+
+    def test_validation(self, bench):
+        dictionary = get_dictionary()
+        words = list(dictionary.guesses) + [w[::-1] for w in dictionary.guesses]
+
+        def run():
+            for word in words:
+                dictionary.is_valid(word)
+
+        bench.measure("validation", run, len(words))
+
+
+class TestFiltering:
+
+    @pytest.mark.parametrize("word_list", ["answers", "guesses"])
+    def test_filter(self, bench, pairs, word_list):
+        index = WordIndex(getattr(get_dictionary(), word_list))
+
+        def run():
+            for guess, answer in pairs:
+                index.filter(index.all, guess, score(guess, answer))
+
+        bench.measure(f"filter_{word_list}", run, len(pairs))
+
+
+class TestSolver:
+
+    def test_first_hint(self, bench):
+        solver = pytest.importorskip("wordle_solver")
+        solver.get_matrix()
+        bench.measure("hint_first_turn", lambda: solver.rank_guesses(top=5), 1)
+
+    def test_second_hint(self, bench, pairs):
+        solver = pytest.importorskip("wordle_solver")
+        histories = [[(g, score(g, a))] for g, a in pairs[:20]]
+
+        def run():
+            for history in histories:
+                solver.rank_guesses(history, top=5)
+
+        bench.measure("hint_second_turn", run, len(histories))
+
+    def test_tree_hint(self, bench, answers):
+        tree_module = pytest.importorskip("wordle_tree")
+        if tree_module.get_tree() is None:
+            tree_module.build()
+        tree = tree_module.get_tree()
+        # the tree's own game for each answer, replayed one hint at a time
+        games = []
+        for answer in answers[:200]:
+            history = []
+            while not history or history[-1][1] != ALL_CORRECT:
+                guess = tree.next_guess(history)
+                history.append((guess, score(guess, answer)))
+            games.append(history)
+
+        def run():
+            for history in games:
+                for turn in range(len(history)):
+                    tree.next_guess(history[:turn])
+
+        bench.measure("hint_tree", run, sum(len(h) for h in games))
+
+
+class TestNewGame:
+
+    @pytest.mark.parametrize("mode", ["classic", "hard", "boards_4", "absurdle"])
+    def test_new_game(self, bench, mode):
+        dictionary = get_dictionary()
+        if mode == "boards_4":
+            cls = pytest.importorskip("wordle_multiboard").MultiBoardSession
+            new = lambda: cls(dictionary, 4)
+        elif mode == "absurdle":
+            cls = pytest.importorskip("wordle_absurdle").AbsurdleSession
+            new = lambda: cls(dictionary)
+        else:
+            new = lambda: GameSession(dictionary, hard_mode=mode == "hard")
+        # the first game pays for lazily built tables, the benchmark is the games after it
+        new()
+        games = 1000
+
+        def run():
+            for _ in range(games):
+                new()
+
+        bench.measure(f"new_game_{mode}", run, games, traced=new)
+
+
+class TestStartup:
+
+    @pytest.mark.parametrize("module", ["wordle_terminal", "wordle_tkinter"])
+    def test_cold_import(self, bench, module):
+        command = [sys.executable, "-c", f"import {module}"]
+        traced = [sys.executable, "-X", "tracemalloc", "-c",
+                  f"import tracemalloc, {module}; print(tracemalloc.get_traced_memory()[1])"]
+
+        def run():
+            subprocess.run(command, cwd=BASE_PATH, check=True)
+
+        def memory():
+            return int(subprocess.check_output(traced, cwd=BASE_PATH))
+
+        bench.measure(f"cold_import_{module}", run, 1, rounds=5, memory=memory)
+
+    def test_cold_new_game(self, bench):
+        # a fresh process up to its first game, word lists included
+        code = ("from wordle_dictionary import get_dictionary\n"
+                "from wordle_session import GameSession\n"
+                "GameSession(get_dictionary())\n")
+        traced = [sys.executable, "-X", "tracemalloc", "-c",
+                  "import tracemalloc\n" + code + "print(tracemalloc.get_traced_memory()[1])"]
+
+        def run():
+            subprocess.run([sys.executable, "-c", code], cwd=BASE_PATH, check=True)
+
+        def memory():
+            return int(subprocess.check_output(traced, cwd=BASE_PATH))
+
+        bench.measure("cold_new_game", run, 1, rounds=5, memory=memory)
@@ -0,0 +1,81 @@
+"""
+Test for the adversarial Absurdle mode
+
+python -m pytest test_wordle_absurdle.py -v
+
+The kept group must be the largest by feedback, as counted with score(),
+and the feedback given must stay consistent with some real answer.
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from wordle_absurdle import AbsurdleSession, largest_bucket
+from wordle_dictionary import Dictionary, get_dictionary
+from wordle_patterns import encoded_answers
+from wordle_score import ALL_CORRECT, score
+from wordle_session import IN_PROGRESS, WON
+
+WORDS = ["tango", "mango", "bongo", "bread", "crane", "drake", "flame", "grape",
+         "house", "speed", "abide", "geese", "elder", "eerie", "array", "ratty"]
+
+
+@pytest.fixture
+def dictionary():
+    return Dictionary.from_words(WORDS, ["aahed", "slate"])
+
+
+class TestLargestBucket:
+
+    def test_matches_score(self, dictionary):
+        encoded = encoded_answers(dictionary)
+        for guess in dictionary.guesses:
+            counts = Counter(score(guess, answer) for answer in WORDS)
+            biggest = max(counts.values())
+            code, bucket = largest_bucket(guess, encoded, range(len(WORDS)))
+            assert code == min(c for c, n in counts.items() if n == biggest)
+            assert [WORDS[i] for i in bucket] == [w for w in WORDS if score(guess, w) == code]
+
+    def test_single_candidate(self, dictionary):
+        code, bucket = largest_bucket("tango", encoded_answers(dictionary), [0])
+        assert code == ALL_CORRECT
+        assert list(bucket) == [0]
+
+
+class TestAbsurdleSession:
+
+    def test_guessing_a_candidate_does_not_win_early(self, dictionary):
+        session = AbsurdleSession(dictionary)
+        code, status = session.submit("tango")
+        assert status == IN_PROGRESS
+        assert session.remaining > 1
+
+    def test_feedback_is_consistent(self):
+        dictionary = get_dictionary()
+        rng = random.Random(0)
+        for _ in range(5):
+            session = AbsurdleSession(dictionary)
+            while session.status == IN_PROGRESS:
+                session.submit(rng.choice(dictionary.answers))
+            # every code given so far is what the final answer would give
+            assert all(score(guess, session.answer_word) == code for guess, code in session.history())
+            assert session.answer_word in session.possible_answers()
+
+    def test_win(self, dictionary):
+        class Unlimited(AbsurdleSession):
+            __slots__ = ()
+            max_attempts = len(WORDS)
+
+        session = Unlimited(dictionary)
+        while session.status == IN_PROGRESS:
+            session.submit(session.possible_answers()[0])
+        assert session.status == WON
+        assert session.remaining == 1
+
+    def test_hard_mode(self, dictionary):
+        session = AbsurdleSession(dictionary, hard_mode=True)
+        assert session.hard is not None
@@ -0,0 +1,87 @@
+"""
+Test for the shared word lists
+
+python -m pytest test_wordle_dictionary.py -v
+"""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from wordle_dictionary import PACK_FILE, Dictionary
+
+
+class TestLoading:
+
+    def test_lazy(self):
+        """Creating a dictionary reads no files."""
+        with patch("builtins.open", side_effect=AssertionError("file read")):
+            Dictionary()
+
+    def test_answers_and_guesses(self):
+        dictionary = Dictionary()
+        assert len(dictionary.answers) == 2315
+        assert len(dictionary.guesses) == len(dictionary.allowed) == 12972
+        assert dictionary.guesses[:2315] == dictionary.answers
+
+    def test_missing_zip(self, tmp_path):
+        """Without the zip only the answers are valid guesses."""
+        (tmp_path / "wordle_ord.txt").write_text("tango\nmango\n")
+        dictionary = Dictionary(tmp_path)
+        assert dictionary.answers == ("tango", "mango")
+        assert dictionary.allowed == {"tango", "mango"}
+
+
+class TestPack:
+
+    def test_written_then_used(self, tmp_path):
+        """The first load writes the pack, later loads don't read the text."""
+        (tmp_path / "wordle_ord.txt").write_text("tango\nmango\n")
+        Dictionary(tmp_path).answers
+        assert (tmp_path / PACK_FILE).exists()
+        with patch.object(Dictionary, "_load_text", side_effect=AssertionError("text read")):
+            dictionary = Dictionary(tmp_path)
+            assert dictionary.answers == ("tango", "mango")
+            assert dictionary.is_valid("mango")
+
+    def test_rebuilt_when_text_changes(self, tmp_path):
+        words = tmp_path / "wordle_ord.txt"
+        words.write_text("tango\nmango\n")
+        Dictionary(tmp_path).answers
+        words.write_text("tango\nmango\nbread\n")
+        assert Dictionary(tmp_path).answers == ("tango", "mango", "bread")
+        assert Dictionary(tmp_path).answers == ("tango", "mango", "bread")
+
+    def test_damaged_pack_falls_back(self, tmp_path):
+        (tmp_path / "wordle_ord.txt").write_text("tango\nmango\n")
+        Dictionary(tmp_path).answers
+        (tmp_path / PACK_FILE).write_bytes(b"WDLP")
+        assert Dictionary(tmp_path).answers == ("tango", "mango")
+
+    def test_same_as_text(self):
+        packed, text = Dictionary(), Dictionary()
+        text._load_text()
+        assert packed.answers == text.answers
+        assert packed.guesses == text.guesses
+
+
+class TestLookups:
+
+    @pytest.fixture
+    def dictionary(self):
+        return Dictionary.from_words(["tango", "mango"], ["aahed", "tango"])
+
+    def test_valid_guess_is_not_an_answer(self, dictionary):
+        assert dictionary.is_valid("aahed")
+        assert not dictionary.is_answer("aahed")
+        assert dictionary.is_answer("tango")
+        assert not dictionary.is_valid("kalak")
+
+    def test_indices(self, dictionary):
+        assert dictionary.guesses == ("tango", "mango", "aahed")
+        assert dictionary.guess_index["aahed"] == 2
+        assert dictionary.answer_index["mango"] == 1
+
+    def test_random_answer(self, dictionary):
+        assert dictionary.random_answer(random.Random(0)) in dictionary.answers
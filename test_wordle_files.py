@@ -0,0 +1,39 @@
+"""
+Test for atomic file writes
+
+python -m pytest test_wordle_files.py -v
+"""
+
+import os
+
+import pytest
+
+from wordle_files import write_atomic
+
+
+class TestWriteAtomic:
+
+    def test_bytes(self, tmp_path):
+        path = tmp_path / "data.bin"
+        write_atomic(path, b"first")
+        write_atomic(str(path), b"second")
+        assert path.read_bytes() == b"second"
+        assert os.listdir(tmp_path) == ["data.bin"]
+
+    def test_writer_function(self, tmp_path):
+        path = tmp_path / "data.bin"
+        write_atomic(path, lambda f: f.write(b"written"))
+        assert path.read_bytes() == b"written"
+
+    def test_failed_write_keeps_old_file(self, tmp_path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"old")
+
+        def fail(f):
+            f.write(b"partial")
+            raise RuntimeError("disk full")
+
+        with pytest.raises(RuntimeError):
+            write_atomic(path, fail)
+        assert path.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["data.bin"]
@@ -0,0 +1,164 @@
+"""
+Test for the binary game log
+
+python -m pytest test_wordle_gamelog.py -v
+
+Records must round-trip, segments must survive torn writes and rotate,
+and the chunked numpy scan must agree with counting the games by hand.
+"""
+
+import os
+
+import pytest
+
+from wordle_dictionary import Dictionary
+from wordle_gamelog import (FLAG_ABSURDLE, FLAG_HARD, HEADER, RECORD, GameLog, decode_record, encode_record,
+                            segments, session_record)
+from wordle_session import GameSession
+
+WORDS = ["tango", "mango", "bongo", "bread", "crane", "drake", "flame", "grape"]
+DIGEST = "0123456789abcdef"
+
+
+@pytest.fixture
+def dictionary():
+    return Dictionary.from_words(WORDS, ["aahed"])
+
+
+def play(dictionary, answer, guesses, hard_mode=False):
+    session = GameSession(dictionary, dictionary.answer_index[answer], hard_mode=hard_mode)
+    for word in guesses:
+        session.submit(word)
+    return session
+
+
+class AdversarialSession(GameSession):
+    __slots__ = ()
+
+    adversarial = True
+
+
+class TestRecords:
+
+    def test_round_trip(self):
+        data = encode_record(3, [1, 2, 3], [0, 121, 242], FLAG_HARD)
+        assert len(data) == RECORD.size == 22
+        assert decode_record(data) == (3, [1, 2, 3], [0, 121, 242], FLAG_HARD)
+
+    def test_too_many_guesses(self):
+        with pytest.raises(ValueError):
+            encode_record(0, range(7), [0] * 7)
+
+    def test_session_flags(self, dictionary):
+        session = play(dictionary, "tango", ["crane", "tango"], hard_mode=True)
+        answer, guesses, codes, flags = decode_record(session_record(session))
+        assert (answer, guesses, codes) == (0, [4, 0], list(session.codes))
+        assert flags == FLAG_HARD
+        adversarial = AdversarialSession(dictionary, 0)
+        assert decode_record(session_record(adversarial))[3] == FLAG_ABSURDLE
+
+
+class TestGameLog:
+
+    def test_append_and_reopen(self, tmp_path, dictionary):
+        with GameLog(tmp_path, DIGEST) as log:
+            log.record(play(dictionary, "tango", ["tango"]))
+        with GameLog(tmp_path, DIGEST) as log:
+            log.record(play(dictionary, "bread", ["crane", "bread"]))
+        [path] = segments(tmp_path)
+        assert os.path.getsize(path) == HEADER.size + 2 * RECORD.size
+
+    def test_torn_record_is_cut(self, tmp_path):
+        with GameLog(tmp_path, DIGEST) as log:
+            log.write(encode_record(0, [0], [242]))
+            log.file.write(b"\x15\x01")
+        with GameLog(tmp_path, DIGEST) as log:
+            log.write(encode_record(1, [1], [242]))
+        [path] = segments(tmp_path)
+        with open(path, "rb") as f:
+            data = f.read()
+        assert len(data) == HEADER.size + 2 * RECORD.size
+        assert decode_record(data[-RECORD.size:])[0] == 1
+
+    def test_rotation(self, tmp_path):
+        record = encode_record(0, [0], [242])
+        with GameLog(tmp_path, DIGEST, max_bytes=HEADER.size + 3 * RECORD.size) as log:
+            for _ in range(7):
+                log.write(record)
+        assert [os.path.getsize(p) // RECORD.size for p in segments(tmp_path)] == [4, 4, 2]
+
+    def test_other_word_lists_get_a_new_segment(self, tmp_path):
+        GameLog(tmp_path, DIGEST).close()
+        GameLog(tmp_path, "fedcba9876543210").close()
+        assert len(segments(tmp_path)) == 2
+
+    def test_partial_write_is_refused(self, tmp_path):
+        with GameLog(tmp_path, DIGEST) as log:
+            with pytest.raises(ValueError):
+                log.write(b"\x15")
+
+
+class TestAnalyse:
+
+    @pytest.fixture
+    def log_dir(self, tmp_path, dictionary):
+        games = [
+            ("tango", ["tango"]),
+            ("tango", ["crane", "mango", "tango"]),
+            ("bread", ["crane", "bread"]),
+            ("grape", ["crane", "tango", "mango", "bongo", "bread", "drake"]),
+        ]
+        with GameLog(tmp_path, DIGEST, max_bytes=HEADER.size + 2 * RECORD.size) as log:
+            for answer, guesses in games:
+                log.record(play(dictionary, answer, guesses))
+        return tmp_path
+
+    @pytest.mark.parametrize("chunk_records", [1, 3, 1 << 16])
+    def test_aggregates(self, log_dir, dictionary, chunk_records):
+        np = pytest.importorskip("numpy")
+        from wordle_gamelog import analyse
+
+        stats = analyse(log_dir, DIGEST, chunk_records)
+        assert stats["games"] == 4
+        assert list(stats["distribution"]) == [1, 1, 1, 1, 0, 0, 0]
+        assert stats["openers"][dictionary.guess_index["crane"]] == 3
+        assert stats["openers"][dictionary.guess_index["tango"]] == 1
+        tango, grape = dictionary.answer_index["tango"], dictionary.answer_index["grape"]
+        assert stats["plays"][tango] == 2
+        assert stats["guess_totals"][tango] == 4
+        assert stats["failures"][grape] == 1
+        assert stats["guess_totals"][grape] == 7
+        assert len(stats["failures"]) == len(stats["plays"])
+        assert np.sum(stats["failures"]) == 1
+
+    def test_other_digest_and_torn_tail_are_skipped(self, log_dir):
+        pytest.importorskip("numpy")
+        from wordle_gamelog import analyse
+
+        with open(segments(log_dir)[-1], "ab") as f:
+            f.write(b"\x15\x00")
+        assert analyse(log_dir, DIGEST)["games"] == 4
+        assert analyse(log_dir, "fedcba9876543210")["games"] == 0
+
+    def test_report(self, log_dir, dictionary):
+        pytest.importorskip("numpy")
+        from wordle_gamelog import analyse, report
+
+        text = report(analyse(log_dir), dictionary.answers, dictionary.guesses, top=1)
+        assert text.splitlines()[0] == "4 games, 75.0% solved, 2.000 guesses on average"
+        assert "  crane 3" in text
+        assert "  grape 7.00 over 1 games, 1 failed" in text
+
+
+class TestSimulate:
+
+    def test_every_game_is_logged(self, tmp_path):
+        pytest.importorskip("numpy")
+        from wordle_gamelog import analyse
+        from wordle_simulate import simulate
+
+        with GameLog(tmp_path, DIGEST) as log:
+            result = simulate(["first"], answers=range(25), workers=1, chunk_size=10, log=log)
+        stats = analyse(tmp_path)
+        assert stats["games"] == 25
+        assert list(stats["distribution"][1:]) == [result.distribution["first"][n] for n in range(1, 7)]
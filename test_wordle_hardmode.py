@@ -0,0 +1,85 @@
+"""
+Test for the hard mode constraints
+
+python -m pytest test_wordle_hardmode.py -v
+
+legal_bitset() must agree with check() word for word, and the answer must
+always be a legal hard-mode guess.
+"""
+
+import random
+
+import pytest
+
+from wordle_hardmode import HardModeConstraints
+from wordle_index import WordIndex
+from wordle_score import score
+
+WORDS = ["tango", "mango", "bread", "crane", "drake", "flame", "grape", "house",
+         "speed", "abide", "geese", "elder", "eerie", "array", "ratty"]
+
+
+def constraints(answer, *guesses):
+    hard = HardModeConstraints()
+    for guess in guesses:
+        hard.update(guess, score(guess, answer))
+    return hard
+
+
+@pytest.fixture(scope="module")
+def index():
+    return WordIndex(WORDS)
+
+
+class TestCheck:
+
+    def test_no_hints_yet(self):
+        assert all(HardModeConstraints().check(w) is None for w in WORDS)
+
+    def test_green_must_stay(self):
+        hard = constraints("tango", "mango")
+        assert hard.check("bongo") == "2nd letter must be A"
+        assert hard.check("tangy") == "5th letter must be O"
+
+    def test_yellow_must_be_used(self):
+        hard = constraints("crane", "bread")
+        assert hard.check("house") == "2nd letter must be R"
+        assert hard.check("drake") == "D is not in the word"
+        assert hard.check("grape") is None
+        assert constraints("crane", "abide").check("crane") is None
+        assert constraints("crane", "abide").check("grove") == "Guess must contain A"
+
+    def test_yellow_cannot_repeat_position(self):
+        hard = constraints("abide", "eerie")
+        assert hard.check("eerie") == "E cannot be the 1st letter"
+
+    def test_gray_letter_excluded(self):
+        hard = constraints("tango", "house")
+        assert hard.excluded == {"h", "u", "s", "e"}
+        assert hard.check("olden") == "E is not in the word"
+
+    def test_repeated_letter_counts(self):
+        # speed vs abide: one E is yellow, the other gray, so exactly one E
+        hard = constraints("abide", "speed")
+        assert hard.min_counts["e"] == 1
+        assert hard.max_counts["e"] == 1
+        assert hard.check("geese") == "E cannot be the 3rd letter"
+        assert hard.check("eedaa") == "E is in the word only 1 time"
+        assert hard.check("abide") is None
+
+    def test_answer_always_legal(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            answer = rng.choice(WORDS)
+            hard = constraints(answer, *rng.sample(WORDS, 3))
+            assert hard.check(answer) is None
+
+
+class TestLegalBitset:
+
+    def test_matches_check(self, index):
+        rng = random.Random(1)
+        for _ in range(300):
+            hard = constraints(rng.choice(WORDS), *rng.sample(WORDS, rng.randint(1, 3)))
+            expected = [w for w in WORDS if hard.check(w) is None]
+            assert index.members(hard.legal_bitset(index)) == expected
@@ -0,0 +1,139 @@
+"""
+Test for the background hint worker
+
+python -m pytest test_wordle_hints.py -v
+
+A thread pool stands in for the worker process. Results of a cancelled or
+replaced request must never come back from poll().
+"""
+
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from wordle_dictionary import Dictionary
+from wordle_hints import HintWorker, analyse, analyse_boards
+
+
+def wait_for(worker, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = worker.poll()
+        if result is not None:
+            return result
+        time.sleep(0.005)
+    raise AssertionError("no result")
+
+
+def blocked(event, value):
+    event.wait(5)
+    return value
+
+
+def fail():
+    raise ValueError("no candidates")
+
+
+@pytest.fixture
+def worker():
+    worker = HintWorker(lambda: ThreadPoolExecutor(max_workers=1))
+    yield worker
+    worker.close()
+
+
+class TestHintWorker:
+
+    def test_poll_returns_result(self, worker):
+        assert worker.poll() is None
+        worker.request(pow, 2, 10)
+        assert worker.pending
+        assert wait_for(worker) == 1024
+        assert not worker.pending
+
+    def test_cancelled_result_is_dropped(self, worker):
+        release = threading.Event()
+        worker.request(blocked, release, "stale")
+        future = worker.future
+        worker.cancel()
+        assert not worker.pending
+        release.set()
+        if not future.cancelled():
+            future.result()
+        time.sleep(0.01)
+        assert worker.poll() is None
+
+    def test_newer_request_wins(self, worker):
+        release = threading.Event()
+        worker.request(blocked, release, "stale")
+        worker.request(blocked, release, "fresh")
+        release.set()
+        assert wait_for(worker) == "fresh"
+        assert worker.poll() is None
+
+    def test_running_request_does_not_hold_up_the_next(self, worker):
+        release = threading.Event()
+        worker.request(blocked, release, "stale")
+        # wait until the single worker thread is busy with it
+        while not worker.future.running():
+            time.sleep(0.001)
+        worker.request(pow, 2, 10)
+        try:
+            assert wait_for(worker) == 1024
+        finally:
+            release.set()
+        assert worker.poll() is None
+
+    def test_error_is_raised_by_poll(self, worker):
+        worker.request(fail)
+        with pytest.raises(ValueError):
+            wait_for(worker)
+        assert not worker.pending
+
+    def test_executor_is_created_lazily(self):
+        created = []
+
+        def factory():
+            created.append(ThreadPoolExecutor(max_workers=1))
+            return created[-1]
+
+        worker = HintWorker(factory)
+        assert created == []
+        worker.request(pow, 2, 2)
+        assert wait_for(worker) == 4
+        worker.request(pow, 2, 3)
+        assert wait_for(worker) == 8
+        worker.close()
+        assert len(created) == 1
+
+
+class TestAnalyse:
+
+    ANSWERS = ["tango", "mango", "bongo", "bread", "crane", "drake"]
+
+    def test_uses_the_dictionary_words(self):
+        pytest.importorskip("numpy")
+        from wordle_patterns import PatternMatrix, build_matrix
+        from wordle_solver import rank_guesses
+
+        guesses = self.ANSWERS + ["slate"]
+        patterns = PatternMatrix(build_matrix(guesses, self.ANSWERS), guesses, self.ANSWERS)
+        expected = rank_guesses(top=3, patterns=patterns, candidates=[0, 1, 2])
+        dictionary = Dictionary.from_words(self.ANSWERS, ["slate"])
+        assert analyse(dictionary, [], [0, 1, 2], top=3) == {"remaining": 3, "ranking": expected}
+
+    def test_boards(self):
+        pytest.importorskip("numpy")
+        dictionary = Dictionary.from_words(self.ANSWERS)
+        result = analyse_boards(dictionary, [[0, 1], [3, 4, 5]], top=2)
+        assert result["remaining"] == 5
+        assert {guess for guess, _ in result["ranking"]} <= set(self.ANSWERS)
+
+    def test_dictionary_survives_pickling(self):
+        dictionary = Dictionary.from_words(self.ANSWERS, ["slate"])
+        copy = pickle.loads(pickle.dumps(dictionary))
+        assert (copy.answers, copy.guesses) == (dictionary.answers, dictionary.guesses)
+        # file-backed lists are read again on the other side, not sent
+        assert len(pickle.dumps(Dictionary())) < 200
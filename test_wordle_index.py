@@ -0,0 +1,65 @@
+"""
+Test for the bitset candidate index
+
+python -m pytest test_wordle_index.py -v
+
+Filtering with the index must give exactly the words that score() would keep.
+"""
+
+import random
+
+import pytest
+
+from wordle_index import WordIndex
+from wordle_score import score
+
+WORDS = ["tango", "mango", "bread", "crane", "drake", "flame", "grape", "house",
+         "speed", "abide", "geese", "elder", "eerie", "array", "ratty"]
+
+
+def brute_force(words, guess, code):
+    return [w for w in words if score(guess, w) == code]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return WordIndex(WORDS)
+
+
+class TestFilter:
+
+    def test_all_pairs(self, index):
+        """Every guess/answer pair of the small list, including repeated letters."""
+        for guess in WORDS:
+            for answer in WORDS:
+                code = score(guess, answer)
+                bits = index.filter(index.all, guess, code)
+                assert index.members(bits) == brute_force(WORDS, guess, code)
+
+    def test_full_word_list(self):
+        with open("wordle_ord.txt") as f:
+            words = [line.strip() for line in f]
+        index = WordIndex(words)
+        rng = random.Random(4)
+        for _ in range(200):
+            guess, answer = rng.choice(words), rng.choice(words)
+            code = score(guess, answer)
+            assert index.members(index.filter(index.all, guess, code)) == brute_force(words, guess, code)
+
+    def test_history(self, index):
+        history = [(g, score(g, "grape")) for g in ("crane", "flame")]
+        bits = index.filter_history(history)
+        assert "grape" in index.members(bits)
+        assert index.count(bits) == len(index.members(bits))
+
+
+class TestBits:
+
+    def test_indices_round_trip(self, index):
+        bits = index.bits_of([0, 3, 14])
+        assert index.indices(bits) == [0, 3, 14]
+        assert index.members(bits) == ["tango", "crane", "ratty"]
+
+    def test_empty(self, index):
+        assert index.indices(0) == []
+        assert index.count(index.all) == len(WORDS)
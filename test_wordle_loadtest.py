@@ -0,0 +1,75 @@
+"""
+Test for the load generator
+
+python -m pytest test_wordle_loadtest.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from wordle_dictionary import Dictionary
+from wordle_loadtest import percentile, run_load
+from wordle_server import GameServer
+
+
+class TestPercentile:
+
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+
+    def test_rounds_up(self):
+        values = list(range(1, 11))
+        # ceil(2.5) = 3, where round() would give 2
+        assert percentile(values, 25) == 3
+        assert percentile(values, 95) == 10
+        assert percentile(values, 0) == 1
+        assert percentile([7], 99) == 7
+
+    def test_empty(self):
+        assert percentile([], 50) is None
+
+
+class TestRunLoad:
+
+    def test_games_against_local_server(self):
+        async def main():
+            server = GameServer()
+            host, port = await server.start(port=0)
+            try:
+                return await run_load(host, port, clients=5, games=3)
+            finally:
+                await server.close()
+
+        report = asyncio.run(main())
+        assert report["games"] == 15
+        assert report["errors"] == 0
+        assert 15 <= report["guesses"] <= 90
+        assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"]
+
+    def test_aborted_games_are_not_counted(self):
+        async def main():
+            # none of the load generator's guesses are valid here
+            server = GameServer(Dictionary.from_words(["zzzzz"]))
+            host, port = await server.start(port=0)
+            try:
+                return await run_load(host, port, clients=2, games=2)
+            finally:
+                await server.close()
+
+        report = asyncio.run(main())
+        assert report["games"] == 0
+        assert report["aborted_games"] == 4
+        assert report["errors"] == 4
+
+    def test_connection_errors_are_counted(self):
+        report = asyncio.run(run_load("127.0.0.1", 1, clients=2, games=1))
+        assert report["errors"] == 2
+        assert report["games"] == 0
+
+    def test_needs_a_limit(self):
+        with pytest.raises(ValueError):
+            asyncio.run(run_load("127.0.0.1", 1))
@@ -0,0 +1,170 @@
+"""
+Test for the hot-path instrumentation
+
+python -m pytest test_wordle_metrics.py -v
+
+Disabled, timed() must return the function itself. Enabled, every call
+lands in exactly one bucket and the export is valid Prometheus text.
+"""
+
+import os
+import pstats
+import subprocess
+import sys
+
+import pytest
+
+import wordle_metrics
+from wordle_metrics import BUCKETS_NS, GameProfile, game_profile, render, timed
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(wordle_metrics, "ENABLED", True)
+    monkeypatch.setattr(wordle_metrics, "_histograms", {})
+    monkeypatch.setattr(wordle_metrics, "_counters", {})
+
+
+def samples(text):
+    """{metric{labels}: value} of the non-comment lines."""
+    lines = [line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#")]
+    return {name: float(value) for name, value in lines}
+
+
+class TestTimed:
+
+    def test_disabled_is_free(self, monkeypatch):
+        monkeypatch.setattr(wordle_metrics, "ENABLED", False)
+
+        def f():
+            pass
+        assert timed("stage")(f) is f
+
+    def test_calls_are_counted(self, enabled):
+        @timed("stage")
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        assert add.__name__ == "add"
+        add(3, 4)
+        values = samples(render())
+        assert values['wordle_stage_seconds_count{stage="stage"}'] == 2
+        assert values['wordle_stage_seconds_bucket{stage="stage",le="+Inf"}'] == 2
+        assert values['wordle_stage_seconds_sum{stage="stage"}'] > 0
+
+    def test_exceptions_are_timed(self, enabled):
+        @timed("stage")
+        def fail():
+            raise KeyError
+
+        with pytest.raises(KeyError):
+            fail()
+        assert samples(render())['wordle_stage_seconds_count{stage="stage"}'] == 1
+
+
+class TestExport:
+
+    def test_buckets_are_cumulative(self, enabled):
+        for ns in (500, 1_000, 1_001, 3 * 10 ** 9):
+            wordle_metrics.observe("stage", ns)
+        values = samples(render())
+        bucket = 'wordle_stage_seconds_bucket{{stage="stage",le="{}"}}'
+        assert values[bucket.format("1e-06")] == 2
+        assert values[bucket.format("2.5e-06")] == 3
+        assert values[bucket.format("2.5")] == 3
+        assert values[bucket.format("+Inf")] == 4
+        assert len(values) == len(BUCKETS_NS) + 3
+
+    def test_counters(self, enabled):
+        wordle_metrics.count("invalid_guess")
+        wordle_metrics.count("invalid_guess", 2)
+        text = render()
+        assert "# TYPE wordle_events_total counter" in text
+        assert samples(text)['wordle_events_total{event="invalid_guess"}'] == 3
+
+    def test_reset(self, enabled):
+        wordle_metrics.observe("stage", 10)
+        wordle_metrics.count("event")
+        wordle_metrics.reset()
+        values = samples(render())
+        assert values['wordle_stage_seconds_count{stage="stage"}'] == 0
+        assert 'wordle_events_total{event="event"}' not in values
+
+    def test_dump_to_file(self, enabled, tmp_path):
+        wordle_metrics.observe("stage", 10)
+        path = tmp_path / "wordle.prom"
+        wordle_metrics.dump(str(path))
+        assert path.read_text() == render()
+        assert os.listdir(tmp_path) == ["wordle.prom"]
+
+    def test_dump_to_stderr(self, enabled, capsys, monkeypatch):
+        monkeypatch.delenv(wordle_metrics.METRICS_FILE_ENV, raising=False)
+        wordle_metrics.count("event")
+        wordle_metrics.dump()
+        out, err = capsys.readouterr()
+        assert (out, err) == ("", render())
+
+    def test_dump_to_stdout(self, enabled, capsys, monkeypatch):
+        monkeypatch.setenv(wordle_metrics.METRICS_FILE_ENV, "-")
+        wordle_metrics.count("event")
+        wordle_metrics.dump()
+        out, err = capsys.readouterr()
+        assert (out, err) == (render(), "")
+
+    def test_exit_dump_keeps_stdout_clean(self):
+        # the --eval output must stay machine-readable with metrics on
+        env = dict(os.environ, WORDLE_METRICS="1")
+        env.pop(wordle_metrics.METRICS_FILE_ENV, None)
+        result = subprocess.run([sys.executable, "wordle_terminal.py", "--eval", "--format", "pattern"],
+                                input="tango,mango\n", env=env, capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(wordle_metrics.__file__)))
+        assert result.returncode == 0, result.stderr
+        assert result.stdout == "-GGGG\n"
+        assert "wordle_stage_seconds" in result.stderr
+
+    def test_written_at_exit(self, tmp_path):
+        path = tmp_path / "wordle.prom"
+        code = (
+            "from wordle_dictionary import Dictionary\n"
+            "from wordle_session import GameSession, InvalidGuess\n"
+            "session = GameSession(Dictionary.from_words(['tango', 'mango']), 0)\n"
+            "try:\n"
+            "    session.submit('bread')\n"
+            "except InvalidGuess:\n"
+            "    pass\n"
+            "session.submit('mango')\n"
+            "session.submit('tango')\n"
+        )
+        env = dict(os.environ, WORDLE_METRICS="1", WORDLE_METRICS_FILE=str(path))
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(wordle_metrics.__file__)))
+        assert result.returncode == 0, result.stderr
+        values = samples(path.read_text())
+        assert values['wordle_stage_seconds_count{stage="guess"}'] == 3
+        assert values['wordle_stage_seconds_count{stage="score"}'] == 2
+        assert values['wordle_stage_seconds_count{stage="filter"}'] == 2
+        assert values['wordle_events_total{event="invalid_guess"}'] == 1
+
+
+class TestProfile:
+
+    def test_one_game(self, tmp_path):
+        path = tmp_path / "game.prof"
+        profile = GameProfile(path)
+        profile.start()
+        sorted(range(1000))
+        profile.stop()
+        first = path.read_bytes()
+        # later games are not captured
+        profile.start()
+        assert not profile.running
+        profile.stop()
+        assert path.read_bytes() == first
+        assert pstats.Stats(str(path)).total_calls > 0
+
+    def test_from_environment(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(wordle_metrics.PROFILE_ENV, raising=False)
+        assert game_profile() is None
+        monkeypatch.setenv(wordle_metrics.PROFILE_ENV, str(tmp_path / "game.prof"))
+        assert game_profile().path == str(tmp_path / "game.prof")
@@ -0,0 +1,119 @@
+"""
+Test for the worst-case (minimax) solver
+
+python -m pytest test_wordle_minimax.py -v
+
+With width=None the search must give the same worst case as a plain
+recursive minimax over score().
+"""
+
+from functools import lru_cache
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from wordle_minimax import ENTRY_BYTES, FAIL, MinimaxSolver, TranspositionTable
+from wordle_patterns import PatternMatrix, build_matrix
+from wordle_score import ALL_CORRECT, score
+
+ANSWERS = ["tango", "mango", "bongo", "bread", "crane", "drake", "flame", "grape",
+           "house", "speed", "abide", "geese", "elder", "eerie", "array", "ratty"]
+GUESSES = ANSWERS + ["aahed", "slate", "pious", "dumpy"]
+
+
+@pytest.fixture(scope="module")
+def patterns():
+    return PatternMatrix(build_matrix(GUESSES, ANSWERS), GUESSES, ANSWERS)
+
+
+@lru_cache(maxsize=None)
+def brute_force(candidates):
+    if len(candidates) == 1:
+        return 1
+    best = FAIL
+    for guess in GUESSES:
+        buckets = {}
+        for answer in candidates:
+            buckets.setdefault(score(guess, answer), []).append(answer)
+        if len(buckets) == 1 and ALL_CORRECT not in buckets:
+            continue
+        worst = max((brute_force(tuple(b)) for code, b in buckets.items() if code != ALL_CORRECT), default=0)
+        best = min(best, 1 + worst)
+    return best
+
+
+def play(solver, answer, max_depth=6):
+    """Follow the solver's guesses against answer, return the number of guesses."""
+    candidates = np.arange(len(ANSWERS))
+    for turn in range(1, max_depth + 1):
+        _, guess = solver.solve(candidates, max_depth)
+        code = score(GUESSES[guess], answer)
+        if code == ALL_CORRECT:
+            return turn
+        row = np.asarray(solver.patterns.matrix[guess, candidates])
+        candidates = candidates[row == code]
+    return None
+
+
+class TestSolve:
+
+    def test_exact_matches_brute_force(self, patterns):
+        solver = MinimaxSolver(patterns, width=None)
+        cost, guess = solver.solve()
+        assert cost == brute_force(tuple(ANSWERS))
+
+    def test_subsets(self, patterns):
+        solver = MinimaxSolver(patterns, width=None)
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            subset = rng.choice(len(ANSWERS), size=rng.integers(1, len(ANSWERS)), replace=False)
+            cost, _ = solver.solve(subset)
+            assert cost == brute_force(tuple(ANSWERS[i] for i in sorted(subset)))
+
+    def test_strategy_keeps_its_bound(self, patterns):
+        solver = MinimaxSolver(patterns, width=None)
+        cost, _ = solver.solve()
+        assert all(play(solver, answer) <= cost for answer in ANSWERS)
+
+    def test_width_gives_upper_bound(self, patterns):
+        exact, _ = MinimaxSolver(patterns, width=None).solve()
+        bounded, _ = MinimaxSolver(patterns, width=2).solve()
+        assert exact <= bounded < FAIL
+
+    def test_depth_limit(self, patterns):
+        solver = MinimaxSolver(patterns, width=None)
+        cost, _ = solver.solve()
+        assert solver.solve(max_depth=cost - 1) == (FAIL, None)
+
+
+class TestStats:
+
+    def test_counters(self, patterns):
+        solver = MinimaxSolver(patterns, width=None)
+        cost, _ = solver.solve()
+        summary = solver.stats.summary(solver.table)
+        assert summary["nodes"] == sum(summary["depth_nodes"].values())
+        assert set(summary["depth_seconds"]) == set(range(1, cost + 1))
+        assert summary["table_entries"] > 0
+
+    def test_table_reused(self, patterns):
+        solver = MinimaxSolver(patterns, width=None)
+        solver.solve()
+        hits = solver.table.hits
+        solver.solve()
+        assert solver.table.hits > hits
+
+
+class TestTranspositionTable:
+
+    def test_lru_eviction(self):
+        table = TranspositionTable(max_bytes=3 * ENTRY_BYTES)
+        for key in "abc":
+            table.put(key, (1, True, 0))
+        table.get("a")
+        table.put("d", (1, True, 0))
+        assert table.get("b") is None
+        assert table.get("a") is not None
+        assert table.evictions == 1
+        assert len(table) == 3
@@ -0,0 +1,105 @@
+"""
+Test for multi-board games
+
+python -m pytest test_wordle_multiboard.py -v
+
+The batched feedback of every board must equal score() against that
+board's answer, and solved boards must drop out of later guesses.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from wordle_dictionary import Dictionary
+from wordle_multiboard import MultiBoardSession
+from wordle_patterns import PatternMatrix, build_matrix
+from wordle_score import ALL_CORRECT, score
+from wordle_session import IN_PROGRESS, LOST, WON, InvalidGuess
+from wordle_solver import entropies, rank_boards
+
+WORDS = ["tango", "mango", "bongo", "bread", "crane", "drake", "flame", "grape",
+         "house", "speed", "abide", "geese", "elder", "eerie", "array", "ratty"]
+
+
+@pytest.fixture
+def dictionary():
+    return Dictionary.from_words(WORDS, ["aahed", "slate"])
+
+
+@pytest.fixture(scope="module")
+def patterns():
+    guesses = WORDS + ["aahed", "slate"]
+    return PatternMatrix(build_matrix(guesses, WORDS), guesses, WORDS)
+
+
+def session_for(dictionary, *answers):
+    return MultiBoardSession(dictionary, answers=[dictionary.answer_index[w] for w in answers])
+
+
+class TestSubmit:
+
+    def test_codes_match_score(self, dictionary):
+        session = session_for(dictionary, "tango", "bread", "house", "eerie")
+        codes, status = session.submit("crane")
+        assert codes == tuple(score("crane", w) for w in session.answer_words)
+        assert status == IN_PROGRESS
+
+    def test_solved_board_drops_out(self, dictionary):
+        session = session_for(dictionary, "tango", "bread")
+        codes, _ = session.submit("tango")
+        assert codes[0] == ALL_CORRECT
+        assert session.active_boards() == [1]
+        codes, status = session.submit("crane")
+        assert codes == (None, score("crane", "bread"))
+        assert session.board_history(0) == [("tango", ALL_CORRECT)]
+        assert session.submit("bread")[1] == WON
+
+    def test_loss(self, dictionary):
+        session = session_for(dictionary, "tango", "bread")
+        assert session.max_attempts == 7
+        for word in ["crane", "drake", "flame", "grape", "house", "speed"]:
+            assert session.submit(word)[1] == IN_PROGRESS
+        assert session.submit("aahed")[1] == LOST
+        with pytest.raises(InvalidGuess):
+            session.submit("tango")
+
+    def test_invalid_word_is_not_an_attempt(self, dictionary):
+        session = session_for(dictionary, "tango", "bread")
+        with pytest.raises(InvalidGuess):
+            session.submit("kalak")
+        assert session.attempts == 0
+
+    def test_candidates_per_board(self, dictionary):
+        session = session_for(dictionary, "tango", "bread", "house", "eerie")
+        session.submit("crane")
+        for b, answer in enumerate(session.answer_words):
+            code = score("crane", answer)
+            assert session.possible_answers(b) == [w for w in WORDS if score("crane", w) == code]
+        assert session.remaining == sum(session.remaining_by_board())
+
+    def test_random_answers_are_distinct(self, dictionary):
+        session = MultiBoardSession(dictionary, 16)
+        assert sorted(session.answers) == list(range(16))
+
+    def test_compact(self, dictionary):
+        session = session_for(dictionary, "tango", "bread", "house", "eerie")
+        assert not hasattr(session, "__dict__")
+        session.submit("crane")
+        assert len(session.codes) == 4
+
+
+class TestRankBoards:
+
+    def test_sum_of_entropies(self, patterns):
+        sets = [np.array([0, 1, 2]), np.array([3, 4, 5, 6]), np.array([0, 1, 2])]
+        expected = sum(entropies(patterns.matrix, s) for s in sets)
+        ranking = rank_boards(sets, top=None, patterns=patterns)
+        assert len(ranking) == len(patterns.guesses)
+        for guess, bits in ranking:
+            assert bits == pytest.approx(expected[patterns.guess_index[guess]])
+        assert [b for _, b in ranking] == sorted((b for _, b in ranking), reverse=True)
+
+    def test_no_candidates(self, patterns):
+        with pytest.raises(ValueError):
+            rank_boards([np.array([0]), np.array([], dtype=int)], patterns=patterns)
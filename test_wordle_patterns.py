@@ -0,0 +1,76 @@
+"""
+Test for the precomputed pattern matrix and its cache
+
+python -m pytest test_wordle_patterns.py -v
+
+Small word lists and a temporary cache directory keep these tests fast.
+"""
+
+import random
+
+import numpy as np
+
+import wordle_patterns
+from wordle_dictionary import get_dictionary
+from wordle_patterns import encode_words, load, score_batch
+from wordle_score import score
+
+ANSWERS = ("tango", "mango", "bread", "crane")
+GUESSES = ANSWERS + ("speed", "geese")
+
+
+class TestScoreBatch:
+
+    def test_encode_words(self):
+        assert encode_words(["abcde", "zzzzz"]).tolist() == [[0, 1, 2, 3, 4], [25] * 5]
+
+    def test_repeated_letters(self):
+        words = ["speed", "abide", "geese", "elder", "eerie", "array", "ratty", "llama", "allay"]
+        codes = score_batch(encode_words(words), encode_words(words), chunk_size=4)
+        for g, guess in enumerate(words):
+            for a, answer in enumerate(words):
+                assert codes[g, a] == score(guess, answer)
+
+    def test_matches_score(self):
+        dictionary = get_dictionary()
+        rng = random.Random(11)
+        guesses = rng.sample(dictionary.guesses, 300)
+        answers = rng.sample(dictionary.answers, 300)
+        codes = score_batch(encode_words(guesses), encode_words(answers))
+        assert codes.dtype == np.uint8
+        expected = [[score(g, a) for a in answers] for g in guesses]
+        assert codes.tolist() == expected
+
+
+class TestCache:
+
+    def test_matrix_matches_score(self, tmp_path):
+        patterns = load(ANSWERS, GUESSES, cache_dir=tmp_path)
+        assert patterns.matrix.shape == (len(GUESSES), len(ANSWERS))
+        for guess in GUESSES:
+            for answer in ANSWERS:
+                assert patterns.pattern(guess, answer) == score(guess, answer)
+
+    def test_loaded_with_mmap(self, tmp_path):
+        load(ANSWERS, GUESSES, cache_dir=tmp_path)
+        patterns = load(ANSWERS, GUESSES, cache_dir=tmp_path)
+        assert isinstance(patterns.matrix, np.memmap)
+
+    def test_cache_is_reused(self, tmp_path, monkeypatch):
+        load(ANSWERS, GUESSES, cache_dir=tmp_path)
+
+        def fail(*args):
+            raise AssertionError("matrix was rebuilt")
+
+        monkeypatch.setattr(wordle_patterns, "build_matrix", fail)
+        load(ANSWERS, GUESSES, cache_dir=tmp_path)
+
+    def test_changed_word_list_invalidates_cache(self, tmp_path):
+        first = load(ANSWERS, GUESSES, cache_dir=tmp_path)
+        second = load(ANSWERS, GUESSES + ("house",), cache_dir=tmp_path)
+        assert second.matrix.shape == (len(GUESSES) + 1, len(ANSWERS))
+        assert [p.name for p in tmp_path.glob("*.npy")] == [
+            wordle_patterns.cache_path(ANSWERS, GUESSES + ("house",), tmp_path).name
+        ]
+        # a process still mapping the stale file keeps reading it after the unlink
+        assert first.pattern("crane", "tango") == score("crane", "tango")
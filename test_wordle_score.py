@@ -0,0 +1,94 @@
+"""
+Test for the shared scoring core
+
+python -m pytest test_wordle_score.py -v
+
+Test Classes:
+    - TestScore: Tests feedback codes for guess/answer pairs
+    - TestStates: Tests decoding, encoding and rendering of codes
+"""
+
+import random
+
+import pytest
+
+from wordle_score import (
+    ALL_CORRECT,
+    CORRECT,
+    HALF_CORRECT,
+    INCORRECT,
+    NUM_PATTERNS,
+    encode,
+    pattern_string,
+    render,
+    score,
+    states,
+)
+
+
+def reference_states(guess, answer):
+    """The original two-pass list algorithm, kept as a reference."""
+    output = [None] * len(guess)
+    remaining_letters = list(answer)
+    for i, letter in enumerate(guess):
+        if letter == remaining_letters[i]:
+            output[i] = CORRECT
+            remaining_letters[i] = None
+    for i, letter in enumerate(guess):
+        if output[i] is not None:
+            continue
+        if letter in remaining_letters:
+            output[i] = HALF_CORRECT
+            remaining_letters[remaining_letters.index(letter)] = None
+        else:
+            output[i] = INCORRECT
+    return tuple(output)
+
+
+class TestScore:
+    """
+    score() returns one base-3 digit per letter, first letter lowest.
+    """
+
+    def test_all_correct(self):
+        assert score("tango", "tango") == ALL_CORRECT
+
+    def test_all_wrong(self):
+        assert score("qwerk", "tango") == 0
+
+    def test_all_wrong_position(self):
+        assert states(score("notag", "tango")) == (HALF_CORRECT,) * 5
+
+    @pytest.mark.parametrize("guess, answer, expected", [
+        ("speed", "abide", (0, 0, 1, 0, 1)),   # only one 'e' in the answer
+        ("geese", "elder", (0, 1, 1, 0, 0)),   # two yellows, the third 'e' is gray
+        ("array", "ratty", (1, 1, 0, 0, 2)),   # green 'y', one yellow 'r'
+        ("eerie", "gecko", (0, 2, 0, 0, 0)),   # green consumes the only 'e'
+    ])
+    def test_repeated_letters(self, guess, answer, expected):
+        """Repeated letters are marked at most as often as they occur in the answer."""
+        assert states(score(guess, answer)) == expected
+
+    def test_matches_reference(self):
+        """Random pairs from the word list agree with the original algorithm."""
+        with open("wordle_ord.txt") as f:
+            words = [line.strip() for line in f]
+        rng = random.Random(1)
+        for _ in range(5000):
+            guess, answer = rng.choice(words), rng.choice(words)
+            assert states(score(guess, answer)) == reference_states(guess, answer)
+
+
+class TestStates:
+
+    def test_round_trip(self):
+        for code in range(NUM_PATTERNS):
+            assert encode(states(code)) == code
+
+    def test_render(self):
+        styles = ("-{}".format, "?{}".format, "+{}".format)
+        assert render("mango", score("mango", "tango"), styles) == "-m+a+n+g+o"
+
+    def test_pattern_string(self):
+        assert pattern_string(score("speed", "abide")) == "--Y-Y"
+        assert pattern_string(ALL_CORRECT) == "GGGGG"
@@ -0,0 +1,270 @@
+"""
+Test for the asyncio game server
+
+python -m pytest test_wordle_server.py -v
+
+Each test starts a server on a free localhost port inside asyncio.run().
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from wordle_dictionary import Dictionary
+from wordle_server import STATS_PROFILE, GameServer, hint_result, hint_snapshot
+from wordle_session import GameSession
+from wordle_stats import StatsStore
+
+WORDS = ["tango", "mango", "bread", "crane", "drake", "flame", "grape", "house"]
+
+
+def run(coro_factory, **server_kwargs):
+    """Start a server, run coro_factory(server, host, port), shut down."""
+    async def main():
+        server = GameServer(Dictionary.from_words(WORDS), **server_kwargs)
+        host, port = await server.start(port=0, http_port=0)
+        try:
+            return await coro_factory(server, host, port)
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+
+async def talk(reader, writer, line):
+    writer.write(line.encode() + b"\n")
+    await writer.drain()
+    return (await reader.readline()).decode().strip()
+
+
+class TestLineProtocol:
+
+    def test_game(self):
+        async def client(server, host, port):
+            reader, writer = await asyncio.open_connection(host, port)
+            replies = [await talk(reader, writer, "NEW")]
+            # guess word after word until the game is over
+            for word in WORDS:
+                reply = await talk(reader, writer, f"GUESS {word}")
+                replies.append(reply)
+                if "IN_PROGRESS" not in reply:
+                    break
+            replies.append(await talk(reader, writer, "QUIT"))
+            writer.close()
+            return replies
+
+        replies = run(client)
+        assert replies[0] == "OK NEW 6"
+        assert replies[-1] == "BYE"
+        assert replies[-2].split()[3] in ("WON", "LOST")
+
+    def test_errors(self):
+        async def client(server, host, port):
+            reader, writer = await asyncio.open_connection(host, port)
+            replies = [
+                await talk(reader, writer, "GUESS tango"),
+                await talk(reader, writer, "NEW"),
+                await talk(reader, writer, "GUESS kalak"),
+                await talk(reader, writer, "DANCE"),
+            ]
+            writer.close()
+            return replies
+
+        first, _, invalid, unknown = run(client)
+        assert first == "ERR send NEW first"
+        assert invalid.startswith("ERR") and "kalak" in invalid
+        assert unknown.startswith("ERR unknown command")
+
+    def test_many_sessions(self):
+        async def client(server, host, port):
+            async def one():
+                reader, writer = await asyncio.open_connection(host, port)
+                await talk(reader, writer, "NEW")
+                reply = await talk(reader, writer, "GUESS crane")
+                writer.close()
+                return reply
+            return await asyncio.gather(*(one() for _ in range(200)))
+
+        assert all(r.startswith("OK ") for r in run(client))
+
+    def test_idle_timeout(self):
+        async def client(server, host, port):
+            reader, writer = await asyncio.open_connection(host, port)
+            line = await reader.readline()
+            closed = await reader.read() == b""
+            writer.close()
+            return line, closed
+
+        line, closed = run(client, idle_timeout=0.1)
+        assert line == b"ERR idle timeout\n"
+        assert closed
+
+    def test_line_too_long(self):
+        async def client(server, host, port):
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"GUESS " + b"a" * 10000 + b"\n")
+            await writer.drain()
+            line = await reader.readline()
+            writer.close()
+            return line
+
+        assert run(client) == b"ERR line too long\n"
+
+    def test_hard_mode(self):
+        async def client(server, host, port):
+            reader, writer = await asyncio.open_connection(host, port)
+            await talk(reader, writer, "NEW HARD")
+            first = await talk(reader, writer, "GUESS house")
+            second = await talk(reader, writer, "GUESS house")
+            mode = await talk(reader, writer, "NEW EASY")
+            writer.close()
+            return first, second, mode
+
+        first, second, mode = run(client)
+        assert first.startswith("OK ")
+        # whatever the feedback, repeating a guess ignores it (or the game is over)
+        assert second.startswith("ERR")
+        assert mode.startswith("ERR unknown mode")
+
+    def test_stats(self, tmp_path):
+        async def client(server, host, port):
+            reader, writer = await asyncio.open_connection(host, port)
+            await talk(reader, writer, "NEW")
+            for word in WORDS:
+                if "IN_PROGRESS" not in await talk(reader, writer, f"GUESS {word}"):
+                    break
+            await talk(reader, writer, "NEW")
+            reply = await talk(reader, writer, "GUESS house")
+            writer.close()
+            return reply
+
+        with StatsStore(tmp_path / "stats.sqlite3") as stats:
+            reply = run(client, stats=stats)
+            stats.flush()
+            # the second game counts only if house happened to be the answer
+            assert stats.summary(STATS_PROFILE)["played"] == 1 + ("IN_PROGRESS" not in reply)
+            assert stats.summary()["played"] == 0
+
+    @patch("random.randrange", return_value=0)
+    def test_hint(self, mock_randrange):
+        pytest.importorskip("numpy")
+
+        async def client(server, host, port):
+            reader, writer = await asyncio.open_connection(host, port)
+            await talk(reader, writer, "NEW")
+            replies = [await talk(reader, writer, "GUESS crane"), await talk(reader, writer, "HINT")]
+            for word in WORDS:
+                if "IN_PROGRESS" not in await talk(reader, writer, f"GUESS {word}"):
+                    break
+            replies.append(await talk(reader, writer, "HINT"))
+            writer.close()
+            return replies
+
+        guess, hint, over = run(client)
+        # the answer is tango
+        assert "IN_PROGRESS" in guess
+        ok, kind, remaining, *guesses = hint.split()
+        assert (ok, kind, remaining) == ("OK", "HINT", "2")
+        # ranked over the server's own word list, not the default one
+        assert guesses and set(guesses) <= set(WORDS)
+        assert over == "ERR the game is over"
+
+
+
+class TestHintSnapshot:
+
+    def test_later_guess_is_not_seen(self):
+        pytest.importorskip("numpy")
+        dictionary = Dictionary.from_words(WORDS)
+        session = GameSession(dictionary, dictionary.answer_index["tango"])
+        snapshot = hint_snapshot(session)
+        # a guess handled on the loop while the hint is still running
+        session.submit("mango")
+        result = hint_result(*snapshot)
+        assert result["remaining"] == len(WORDS)
+        assert set(result["guesses"]) <= set(WORDS)
+
+    def test_hard_mode_matches_session(self):
+        pytest.importorskip("numpy")
+        dictionary = Dictionary.from_words(WORDS)
+        session = GameSession(dictionary, dictionary.answer_index["tango"], hard_mode=True)
+        session.submit("mango")
+        legal = {dictionary.guesses[i] for i in session.legal_guess_indices()}
+        result = hint_result(*hint_snapshot(session))
+        assert set(result["guesses"]) <= legal
+        assert result["remaining"] == session.remaining
+
+
+async def http(host, port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(body)}\r\n"
+        f"Connection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, data = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(data)
+
+
+class TestHttp:
+
+    def test_new_and_guess(self):
+        async def client(server, host, port):
+            host, port = server.http_address()
+            _, new = await http(host, port, "POST", "/new")
+            status, guess = await http(host, port, "POST", "/guess", {"session": new["session"], "word": "crane"})
+            return new, status, guess
+
+        new, status, guess = run(client)
+        assert new["attempts"] == 6
+        assert status == 200
+        assert len(guess["pattern"]) == 5
+        assert guess["attempts_left"] == 5 or guess["status"] == "WON"
+
+    def test_unknown_session(self):
+        async def client(server, host, port):
+            host, port = server.http_address()
+            return await http(host, port, "POST", "/guess", {"session": "nope", "word": "crane"})
+
+        status, payload = run(client)
+        assert status == 400
+        assert "session" in payload["error"]
+
+    def test_bad_json_values(self):
+        async def client(server, host, port):
+            host, port = server.http_address()
+            return [
+                await http(host, port, "POST", "/guess", {"session": [1], "word": "crane"}),
+                await http(host, port, "POST", "/guess", {"session": "nope", "word": 12345}),
+                await http(host, port, "POST", "/new", {"hard": "false"}),
+            ]
+
+        for status, payload in run(client):
+            assert status == 400
+            assert "error" in payload
+
+    def test_not_found(self):
+        async def client(server, host, port):
+            host, port = server.http_address()
+            return await http(host, port, "GET", "/nothing")
+
+        assert run(client)[0] == 404
+
+    def test_metrics(self):
+        async def client(server, host, port):
+            host, port = server.http_address()
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"GET /metrics HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+
+        head, _, body = run(client).partition(b"\r\n\r\n")
+        assert head.startswith(b"HTTP/1.1 200")
+        assert b"Content-Type: text/plain" in head
+        # Prometheus text, empty unless WORDLE_METRICS is set
+        assert all(line.startswith(b"wordle_") or line.startswith(b"#") for line in body.splitlines())
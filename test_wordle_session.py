@@ -0,0 +1,121 @@
+"""
+Test for the game session state machine
+
+python -m pytest test_wordle_session.py -v
+"""
+
+import random
+import sys
+
+import pytest
+
+from wordle_dictionary import Dictionary, get_dictionary
+from wordle_score import ALL_CORRECT, score
+from wordle_session import IN_PROGRESS, LOST, WON, GameSession, HardModeViolation, InvalidGuess
+
+
+@pytest.fixture
+def dictionary():
+    return Dictionary.from_words(
+        ["tango", "mango", "bread", "crane", "drake", "flame", "grape", "house"], ["aahed"])
+
+
+class TestSubmit:
+
+    def test_win(self, dictionary):
+        session = GameSession(dictionary, dictionary.answer_index["tango"])
+        assert session.submit("mango") == (score("mango", "tango"), IN_PROGRESS)
+        assert session.submit("tango") == (ALL_CORRECT, WON)
+        assert session.attempts == 2
+
+    def test_loss(self, dictionary):
+        session = GameSession(dictionary, dictionary.answer_index["tango"])
+        for word in ["bread", "crane", "drake", "flame", "grape"]:
+            assert session.submit(word)[1] == IN_PROGRESS
+        assert session.submit("aahed")[1] == LOST
+        assert session.attempts_left == 0
+
+    def test_invalid_word_is_not_an_attempt(self, dictionary):
+        session = GameSession(dictionary, 0)
+        with pytest.raises(InvalidGuess):
+            session.submit("kalak")
+        assert session.attempts == 0
+        assert session.status == IN_PROGRESS
+
+    def test_no_guesses_after_game_over(self, dictionary):
+        session = GameSession(dictionary, dictionary.answer_index["tango"])
+        session.submit("tango")
+        with pytest.raises(InvalidGuess):
+            session.submit("mango")
+
+    def test_history(self, dictionary):
+        session = GameSession(dictionary, dictionary.answer_index["grape"])
+        session.submit("aahed")
+        session.submit("crane")
+        assert session.history() == [("aahed", score("aahed", "grape")), ("crane", score("crane", "grape"))]
+
+
+class TestCandidates:
+
+    def test_narrowed_after_each_guess(self, dictionary):
+        session = GameSession(dictionary, dictionary.answer_index["grape"])
+        assert session.remaining == 8
+        code, _ = session.submit("crane")
+        expected = [w for w in dictionary.answers if score("crane", w) == code]
+        assert session.possible_answers() == expected
+        assert session.remaining == len(expected)
+        assert [dictionary.answers[i] for i in session.candidate_indices()] == expected
+
+    def test_answer_always_possible(self, dictionary):
+        session = GameSession(dictionary, dictionary.answer_index["house"])
+        for word in ["aahed", "bread", "flame"]:
+            session.submit(word)
+            assert "house" in session.possible_answers()
+
+
+class TestHardMode:
+
+    def test_violation_is_not_an_attempt(self, dictionary):
+        session = GameSession(dictionary, dictionary.answer_index["tango"], hard_mode=True)
+        session.submit("mango")
+        with pytest.raises(HardModeViolation, match="2nd letter must be A"):
+            session.submit("bread")
+        assert session.attempts == 1
+        assert session.submit("tango")[1] == WON
+
+    def test_easy_mode_allows_anything(self, dictionary):
+        session = GameSession(dictionary, dictionary.answer_index["tango"])
+        session.submit("mango")
+        assert session.submit("bread")[1] == IN_PROGRESS
+        assert session.legal_guess_indices() == range(len(dictionary.guesses))
+
+    def test_legal_guesses(self, dictionary):
+        session = GameSession(dictionary, dictionary.answer_index["tango"], hard_mode=True)
+        session.submit("mango")
+        legal = [dictionary.guesses[i] for i in session.legal_guess_indices()]
+        # M was gray, so only tango is left
+        assert legal == ["tango"]
+
+
+class TestCompact:
+
+    def test_slots(self, dictionary):
+        session = GameSession(dictionary, rng=random.Random(0))
+        assert not hasattr(session, "__dict__")
+        assert 0 <= session.answer < len(dictionary.answers)
+
+    def test_size(self):
+        """A session with a few guesses on the full word list stays small."""
+        dictionary = get_dictionary()
+        session = GameSession(dictionary, dictionary.answer_index["grape"])
+        for word in ["crane", "slate"]:
+            session.submit(word)
+        size = sum(sys.getsizeof(getattr(session, name)) for name in ("guesses", "codes", "candidates"))
+        assert sys.getsizeof(session) + size < 600
+
+    def test_many_sessions(self, dictionary):
+        """Independent sessions in one process."""
+        sessions = [GameSession(dictionary, i % 8) for i in range(10000)]
+        for session in sessions[:8]:
+            session.submit(session.answer_word)
+        assert sum(s.status == WON for s in sessions) == 8
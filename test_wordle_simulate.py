@@ -0,0 +1,87 @@
+"""
+Test for the headless game simulator
+
+python -m pytest test_wordle_simulate.py -v
+"""
+
+import random
+
+import pytest
+
+from wordle_dictionary import get_dictionary
+from wordle_score import ALL_CORRECT
+from wordle_session import LOST, WON, GameSession
+from wordle_simulate import FirstCandidate, get_strategy, play_game, simulate
+
+
+class AlwaysCrane:
+    """Plug-in strategy used through "module:Class"."""
+
+    def __init__(self, dictionary):
+        pass
+
+    def new_game(self, rng):
+        pass
+
+    def guess(self, history):
+        return "crane"
+
+
+class TestPlayGame:
+
+    def test_candidate_strategy_solves(self):
+        dictionary = get_dictionary()
+        session = GameSession(dictionary, dictionary.answer_index["grape"])
+        history = play_game(FirstCandidate(dictionary), session, random.Random(0))
+        assert history[-1] == ("grape", ALL_CORRECT)
+        assert session.status == WON
+        assert history == session.history()
+
+    def test_failure_stops_at_max_attempts(self):
+        dictionary = get_dictionary()
+        session = GameSession(dictionary, dictionary.answer_index["grape"])
+        history = play_game(AlwaysCrane(None), session, random.Random(0))
+        assert len(history) == 6
+        assert session.status == LOST
+
+
+class TestSimulate:
+
+    def test_distribution(self):
+        result = simulate(["first", "random"], seeds=[0, 1], answers=range(20), workers=1, chunk_size=7)
+        summary = result.summary()
+        assert summary["first"]["games"] == summary["random"]["games"] == 40
+        counts = result.distribution["random"]
+        assert sum(counts.values()) == 40
+
+    def test_pool_matches_single_process(self):
+        args = (["random"], [3], range(30))
+        single = simulate(*args, workers=1, chunk_size=30)
+        pooled = simulate(*args, workers=2, chunk_size=8)
+        assert single.distribution == pooled.distribution
+
+    def test_traces(self):
+        result = simulate(["first"], answers=range(5), workers=1, keep_traces=True)
+        assert len(result.traces) == 5
+        answers = get_dictionary().answers
+        assert [t["answer"] for t in result.traces] == list(answers[:5])
+
+    def test_plugin_strategy(self):
+        assert get_strategy("test_wordle_simulate:AlwaysCrane").__name__ == "AlwaysCrane"
+        result = simulate(["test_wordle_simulate:AlwaysCrane"], answers=range(3), workers=1)
+        assert result.summary()["test_wordle_simulate:AlwaysCrane"]["games"] == 3
+
+    def test_stats(self, tmp_path):
+        from wordle_stats import StatsStore
+
+        with StatsStore(tmp_path / "stats.sqlite3") as stats:
+            result = simulate(["first", "random"], answers=range(12), workers=1, chunk_size=5, stats=stats)
+            stats.flush()
+            for name in ("first", "random"):
+                summary = stats.summary(f"sim-{name}")
+                assert summary["played"] == 12
+                assert summary["distribution"] == {n: c for n, c in result.distribution[name].items() if n}
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            get_strategy("nope")
@@ -0,0 +1,62 @@
+"""
+Test for the entropy solver
+
+python -m pytest test_wordle_solver.py -v
+
+Uses a small word list with its pattern matrix in a temporary directory.
+"""
+
+import math
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from wordle_patterns import load
+from wordle_score import score
+from wordle_solver import candidates, entropies, rank_guesses
+
+ANSWERS = ("tango", "mango", "bread", "crane", "drake", "flame", "grape", "house")
+GUESSES = ANSWERS + ("mbaah", "qwerk")
+
+
+@pytest.fixture
+def patterns(tmp_path):
+    return load(ANSWERS, GUESSES, cache_dir=tmp_path)
+
+
+def expected_bits(guess, answers):
+    buckets = Counter(score(guess, answer) for answer in answers)
+    n = len(answers)
+    return -sum(c / n * math.log2(c / n) for c in buckets.values())
+
+
+class TestEntropies:
+
+    def test_matches_direct_computation(self, patterns):
+        bits = entropies(patterns.matrix, np.arange(len(ANSWERS)))
+        for i, guess in enumerate(GUESSES):
+            assert bits[i] == pytest.approx(expected_bits(guess, ANSWERS))
+
+
+class TestRankGuesses:
+
+    def test_candidates_follow_feedback(self, patterns):
+        history = [("crane", score("crane", "grape"))]
+        remaining = [ANSWERS[i] for i in candidates(patterns, history)]
+        assert remaining == [w for w in ANSWERS if score("crane", w) == history[0][1]]
+        assert "grape" in remaining
+
+    def test_best_first(self, patterns):
+        ranking = rank_guesses(top=None, patterns=patterns)
+        bits = [b for _, b in ranking]
+        assert bits == sorted(bits, reverse=True)
+        assert len(ranking) == len(GUESSES)
+
+    def test_single_candidate_is_suggested(self, patterns):
+        history = [("tango", score("tango", "house")), ("bread", score("bread", "house"))]
+        assert rank_guesses(history, top=1, patterns=patterns)[0][0] == "house"
+
+    def test_inconsistent_history(self, patterns):
+        with pytest.raises(ValueError):
+            rank_guesses([("tango", 0), ("mango", 0)], patterns=patterns)
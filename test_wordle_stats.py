@@ -0,0 +1,158 @@
+"""
+Test for the statistics store
+
+python -m pytest test_wordle_stats.py -v
+
+The running totals must match what the games table says, whatever way the
+games were batched or however many stores wrote to the file.
+"""
+
+import random
+import sqlite3
+
+import pytest
+
+from wordle_dictionary import Dictionary
+from wordle_session import GameSession
+from wordle_stats import StatsStore, session_mode, summary_lines
+
+WORDS = ["tango", "mango", "bongo", "bread", "crane", "drake", "flame", "grape"]
+
+
+def expected_summary(results):
+    """Totals computed the slow way from (won, guesses) in order."""
+    streak = best = 0
+    distribution = {}
+    for won, guesses in results:
+        streak = streak + 1 if won else 0
+        best = max(best, streak)
+        if won:
+            distribution[guesses] = distribution.get(guesses, 0) + 1
+    played, won = len(results), sum(won for won, _ in results)
+    return {"played": played, "won": won, "win_rate": won / played if played else 0.0,
+            "current_streak": streak, "max_streak": best, "distribution": distribution}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StatsStore(tmp_path / "stats.sqlite3")
+    yield store
+    store.close()
+
+
+class TestStore:
+
+    def test_empty(self, store):
+        assert store.summary() == expected_summary([])
+
+    def test_totals_match_games(self, store):
+        rng = random.Random(3)
+        results = [(rng.random() < 0.7, rng.randint(1, 6)) for _ in range(500)]
+        for won, guesses in results:
+            store.record(won, guesses, "tango")
+        store.flush()
+        assert store.pending == 0
+        assert store.summary() == expected_summary(results)
+        assert store.written == 500
+
+    def test_profiles_are_separate(self, store):
+        store.record(True, 3, "tango", profile="a")
+        store.record(False, 6, "mango", profile="b")
+        store.record(True, 2, "bread", profile="a")
+        store.flush()
+        assert store.summary("a")["current_streak"] == 2
+        assert store.summary("b") == expected_summary([(False, 6)])
+
+    def test_modes_are_separate(self, store):
+        store.record(True, 3, "tango")
+        store.record(True, 9, "mango bread", mode="boards2")
+        store.record(False, 6, "crane", mode="absurdle")
+        store.record(True, 4, "drake")
+        store.flush()
+        assert store.summary() == expected_summary([(True, 3), (True, 4)])
+        assert store.summary(mode="boards2") == expected_summary([(True, 9)])
+        # a lost absurdle game does not break the normal streak
+        assert store.summary(mode="absurdle")["current_streak"] == 0
+
+    def test_batched_commits(self, tmp_path):
+        # hold the write lock so games pile up behind the first commit
+        path = tmp_path / "stats.sqlite3"
+        store = StatsStore(path, batch_size=100)
+        blocker = sqlite3.connect(path, isolation_level=None)
+        blocker.execute("BEGIN IMMEDIATE")
+        for _ in range(1000):
+            store.record(True, 4, "tango")
+        blocker.execute("COMMIT")
+        blocker.close()
+        store.flush()
+        assert store.written == 1000
+        assert store.commits < 1000
+        store.close()
+
+    def test_summary_reads_totals_only(self, store, tmp_path):
+        for _ in range(3):
+            store.record(True, 4, "tango")
+        store.flush()
+        with sqlite3.connect(tmp_path / "stats.sqlite3") as conn:
+            conn.execute("DELETE FROM games")
+        assert store.summary()["played"] == 3
+
+    def test_shared_file(self, tmp_path):
+        path = tmp_path / "stats.sqlite3"
+        results = [(True, 3), (False, 6), (True, 2), (True, 5)]
+        with StatsStore(path) as first, StatsStore(path) as second:
+            for i, (won, guesses) in enumerate(results):
+                writer = first if i % 2 else second
+                writer.record(won, guesses, "tango")
+                writer.flush()
+            assert first.summary() == expected_summary(results)
+
+    def test_reopen(self, tmp_path):
+        path = tmp_path / "stats.sqlite3"
+        with StatsStore(path) as store:
+            store.record(True, 1, "tango")
+        with StatsStore(path) as store:
+            assert store.summary()["played"] == 1
+            assert store.summary()["distribution"] == {1: 1}
+
+    def test_default_path_from_environment(self, stats_file):
+        with StatsStore() as store:
+            assert store.path == str(stats_file)
+
+
+class TestSessions:
+
+    @pytest.fixture
+    def dictionary(self):
+        return Dictionary.from_words(WORDS)
+
+    def test_record_session(self, store, dictionary):
+        session = GameSession(dictionary, dictionary.answer_index["bread"], hard_mode=True)
+        session.submit("crane")
+        session.submit("bread")
+        store.record_session(session)
+        store.flush()
+        assert store.summary(mode="hard")["distribution"] == {2: 1}
+        assert store.summary()["played"] == 0
+        row = store.reader.execute("SELECT answer, guesses, won, mode FROM games").fetchone()
+        assert row == ("bread", 2, 1, "hard")
+
+    def test_modes(self, dictionary):
+        assert session_mode(GameSession(dictionary, 0)) == "normal"
+        pytest.importorskip("numpy")
+        from wordle_multiboard import MultiBoardSession
+
+        assert session_mode(MultiBoardSession(dictionary, 4)) == "boards4"
+
+
+class TestSummaryLines:
+
+    def test_format(self):
+        lines = summary_lines(expected_summary([(True, 3), (True, 3), (False, 6), (True, 1)]), width=4)
+        assert lines[0] == "Played 4  Won 75%  Streak 1  Max streak 2"
+        assert lines[1:4] == [" 1 ## 1", " 2  0", " 3 #### 2"]
+        assert len(lines) == 7
+
+    def test_more_than_six_guesses(self):
+        lines = summary_lines(expected_summary([(True, 9)]))
+        assert len(lines) == 10
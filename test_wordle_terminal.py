@@ -10,6 +10,8 @@ Test Classes:
     - TestCompare: Tests word comparison algorithm
     - TestCheckWord: Tests main game loop
     - TestMain: Tests game menu and flow control
+    - TestEvaluate: Tests the non-interactive --eval mode
+    - TestStartup: Tests that importing reads no files
 
 
 Requirements:
@@ -18,6 +20,11 @@ Requirements:
     - unittest.mock
 """
 
+import io
+import json
+import os
+import subprocess
+import sys
 import pytest
 import colorama
 from unittest.mock import patch, mock_open, MagicMock
@@ -35,8 +42,13 @@ with patch('builtins.open', mock_open(read_data=mock_wordlist)):
         incorrect_letter,
         compare,
         check_word,
+        play_boards,
+        evaluate,
         main
     )
+import wordle_terminal
+from wordle_dictionary import Dictionary
+from wordle_score import score
 
 
 class TestColorFunctions:
@@ -162,11 +174,11 @@ class TestCheckWord:
     - random.choice: Control which word is selected (predictable tests)
     - builtins.input: Simulate user keyboard input
     - builtins.print: Capture output for verification
-    - builtins.exit: Raise SystemExit instead of terminating (allows test to catch)
+    - builtins.exit: Raise SystemExit if the game tried to end the process
     
-    Note: All tests use pytest.raises(SystemExit) because check_word() calls exit()
-    when the game ends. The mock makes exit() raise SystemExit which breaks the
-    while loop and allows the test to continue.
+    Note: check_word() returns when the game ends (True on a win, False after
+    max attempts, None on "no") instead of calling exit(), so one process can
+    play any number of games.
     """
     
     @patch('wordle_terminal.random.choice', return_value='tango')
@@ -184,16 +196,15 @@ class TestCheckWord:
         1. User inputs "tango"
         2. Matches target word
         3. Check that print congratulations message
-        4. Call exit() once
+        4. Return True without calling exit()
         
         """
         
         wordlist = ["tango", "mango"]
         
-        with pytest.raises(SystemExit):
-            check_word(wordlist)
+        assert check_word(wordlist) is True
         
-        mock_exit.assert_called_once()
+        mock_exit.assert_not_called()
         # Check that success message was printed
         assert any('Congrats' in str(call) for call in mock_print.call_args_list)
     
@@ -210,19 +221,17 @@ class TestCheckWord:
         
         Expected behavior:
         1. User inputs 'no'
-        2. Game exits without playing
-        3. Print exit message
-        4. Call exit() once
-        2. Check that exit message was printed
+        2. Game ends without playing
+        3. Return None so the menu stops too
+        4. exit() is not called
         
         """
     
         wordlist = ["tango", "mango"]
         
-        with pytest.raises(SystemExit):
-            check_word(wordlist)
+        assert check_word(wordlist) is None
         
-        mock_exit.assert_called_once()
+        mock_exit.assert_not_called()
     
     @patch('wordle_terminal.random.choice', return_value='tango')
     @patch('builtins.input')
@@ -248,8 +257,7 @@ class TestCheckWord:
         wordlist = ["tango", "mango"]
         mock_input.side_effect = ["tan", "kalak", "123", "tango"]
         
-        with pytest.raises(SystemExit):
-            check_word(wordlist)
+        check_word(wordlist)
         
         calls = [str(call) for call in mock_print.call_args_list]
         assert any('5 letter valid word' in call for call in calls)
@@ -259,6 +267,260 @@ class TestCheckWord:
     @patch('builtins.print')
     @patch('builtins.exit', side_effect=SystemExit)
     
+    def test_allowed_guess(self, mock_exit, mock_print, mock_input, mock_choice):
+        """
+        Test a valid guess that can never be the answer.
+        
+        Scenario: User inputs "aahed" (allowed, not an answer), then "tango"
+        
+        Expected behavior:
+        1. "aahed" is accepted and scored
+        2. No invalid word message is printed
+        
+        """
+        mock_input.side_effect = ["aahed", "tango"]
+        
+        check_word(["tango", "mango"], frozenset(["tango", "mango", "aahed"]))
+        
+        calls = [str(call) for call in mock_print.call_args_list]
+        assert not any('5 letter valid word' in call for call in calls)
+        assert any('Attempts left' in call for call in calls)
+    
+    @patch('wordle_terminal.random.choice', return_value='tango')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    
+    def test_possible_words(self, mock_print, mock_input, mock_choice):
+        """
+        Test the remaining possible words.
+        
+        Scenario: User guesses "bread", asks for "words", then guesses "tango"
+        
+        Expected behavior:
+        1. After "bread" the possible word count is printed
+        2. "words" lists the answers still consistent with the feedback
+        
+        """
+        wordlist = ['tango', 'mango', 'bread', 'crane']
+        mock_input.side_effect = ['bread', 'words', 'tango']
+        
+        check_word(wordlist)
+        
+        calls = [str(call) for call in mock_print.call_args_list]
+        assert any('Possible words: ' in call and ', 2)' in call for call in calls)
+        assert any('2 possible words:' in call and 'tango mango' in call for call in calls)
+    
+    @patch('wordle_terminal.random.choice', return_value='tango')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    
+    def test_hard_mode(self, mock_print, mock_input, mock_choice):
+        """
+        Test hard mode.
+        
+        Scenario: User guesses "mango" (4 greens), then "bread", then "tango"
+        
+        Expected behavior:
+        1. "bread" ignores the green letters and is rejected
+        2. The rejection doesn't count as an attempt
+        3. "tango" wins
+        
+        """
+        wordlist = ['tango', 'mango', 'bread']
+        mock_input.side_effect = ['mango', 'bread', 'tango']
+        
+        assert check_word(wordlist, hard_mode=True) is True
+        
+        calls = [str(call) for call in mock_print.call_args_list]
+        assert any('Hard mode: 2nd letter must be A' in call for call in calls)
+    
+    @patch('builtins.input')
+    @patch('builtins.print')
+    
+    def test_absurdle(self, mock_print, mock_input):
+        """
+        Test absurdle mode.
+        
+        Scenario: User guesses "tango", then "mango"
+        
+        Expected behavior:
+        1. "tango" is not accepted as the answer, the game keeps "mango"
+        2. "mango" is then the only answer left and wins
+        
+        """
+        pytest.importorskip("numpy")
+        wordlist = ['tango', 'mango']
+        mock_input.side_effect = ['tango', 'mango']
+        
+        assert check_word(wordlist, absurdle=True) is True
+        
+        calls = [str(call) for call in mock_print.call_args_list]
+        assert any('the word was:mango' in call for call in calls)
+    
+    @patch('builtins.input')
+    @patch('builtins.print')
+    
+    def test_boards(self, mock_print, mock_input):
+        """
+        Test a multi-board game.
+        
+        Scenario: 2 boards with "tango" and "mango", user guesses both
+        
+        Expected behavior:
+        1. The first guess is shown once per board
+        2. The second guess only on the board still unsolved
+        3. The game is won
+        
+        """
+        pytest.importorskip("numpy")
+        dictionary = Dictionary.from_words(['tango', 'mango'])
+        mock_input.side_effect = ['tango', 'mango']
+        
+        assert play_boards(dictionary, 2) is True
+        
+        calls = [str(call) for call in mock_print.call_args_list]
+        assert sum(' 1 ' in call or ' 2 ' in call for call in calls) == 3
+        assert any('the words were:' in call for call in calls)
+    
+    @patch('wordle_terminal.random.choice', return_value='tango')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    
+    def test_log(self, mock_print, mock_input, mock_choice):
+        """
+        Test recording finished games.
+        
+        Scenario: User wins one game, quits the next
+        
+        Expected behavior:
+        1. The won game is passed to the log
+        2. A quit game is not recorded
+        
+        """
+        log = MagicMock()
+        mock_input.side_effect = ['mango', 'tango', 'no']
+        
+        assert check_word(['tango', 'mango'], log=log) is True
+        assert check_word(['tango', 'mango'], log=log) is None
+        
+        session = log.record.call_args[0][0]
+        assert log.record.call_count == 1
+        assert list(session.codes) == [score('mango', 'tango'), 242]
+
+    @patch('wordle_terminal.random.choice', return_value='tango')
+    @patch('builtins.input')
+    @patch('builtins.print')
+
+    def test_stats(self, mock_print, mock_input, mock_choice):
+        """
+        Test the stats shown after a game.
+
+        Scenario: User wins in two guesses with a stats store
+
+        Expected behavior:
+        1. The game is committed to the store before check_word returns
+        2. The totals and the distribution are printed
+
+        """
+        from wordle_stats import StatsStore
+        mock_input.side_effect = ['mango', 'tango']
+
+        with StatsStore() as stats:
+            assert check_word(['tango', 'mango'], stats=stats) is True
+            assert stats.summary()['distribution'] == {2: 1}
+
+        calls = [str(call) for call in mock_print.call_args_list]
+        assert any('Played 1  Won 100%  Streak 1  Max streak 1' in call for call in calls)
+
+    @patch('wordle_terminal.random.choice', return_value='tango')
+    @patch('builtins.input')
+    @patch('builtins.print')
+
+    def test_stats_write_fails(self, mock_print, mock_input, mock_choice):
+        """
+        Test a stats store whose write fails.
+
+        Scenario: User wins while the database is locked by another process
+
+        Expected behavior:
+        1. The game still ends normally
+        2. "Could not save the statistics" is printed instead of the stats
+
+        """
+        import sqlite3
+        from wordle_stats import StatsStore
+        mock_input.side_effect = ['mango', 'tango']
+
+        with StatsStore() as stats:
+            # as the writer thread reports a failed commit
+            stats.error = sqlite3.OperationalError('database is locked')
+            assert check_word(['tango', 'mango'], stats=stats) is True
+
+        mock_print.assert_any_call('Could not save the statistics')
+        calls = [str(call) for call in mock_print.call_args_list]
+        assert not any('Played' in call for call in calls)
+
+    @patch('wordle_solver.rank_guesses', return_value=[('crane', 5.7)])
+    @patch('wordle_terminal.random.choice', return_value='tango')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    @patch('builtins.exit', side_effect=SystemExit)
+    
+    def test_hint(self, mock_exit, mock_print, mock_input, mock_choice, mock_rank):
+        """
+        Test asking for a hint.
+        
+        Scenario: User inputs "hint", then guesses the word
+        
+        Expected behavior:
+        1. The solver ranks guesses for the history so far
+        2. It ranks over the game's own word list
+        3. The best guesses are printed
+        4. The hint doesn't count as an attempt
+        
+        """
+        wordlist = ["tango", "mango"]
+        mock_input.side_effect = ["hint", "tango"]
+        
+        check_word(wordlist)
+        
+        args, kwargs = mock_rank.call_args
+        patterns = kwargs.pop('patterns')
+        assert (args, kwargs) == (([],), {'top': 5, 'candidates': [0, 1], 'guesses': None})
+        assert patterns.guesses == ('tango', 'mango')
+        calls = [str(call) for call in mock_print.call_args_list]
+        assert any('crane' in call for call in calls)
+    
+    @patch('wordle_solver.rank_guesses')
+    @patch('wordle_tree.tree_hint', return_value='mango')
+    @patch('wordle_terminal.random.choice', return_value='tango')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    
+    def test_hint_from_tree(self, mock_print, mock_input, mock_choice, mock_tree, mock_rank):
+        """
+        Test a hint when the decision tree has been built.
+        
+        Scenario: User inputs "hint", then guesses the word
+        
+        Expected behavior:
+        1. The tree's guess is printed
+        2. The solver is not run
+        
+        """
+        wordlist = ["tango", "mango"]
+        mock_input.side_effect = ["hint", "tango"]
+        
+        check_word(wordlist)
+        
+        mock_print.assert_any_call("Best guess:", "mango")
+        mock_rank.assert_not_called()
+    
+    @patch('wordle_terminal.random.choice', return_value='tango')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    @patch('builtins.exit', side_effect=SystemExit)
+    
     def test_max_attempts(self, mock_exit, mock_print, mock_input, mock_choice):
         """ 
         Test reaching max attempts without guessing the word
@@ -270,15 +532,14 @@ class TestCheckWord:
         1. User inputs 6 incorrect words    
         2. Game ends after 6 attempts
         3. Print max attempts message
-        4. Call exit() once
+        4. Return False
         
         """
         
         wordlist = ['tango', 'bread', 'crane', 'drake', 'flame', 'grape', 'house']
         mock_input.side_effect = ['bread', 'crane', 'drake', 'flame', 'grape', 'house']
         
-        with pytest.raises(SystemExit):
-            check_word(wordlist)
+        assert check_word(wordlist) is False
         
         calls = [str(call) for call in mock_print.call_args_list]
         assert any('max attempts' in call.lower() for call in calls)
@@ -328,6 +589,26 @@ class TestMain:
         calls = [str(call) for call in mock_print.call_args_list]
         assert any('Thanks for playing' in call for call in calls)
     
+    @patch('wordle_terminal.play_boards', return_value=True)
+    @patch('builtins.input', side_effect=['boards 3', 'boards 4', 'no'])
+    @patch('builtins.print')
+    
+    def test_boards_menu(self, mock_print, mock_input, mock_play_boards):
+        """
+        Test choosing a multi-board game.
+        
+        Scenario: User asks for 3 boards, then 4 boards, then exits
+        
+        Expected behavior:
+        1. 3 is rejected with the allowed board counts
+        2. A 4-board game is started
+        
+        """
+        main()
+        
+        mock_print.assert_any_call("Boards can be", "2, 4, 8, 16")
+        assert mock_play_boards.call_args[0][1] == 4
+    
     @patch('wordle_terminal.check_word')  
     @patch('builtins.input')
     @patch('builtins.print')
@@ -356,6 +637,77 @@ class TestMain:
         calls = [str(call) for call in mock_print.call_args_list]
         assert any('Thanks for playing' in call for call in calls)
         
+    @patch('wordle_terminal.check_word', return_value=True)
+    @patch('builtins.input', side_effect=['yes', 'no'])
+    @patch('builtins.print')
+
+    def test_unusable_stats_path(self, mock_print, mock_input, mock_check_word, tmp_path):
+        """
+        Test a stats file that cannot be opened.
+
+        Scenario: --stats names a file in a directory that does not exist
+
+        Expected behavior:
+        1. The menu still starts and a game is played
+        2. The game runs without a stats store
+
+        """
+        main(['--stats', str(tmp_path / 'missing' / 'stats.sqlite3')])
+
+        assert mock_check_word.call_args.kwargs['stats'] is None
+        calls = [str(call) for call in mock_print.call_args_list]
+        assert any('Statistics are off' in call for call in calls)
+        assert any('Thanks for playing' in call for call in calls)
+
+    @patch('wordle_terminal.check_word', return_value=True)
+    @patch('builtins.input')
+    @patch('builtins.print')
+
+    def test_profile_first_game(self, mock_print, mock_input, mock_check_word, tmp_path):
+        """
+        Test --profile.
+
+        Scenario: User plays two games with --profile FILE
+
+        Expected behavior:
+        1. FILE holds cProfile stats of the first game
+        2. The second game is not profiled
+
+        """
+        import pstats
+        path = tmp_path / 'game.prof'
+        profiled = []
+        mock_check_word.side_effect = lambda *args, **kwargs: profiled.append(sys.getprofile() is not None) or True
+        mock_input.side_effect = ['yes', 'yes', 'no']
+
+        main(['--no-stats', '--profile', str(path)])
+
+        assert profiled == [True, False]
+        assert pstats.Stats(str(path)).total_calls > 0
+
+    @patch('wordle_terminal.check_word', return_value=None)
+    @patch('builtins.input')
+    @patch('builtins.print')
+    
+    def test_quit_during_game(self, mock_print, mock_input, mock_check_word):
+        """
+        Test typing "no" during a game.
+        
+        Scenario: User selects 'yes', then quits the game (check_word returns None)
+        
+        Expected behavior:
+        1. The menu is not shown again
+        2. Print "Thanks for playing!"
+        
+        """
+        mock_input.side_effect = ['yes']
+        
+        main()
+        
+        mock_check_word.assert_called_once()
+        calls = [str(call) for call in mock_print.call_args_list]
+        assert any('Thanks for playing' in call for call in calls)
+    
     @patch('builtins.input')
     @patch('builtins.print')    
     def test_invalid_start_input(self, mock_print, mock_input):
@@ -382,6 +734,139 @@ class TestMain:
         assert any('Please enter yes or no' in call for call in calls)
 
 
+class TestEvaluate:
+    """
+    Test for the non-interactive --eval mode.
+    
+    evaluate() reads "answer,guess[,guess...]" records and writes one line
+    per record, JSON or compact patterns, without any prompt or print().
+    
+    """
+    
+    def test_json_lines(self):
+        """
+        Test scoring a whole game as JSON.
+        
+        Expected behavior:
+        1. One line per record, valid JSON
+        2. Codes and patterns match score()
+        
+        """
+        out = io.StringIO()
+        
+        assert evaluate(["tango,crane,mango,tango\n"], out) == (1, 0)
+        
+        record = json.loads(out.getvalue())
+        assert record == {
+            "answer": "tango",
+            "guesses": ["crane", "mango", "tango"],
+            "codes": [score("crane", "tango"), score("mango", "tango"), 242],
+            "patterns": ["--YY-", "-GGGG", "GGGGG"],
+        }
+    
+    def test_patterns_and_batches(self, monkeypatch):
+        """
+        Test the compact format over more records than one batch.
+        
+        Expected behavior:
+        1. Output is written in batches, not per record
+        2. Every record still gets its line, in order
+        
+        """
+        monkeypatch.setattr(wordle_terminal, "EVAL_BATCH", 3)
+        out = MagicMock()
+        lines = ["TANGO,mango\n", "eerie,geese\n"] * 4
+        
+        assert evaluate(lines, out, fmt="pattern") == (8, 0)
+        
+        assert out.write.call_count == 3
+        text = "".join(call.args[0] for call in out.write.call_args_list)
+        assert text.splitlines() == ["-GGGG", "-GY-G"] * 4
+    
+    def test_color_uses_cell_table(self):
+        """
+        Test colored output.
+        
+        Expected behavior:
+        1. Each guess is rendered like compare()
+        2. Guesses of one record are separated by spaces
+        
+        """
+        out = io.StringIO()
+        
+        evaluate(["tango,mango,notag\n"], out, color=True)
+        
+        assert out.getvalue() == compare("mango", "tango") + " " + compare("notag", "tango") + "\n"
+    
+    def test_bad_lines_are_skipped(self):
+        """
+        Test malformed records.
+        
+        Scenario: a record without guesses, a word of the wrong length,
+        a blank line and a non-ascii word between valid records
+        
+        Expected behavior:
+        1. Each bad line is reported with its line number
+        2. Valid records are still scored
+        
+        """
+        out, errors = io.StringIO(), io.StringIO()
+        lines = ["tango,mango\n", "tango\n", "tango,cat\n", "\n", "tängo,tango\n", "bread,crane\n"]
+        
+        assert evaluate(lines, out, fmt="pattern", errors=errors) == (2, 3)
+        
+        assert out.getvalue().splitlines() == ["-GGGG", "-GY-Y"]
+        assert [line.split(":")[0] for line in errors.getvalue().splitlines()] == ["line 2", "line 3", "line 5"]
+    
+    def test_main_eval_file(self, tmp_path, capsys):
+        """
+        Test main() with --eval and a file.
+        
+        Expected behavior:
+        1. No prompt is shown
+        2. Exit status is 0 when every record was scored
+        
+        """
+        path = tmp_path / "games.csv"
+        path.write_text("tango,mango\n")
+        
+        assert main(["--eval", str(path), "--format", "pattern"]) == 0
+        
+        assert capsys.readouterr().out == "-GGGG\n"
+
+
+class TestStartup:
+    """
+    Test that importing the module is cheap.
+    
+    Importing must read no files and must not import colorama, which is
+    only loaded once colored output is actually needed.
+    
+    """
+    
+    def test_import_is_lazy(self):
+        """
+        Test a fresh interpreter importing wordle_terminal.
+        
+        Expected behavior:
+        1. open() is never called
+        2. colorama and argparse are not imported
+        
+        """
+        code = (
+            "import builtins, sys\n"
+            "def no_open(*args, **kwargs): raise AssertionError(args)\n"
+            "builtins.open = no_open\n"
+            "import wordle_terminal\n"
+            "print('colorama' in sys.modules, 'argparse' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(wordle_terminal.__file__)))
+        
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["False", "False"]
+
+
 # Parametrized tests for invalid inputs
 @pytest.mark.parametrize("invalid_input", [
     'cat',      # too short
@@ -417,13 +902,12 @@ def test_invalid_inputs(mock_exit, mock_print, mock_input, mock_choice, invalid_
     wordlist = ['tango', 'mango']
     mock_input.side_effect = [invalid_input, 'tango']
     
-    with pytest.raises(SystemExit):
-        check_word(wordlist)
+    check_word(wordlist)
     
     calls = [str(call) for call in mock_print.call_args_list]
     assert any('5 letter valid word' in call for call in calls)
 
-"""
+r"""
 PS C:\Users\SPAC-O-6\Desktop\wordle_py> python -m pytest test_wordle_terminal.py -vv
 =========================================================== test session starts ===========================================================
 platform win32 -- Python 3.13.11, pytest-9.0.2, pluggy-1.6.0 -- C:\Program Files\Python313\python.exe
@@ -0,0 +1,166 @@
+"""
+Test for the Tk front end
+
+python -m pytest test_wordle_tkinter.py -v
+
+No window is opened: the startup test imports the module in a fresh
+interpreter, and the rendering tests call MainScreen methods on a stand-in
+for the frame.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+import wordle_tkinter
+from wordle_hints import HintWorker
+from wordle_score import CORRECT, HALF_CORRECT
+from wordle_tkinter import COLOR_BLANK, COLOR_CORRECT, COLOR_HALF_CORRECT
+from wordle_view import Renderer
+
+
+class TestStartup:
+    """
+    Test that importing the module is cheap.
+
+    numpy, the hint worker and sqlite3 are only loaded by the first game,
+    hint or stats write that needs them.
+
+    """
+
+    def test_import_is_lazy(self):
+        """
+        Test a fresh interpreter importing wordle_tkinter.
+
+        Expected behavior:
+        1. numpy and multiprocessing are not imported
+        2. nor are the absurdle, multi-board, hint and stats modules
+
+        """
+        modules = ["numpy", "multiprocessing", "sqlite3",
+                   "wordle_absurdle", "wordle_multiboard", "wordle_hints", "wordle_stats"]
+        code = (
+            "import sys\n"
+            "import wordle_tkinter\n"
+            f"print(*[m for m in {modules!r} if m in sys.modules])\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(wordle_tkinter.__file__)))
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == []
+
+
+class FakeWidget:
+    def __init__(self):
+        self.options = {}
+
+    def configure(self, **options):
+        self.options.update(options)
+
+
+class TestKeyboard:
+
+    def screen(self, boards, key_states):
+        """A stand-in for MainScreen with one button and one stripe per board for the keys A and B."""
+        screen = type("Screen", (), {})()
+        screen.view = Renderer(lambda func: None)
+        screen.keyboard_buttons = {key: FakeWidget() for key in "AB"}
+        screen.key_stripes = {key: [FakeWidget() for _ in range(boards if boards > 1 else 0)] for key in "AB"}
+        screen.boards = boards
+        screen.key_states = key_states
+        return screen
+
+    def render(self, screen):
+        wordle_tkinter.MainScreen.update_keyboard(screen)
+        screen.view.flush()
+
+    def test_single_board_colors_the_key(self):
+        screen = self.screen(1, [{"A": CORRECT}])
+        self.render(screen)
+        assert screen.keyboard_buttons["A"].options["bg"] == COLOR_CORRECT
+        assert screen.keyboard_buttons["B"].options["bg"] == COLOR_BLANK
+
+    def test_switch_to_several_boards_clears_the_key(self):
+        screen = self.screen(1, [{"A": CORRECT}])
+        self.render(screen)
+        # a new game with two boards keeps the buttons, build_boards adds the stripes
+        screen.boards = 2
+        screen.key_stripes = {key: [FakeWidget(), FakeWidget()] for key in "AB"}
+        screen.key_states = [{"A": HALF_CORRECT}, {}]
+        self.render(screen)
+        assert screen.keyboard_buttons["A"].options["bg"] == COLOR_BLANK
+        first, second = screen.key_stripes["A"]
+        assert first.options["bg"] == COLOR_HALF_CORRECT
+        assert second.options["bg"] == COLOR_BLANK
+
+
+def fail(*args):
+    raise RuntimeError("analysis failed")
+
+
+class FakeVar:
+    def __init__(self):
+        self.value = ""
+
+    def set(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class TestHint:
+
+    def test_failed_analysis_is_reported(self):
+        screen = type("Screen", (), {"cancel_hint": wordle_tkinter.MainScreen.cancel_hint})()
+        screen.hints = HintWorker(lambda: ThreadPoolExecutor(max_workers=1))
+        screen.hint_poll = None
+        screen.hint_text = FakeVar()
+        toasts = []
+        screen.toast = toasts.append
+        polls = []
+        screen.after = lambda ms, func: polls.append(func)
+        screen.poll_hint = lambda: wordle_tkinter.MainScreen.poll_hint(screen)
+
+        screen.hints.request(fail)
+        screen.hint_text.set("Thinking...")
+        deadline = time.monotonic() + 5
+        screen.poll_hint()
+        while polls and time.monotonic() < deadline:
+            time.sleep(0.005)
+            polls.pop()()
+        screen.hints.close()
+        assert toasts == ["No hint available"]
+        assert screen.hint_text.get() == ""
+        assert not screen.hints.pending
+        assert screen.hint_poll is None
+
+
+class TestStats:
+
+    def test_failed_write_is_reported(self, tmp_path):
+        from wordle_stats import StatsStore
+
+        screen = type("Screen", (), {})()
+        screen.stats = StatsStore(tmp_path / "stats.sqlite3")
+        screen.stats_mode = "normal"
+        screen.stats_poll = "pending"
+        screen.game_over_stats = FakeVar()
+        toasts = []
+        screen.toast = toasts.append
+        screen.after = lambda ms, func: pytest.fail("still polling")
+        try:
+            screen.stats.error = OSError("disk full")
+            wordle_tkinter.MainScreen.show_stats(screen)
+        finally:
+            screen.stats.close()
+        assert toasts == ["Could not save the statistics"]
+        assert screen.stats_poll is None
+        assert screen.stats.error is None
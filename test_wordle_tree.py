@@ -0,0 +1,123 @@
+"""
+Test for the precomputed decision tree
+
+python -m pytest test_wordle_tree.py -v
+
+Trees are built for a small word list in a temporary cache directory.
+Following the tree with real feedback must solve every answer.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import wordle_tree
+from wordle_dictionary import Dictionary
+from wordle_score import ALL_CORRECT, score
+from wordle_session import GameSession
+
+ANSWERS = ["tango", "mango", "bread", "crane", "drake", "flame", "grape", "house",
+           "speed", "abide", "geese", "elder", "eerie", "array", "ratty", "bongo"]
+EXTRA = ["aahed", "slate", "pious", "dumpy"]
+
+
+@pytest.fixture
+def dictionary():
+    return Dictionary.from_words(ANSWERS, EXTRA)
+
+
+@pytest.fixture
+def tree(dictionary, tmp_path):
+    path = wordle_tree.build(dictionary.answers, dictionary.guesses, tmp_path, workers=1)
+    return wordle_tree.load_tree(path, dictionary.guesses)
+
+
+def play(tree, answer):
+    history = []
+    while True:
+        guess = tree.next_guess(history)
+        code = score(guess, answer)
+        history.append((guess, code))
+        if code == ALL_CORRECT:
+            return history
+
+
+class TestTree:
+
+    def test_solves_every_answer(self, tree):
+        for answer in ANSWERS:
+            history = play(tree, answer)
+            assert history[-1][0] == answer
+            assert len(history) <= 6
+
+    def test_depths_cover_all_answers(self, tree):
+        assert sum(tree.depths().values()) == len(ANSWERS)
+
+    def test_left_the_tree(self, tree):
+        first = tree.next_guess([])
+        other = next(w for w in ANSWERS if w != first)
+        assert tree.next_guess([(other, 0)]) is None
+
+    def test_impossible_code(self, tree):
+        assert tree.child(tree.root, ALL_CORRECT) is None
+        codes = {score(tree.next_guess([]), answer) for answer in ANSWERS}
+        missing = next(code for code in range(ALL_CORRECT) if code not in codes)
+        assert tree.child(tree.root, missing) is None
+
+    def test_header(self, tree, dictionary):
+        assert tree.digest == dictionary.digest
+        with pytest.raises(ValueError):
+            wordle_tree.DecisionTree(b"XXXX" + bytes(wordle_tree.HEADER.size), dictionary.guesses)
+
+
+class TestBuild:
+
+    def test_parallel_build_is_identical(self, dictionary, tmp_path):
+        serial = wordle_tree.build(dictionary.answers, dictionary.guesses, tmp_path / "a", workers=1)
+        parallel = wordle_tree.build(dictionary.answers, dictionary.guesses, tmp_path / "b", workers=2)
+        assert serial.read_bytes() == parallel.read_bytes()
+
+    def test_resume(self, dictionary, tmp_path, monkeypatch):
+        real = wordle_tree.write_atomic
+        written = []
+
+        def interrupted(path, data):
+            # stop the build after two checkpointed subtrees
+            if len(written) == 2:
+                raise KeyboardInterrupt
+            written.append(path)
+            real(path, data)
+
+        monkeypatch.setattr(wordle_tree, "write_atomic", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            wordle_tree.build(dictionary.answers, dictionary.guesses, tmp_path, workers=1)
+        monkeypatch.setattr(wordle_tree, "write_atomic", real)
+        parts = list(tmp_path.glob("*.parts/*.bin"))
+        assert len(parts) == 2
+
+        progress = []
+        path = wordle_tree.build(dictionary.answers, dictionary.guesses, tmp_path, workers=1,
+                                 progress=lambda done, total: progress.append(done))
+        assert progress[0] == 2
+        assert not list(tmp_path.glob("*.parts"))
+        tree = wordle_tree.load_tree(path, dictionary.guesses)
+        assert all(play(tree, answer)[-1][0] == answer for answer in ANSWERS)
+
+
+class TestHint:
+
+    def test_session_hint(self, dictionary, tmp_path):
+        wordle_tree.build(dictionary.answers, dictionary.guesses, tmp_path, workers=1)
+        tree = wordle_tree.get_tree(dictionary, tmp_path)
+        first = tree.next_guess([])
+        answer = next(w for w in ANSWERS if w != first)
+        session = GameSession(dictionary, dictionary.answer_index[answer])
+        session.submit(first)
+        # the tree's second guess is consistent with the feedback or splits the rest
+        assert tree.next_guess(session.history()) in dictionary.guesses
+
+    def test_no_tree(self, dictionary, tmp_path):
+        assert wordle_tree.get_tree(dictionary, tmp_path) is None
+
+    def test_hard_mode_has_no_tree_hint(self, dictionary):
+        assert wordle_tree.tree_hint(GameSession(dictionary, hard_mode=True)) is None
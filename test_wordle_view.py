@@ -0,0 +1,128 @@
+"""
+Test for the dirty-tracking renderer and the toast manager
+
+python -m pytest test_wordle_view.py -v
+
+Fake widgets record their configure() calls; the renderer must push each
+change once, batched per flush, and skip values already on screen. Toasts
+must reuse one label however many messages are shown.
+"""
+
+from wordle_view import Renderer, ToastManager
+
+
+class FakeWidget:
+    def __init__(self):
+        self.calls = []
+        self.visible = False
+
+    def configure(self, **options):
+        self.calls.append(options)
+
+    def grid(self):
+        self.visible = True
+
+    def grid_remove(self):
+        self.visible = False
+
+
+class FakeLoop:
+    """Collects scheduled callbacks like after_idle, run with run()."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def schedule(self, func):
+        self.callbacks.append(func)
+
+    def run(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for func in callbacks:
+            func()
+
+    def after(self, ms, func):
+        self.callbacks.append(func)
+        return func
+
+    def after_cancel(self, func):
+        self.callbacks.remove(func)
+
+
+class TestRenderer:
+
+    def test_one_flush_per_event(self):
+        loop = FakeLoop()
+        view = Renderer(loop.schedule)
+        widgets = [FakeWidget() for _ in range(5)]
+        for widget in widgets:
+            view.set(widget, bg="green")
+            view.set(widget, text="A")
+        assert len(loop.callbacks) == 1
+        assert all(widget.calls == [] for widget in widgets)
+        loop.run()
+        assert all(widget.calls == [{"bg": "green", "text": "A"}] for widget in widgets)
+        assert view.configures == 5
+
+    def test_unchanged_values_are_skipped(self):
+        loop = FakeLoop()
+        view = Renderer(loop.schedule)
+        widget = FakeWidget()
+        view.track(widget, bg="black", text="")
+        view.set(widget, bg="black", text="")
+        loop.run()
+        assert widget.calls == []
+        view.set(widget, bg="black", text="B")
+        loop.run()
+        assert widget.calls == [{"text": "B"}]
+
+    def test_last_value_wins(self):
+        loop = FakeLoop()
+        view = Renderer(loop.schedule)
+        widget = FakeWidget()
+        view.track(widget, text="")
+        view.set(widget, text="A")
+        view.set(widget, text="")
+        loop.run()
+        assert widget.calls == []
+
+    def test_forget(self):
+        loop = FakeLoop()
+        view = Renderer(loop.schedule)
+        widget = FakeWidget()
+        view.set(widget, bg="green")
+        view.forget([widget])
+        loop.run()
+        assert widget.calls == []
+        assert widget not in view.rendered
+
+
+class TestToastManager:
+
+    def make(self):
+        loop = FakeLoop()
+        labels = []
+
+        def make_label():
+            labels.append(FakeWidget())
+            return labels[-1]
+
+        return ToastManager(make_label, loop.after, loop.after_cancel), loop, labels
+
+    def test_reuses_one_label(self):
+        toasts, loop, labels = self.make()
+        for i in range(5000):
+            toasts.show(f"message {i}")
+        assert toasts.widget_count == 1
+        assert len(labels) == 1
+        assert labels[0].calls[-1] == {"text": "message 4999"}
+        # only the newest hide timer is left
+        assert len(loop.callbacks) == 1
+
+    def test_hides_after_timer(self):
+        toasts, loop, labels = self.make()
+        toasts.show("hello")
+        assert labels[0].visible
+        loop.run()
+        assert not labels[0].visible
+        toasts.show("again")
+        assert labels[0].visible
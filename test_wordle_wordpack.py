@@ -0,0 +1,73 @@
+"""
+Test for the packed binary word lists
+
+python -m pytest test_wordle_wordpack.py -v
+
+A pack must give back exactly the lists it was written from, and any
+stale, truncated or corrupted file must be refused with ValueError.
+"""
+
+import pytest
+
+from wordle_wordpack import HEADER, decode_word, encode_word, load_pack, pack_words, source_key, write_pack
+
+ANSWERS = ("tango", "mango", "zzzzz")
+GUESSES = ANSWERS + ("aahed", "abbey")
+
+
+@pytest.fixture
+def pack(tmp_path):
+    path = tmp_path / "words.bin"
+    write_pack(str(path), pack_words(ANSWERS, GUESSES, key=7))
+    return path
+
+
+class TestCodes:
+
+    @pytest.mark.parametrize("word", ["aaaaa", "zzzzz", "tango", "abcde"])
+    def test_round_trip(self, word):
+        assert decode_word(encode_word(word)) == word
+        assert encode_word(word) < 1 << 25
+
+    def test_first_letter_lowest(self):
+        assert encode_word("baaaa") == 1
+        assert encode_word("aaaab") == 1 << 20
+
+
+class TestPack:
+
+    def test_round_trip(self, pack):
+        assert pack.stat().st_size == HEADER.size + 4 * len(GUESSES)
+        assert load_pack(pack) == (ANSWERS, GUESSES)
+        assert load_pack(pack, key=7) == (ANSWERS, GUESSES)
+
+    def test_stale_key(self, pack):
+        with pytest.raises(ValueError):
+            load_pack(pack, key=8)
+
+    def test_corrupted_payload(self, pack):
+        data = bytearray(pack.read_bytes())
+        data[-1] ^= 1
+        pack.write_bytes(bytes(data))
+        with pytest.raises(ValueError):
+            load_pack(pack)
+
+    @pytest.mark.parametrize("size", [0, 10, HEADER.size + 3])
+    def test_truncated(self, pack, size):
+        pack.write_bytes(pack.read_bytes()[:size])
+        with pytest.raises(ValueError):
+            load_pack(pack)
+
+    def test_unpackable_words(self):
+        with pytest.raises(ValueError):
+            pack_words(["tango"], ["tango", "tängo"])
+        with pytest.raises(ValueError):
+            pack_words(["tango"], ["mango", "tango"])
+
+    def test_source_key_follows_files(self, tmp_path):
+        path = tmp_path / "words.txt"
+        missing = source_key([path])
+        path.write_text("tango\n")
+        first = source_key([path])
+        path.write_text("tango\nmango\n")
+        assert len({missing, first, source_key([path])}) == 3
@@ -0,0 +1,53 @@
+"""
+Absurdle: an adversarial game where the answer is never fixed.
+
+After every guess the game partitions the answers still possible by the
+feedback they would give and keeps the largest group, so the player is
+always told as little as possible. The game is only won once a single
+answer is left and it is guessed.
+
+The partition is one score_batch() call of the guess against all
+remaining answers and one bincount over the resulting codes, about a
+millisecond even for the first guess against all 2315 answers. Answers
+are encoded once per word list and shared by every session.
+"""
+
+import numpy as np
+
+from wordle_metrics import timed
+from wordle_patterns import encode_words, encoded_answers, score_batch
+from wordle_score import NUM_PATTERNS
+from wordle_session import GameSession
+
+
+def largest_bucket(guess, encoded, candidates):
+    """
+    (code, answer indices) of the biggest group of candidates (answer
+    indices into encoded) by feedback for guess. Ties go to the lowest
+    code, which reveals the least.
+    """
+    candidates = np.asarray(candidates, dtype=np.intp)
+    codes = score_batch(encode_words([guess]), encoded[candidates])[0]
+    code = int(np.bincount(codes, minlength=NUM_PATTERNS).argmax())
+    return code, candidates[codes == code]
+
+
+class AbsurdleSession(GameSession):
+    """
+    GameSession whose answer is chosen adversarially. session.answer is
+    always one of the answers still possible, so answer_word shows a valid
+    answer when the game is lost.
+    """
+    __slots__ = ("encoded",)
+
+    adversarial = True
+
+    def __init__(self, dictionary, hard_mode=False):
+        super().__init__(dictionary, 0, hard_mode=hard_mode)
+        self.encoded = encoded_answers(dictionary)
+
+    @timed("score")
+    def feedback(self, word):
+        code, bucket = largest_bucket(word, self.encoded, self.candidate_indices())
+        self.answer = int(bucket[0])
+        return code
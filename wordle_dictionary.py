@@ -0,0 +1,197 @@
+"""
+Word lists shared by the terminal and Tkinter versions.
+
+Answers are the words in wordle_ord.txt. Allowed guesses are the answers
+plus allwords.txt, read directly out of wordle-clone-master.zip. Nothing is
+read (or even imported for reading) until a list is first used. The first
+load parses the text and writes a packed copy (see wordle_wordpack) to
+.wordle_cache, later processes mmap that instead. After that validation is
+a frozenset lookup and picking a random answer indexes a tuple.
+"""
+
+import os
+import random
+
+from wordle_index import WordIndex
+from wordle_metrics import count, timed
+from wordle_wordpack import load_pack, pack_words, source_key, write_pack
+
+# os.path rather than pathlib, which pulls in re, fnmatch and urllib.parse,
+# more than everything else this module imports put together
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+ANSWERS_FILE = "wordle_ord.txt"
+ALLOWED_ZIP = "wordle-clone-master.zip"
+ALLOWED_MEMBER = "wordle-clone-master/wordlists/allwords.txt"
+PACK_FILE = os.path.join(".wordle_cache", "words-v1.bin")
+
+
+def words_hash(answers, guesses):
+    """Content hash of both word lists, used to key files derived from them."""
+    import hashlib
+
+    h = hashlib.sha256()
+    h.update("\n".join(answers).encode("ascii"))
+    h.update(b"\0")
+    h.update("\n".join(guesses).encode("ascii"))
+    return h.hexdigest()[:16]
+
+
+def _split_words(text):
+    return [word.strip().lower() for word in text.split() if word.strip()]
+
+
+class Dictionary:
+
+    def __init__(self, base_path=BASE_PATH):
+        self.base_path = os.fspath(base_path)
+        self._answers = None
+        self._guesses = None
+        self._answer_set = None
+        self._allowed = None
+        self._answer_index = None
+        self._guess_index = None
+        self._index = None
+        self._guess_word_index = None
+        self._digest = None
+
+    @classmethod
+    def from_words(cls, answers, allowed=()):
+        """Dictionary over in-memory lists, e.g. for tests."""
+        dictionary = cls()
+        # not read from files, see __reduce__
+        dictionary.base_path = None
+        dictionary._set_words(list(answers), list(allowed))
+        return dictionary
+
+    def __reduce__(self):
+        # e.g. for a hint worker process: word lists from files are read there, not pickled
+        if self.base_path is None:
+            return Dictionary.from_words, (self.answers, self.guesses)
+        return type(self), (self.base_path,)
+
+    def _set_words(self, answers, allowed):
+        answers = tuple(dict.fromkeys(answers))
+        self._answer_set = frozenset(answers)
+        # answers come first, so an answer has the same index in both tuples
+        self._guesses = answers + tuple(w for w in dict.fromkeys(allowed) if w not in self._answer_set)
+        self._allowed = frozenset(self._guesses)
+        self._answers = answers
+
+    @timed("dictionary_load")
+    def _load(self):
+        sources = [os.path.join(self.base_path, ANSWERS_FILE), os.path.join(self.base_path, ALLOWED_ZIP)]
+        # without the text lists (e.g. a bundled build) any pack will do
+        key = source_key(sources) if os.path.exists(sources[0]) else None
+        pack = os.path.join(self.base_path, PACK_FILE)
+        try:
+            answers, guesses = load_pack(pack, key)
+        except (OSError, ValueError):
+            pass
+        else:
+            # a pack is always written from _set_words() output, nothing to dedupe
+            self._answers, self._guesses = answers, guesses
+            self._answer_set = frozenset(answers)
+            self._allowed = frozenset(guesses)
+            return
+        count("dictionary_text_load")
+        self._load_text()
+        try:
+            write_pack(pack, pack_words(self._answers, self._guesses, key or 0))
+        except (OSError, ValueError):
+            # read-only install, or words the pack can't hold: the text still works
+            pass
+
+    def _load_text(self):
+        import zipfile
+
+        with open(os.path.join(self.base_path, ANSWERS_FILE), "r") as f:
+            answers = _split_words(f.read())
+        try:
+            with zipfile.ZipFile(os.path.join(self.base_path, ALLOWED_ZIP)) as z:
+                allowed = _split_words(z.read(ALLOWED_MEMBER).decode("ascii"))
+        except FileNotFoundError:
+            # e.g. a bundled build without the zip, only answers are valid then
+            allowed = []
+        self._set_words(answers, allowed)
+
+    @property
+    def answers(self):
+        """Possible answers, as an indexed tuple."""
+        if self._answers is None:
+            self._load()
+        return self._answers
+
+    @property
+    def guesses(self):
+        """All allowed guesses, answers first."""
+        if self._answers is None:
+            self._load()
+        return self._guesses
+
+    @property
+    def answer_set(self):
+        if self._answers is None:
+            self._load()
+        return self._answer_set
+
+    @property
+    def allowed(self):
+        """Frozen set of all allowed guesses."""
+        if self._answers is None:
+            self._load()
+        return self._allowed
+
+    @property
+    def answer_index(self):
+        """word -> index into answers."""
+        if self._answer_index is None:
+            self._answer_index = {word: i for i, word in enumerate(self.answers)}
+        return self._answer_index
+
+    @property
+    def guess_index(self):
+        """word -> index into guesses."""
+        if self._guess_index is None:
+            self._guess_index = {word: i for i, word in enumerate(self.guesses)}
+        return self._guess_index
+
+    @property
+    def index(self):
+        """Bitset index over answers, for narrowing candidates by feedback."""
+        if self._index is None:
+            self._index = WordIndex(self.answers)
+        return self._index
+
+    @property
+    def guess_word_index(self):
+        """Bitset index over all allowed guesses, e.g. for hard-mode legal sets."""
+        if self._guess_word_index is None:
+            self._guess_word_index = WordIndex(self.guesses)
+        return self._guess_word_index
+
+    @property
+    def digest(self):
+        """words_hash() of answers and guesses, e.g. to find a matching cache file."""
+        if self._digest is None:
+            self._digest = words_hash(self.answers, self.guesses)
+        return self._digest
+
+    def is_valid(self, word):
+        return word in self.allowed
+
+    def is_answer(self, word):
+        return word in self.answer_set
+
+    def random_answer(self, rng=random):
+        return rng.choice(self.answers)
+
+
+_default = None
+
+
+def get_dictionary():
+    """Shared dictionary for the word lists next to this module."""
+    global _default
+    if _default is None:
+        _default = Dictionary()
+    return _default
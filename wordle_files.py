@@ -0,0 +1,32 @@
+"""
+Atomic file writes for the caches and reports.
+
+write_atomic() writes under a temporary name next to the target (same
+directory, so the same file system) and renames it into place with
+os.replace(). A reader sees either the old file or the whole new one,
+never half a file, and a crash leaves at most a stray .tmp behind. The
+process id in the temporary name keeps concurrent writers apart.
+"""
+
+import os
+
+
+def write_atomic(path, data):
+    """
+    Replace path with data in one step. data is bytes, or a function that
+    writes to the binary file object it is given (np.save, say).
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            if callable(data):
+                data(f)
+            else:
+                f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,333 @@
+"""
+Append-only binary log of finished games, and analytics over it.
+
+Every game is one fixed-size, length-prefixed record of 22 bytes:
+
+    <B   record length after this byte (21), frames and validates records
+    <H   answer index (dictionary.answers)
+    <B   guess count in the low 4 bits, FLAG_HARD / FLAG_ABSURDLE above
+    <6H  guess indices (dictionary.guesses), unused ones 0
+    <6B  feedback codes (see wordle_score), unused ones 0
+
+Records go to numbered segments (games-000001.wlog, ...) in a directory.
+Each segment starts with a header of the same size: magic "WDLG", version,
+record size and the first 8 bytes of the word-list digest, so indices are
+never read against the wrong lists. A segment is rotated once it exceeds
+max_bytes or the word lists change. Every write is flushed to the OS at
+once and fsync()ed every sync_every records or sync_interval seconds. A
+torn last record (e.g. after a power cut) is cut off when the segment is
+reopened.
+
+Writing needs only the standard library. scan() and analyse() read the
+segments in fixed-size chunks into one reused buffer and view them with
+numpy.frombuffer, so memory stays constant however long the log is.
+
+WORDLE_GAME_LOG=games python wordle_terminal.py    # record games
+python wordle_gamelog.py games                     # report
+"""
+
+import argparse
+import os
+import struct
+import time
+
+from wordle_score import ALL_CORRECT
+
+LOG_VERSION = 1
+MAGIC = b"WDLG"
+MAX_GUESSES = 6
+RECORD = struct.Struct(f"<BHB{MAX_GUESSES}H{MAX_GUESSES}B")
+HEADER = struct.Struct(f"<4sHH8s{RECORD.size - 16}x")
+COUNT_MASK = 0x0F
+FLAG_HARD = 0x10
+FLAG_ABSURDLE = 0x20
+SEGMENT_PATTERN = "games-{:06d}.wlog"
+# environment variable naming the log directory, e.g. for the GUI
+LOG_ENV = "WORDLE_GAME_LOG"
+# failed games count as this many guesses in per-answer difficulty
+FAIL_GUESSES = MAX_GUESSES + 1
+
+
+def encode_record(answer, guesses, codes, flags=0):
+    """One record. Raises ValueError for more than MAX_GUESSES guesses."""
+    n = len(guesses)
+    if n > MAX_GUESSES or len(codes) != n:
+        raise ValueError(f"a record holds up to {MAX_GUESSES} guesses with one code each")
+    padding = (0,) * (MAX_GUESSES - n)
+    return RECORD.pack(RECORD.size - 1, answer, n | flags, *guesses, *padding, *codes, *padding)
+
+
+def decode_record(data):
+    """(answer, guesses, codes, flags) of one record."""
+    length, answer, count, *rest = RECORD.unpack(data)
+    if length != RECORD.size - 1:
+        raise ValueError("not a game record")
+    n = count & COUNT_MASK
+    return answer, rest[:n], rest[MAX_GUESSES:MAX_GUESSES + n], count & ~COUNT_MASK
+
+
+def session_record(session):
+    """The record of a finished single-board GameSession (or subclass)."""
+    flags = FLAG_HARD if session.hard is not None else 0
+    if session.adversarial:
+        flags |= FLAG_ABSURDLE
+    return encode_record(session.answer, session.guesses, session.codes, flags)
+
+
+def segments(directory):
+    """Segment paths in the order they were written."""
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return [os.path.join(directory, name) for name in sorted(names)
+            if name.startswith("games-") and name.endswith(".wlog")]
+
+
+def _digest_bytes(digest):
+    return bytes.fromhex(digest)[:8]
+
+
+class GameLog:
+
+    def __init__(self, directory, digest, sync_every=64, sync_interval=1.0, max_bytes=64 << 20):
+        """digest is Dictionary.digest of the word lists the indices refer to."""
+        self.directory = os.fspath(directory)
+        self.digest = _digest_bytes(digest)
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.max_bytes = max_bytes
+        self.file = None
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self._open()
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        existing = segments(self.directory)
+        if existing:
+            path = existing[-1]
+            number = int(os.path.basename(path)[6:12])
+            if self._can_append(path):
+                self.file = open(path, "ab")
+                return
+            number += 1
+        else:
+            number = 1
+        path = os.path.join(self.directory, SEGMENT_PATTERN.format(number))
+        self.file = open(path, "ab")
+        self.file.write(HEADER.pack(MAGIC, LOG_VERSION, RECORD.size, self.digest))
+        self.file.flush()
+
+    def _can_append(self, path):
+        """True if path is a segment for these word lists with room left; cuts off a torn record."""
+        size = os.path.getsize(path)
+        if size >= self.max_bytes:
+            return False
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        if len(header) < HEADER.size or HEADER.unpack(header) != (MAGIC, LOG_VERSION, RECORD.size, self.digest):
+            return False
+        torn = size % RECORD.size
+        if torn:
+            os.truncate(path, size - torn)
+        return True
+
+    def write(self, records):
+        """Append one or more encoded records (a whole number of them)."""
+        if len(records) % RECORD.size:
+            raise ValueError("partial record")
+        self.file.write(records)
+        self.file.flush()
+        self.unsynced += len(records) // RECORD.size
+        if self.unsynced >= self.sync_every or time.monotonic() - self.last_sync >= self.sync_interval:
+            self.sync()
+        if self.file.tell() >= self.max_bytes:
+            self.rotate()
+
+    def record(self, session):
+        self.write(session_record(session))
+
+    def sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def rotate(self):
+        self.close()
+        self._open()
+
+    def close(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_log(dictionary, directory=None):
+    """GameLog in directory (default: $WORDLE_GAME_LOG), None if neither is set."""
+    directory = directory or os.environ.get(LOG_ENV)
+    if not directory:
+        return None
+    return GameLog(directory, dictionary.digest)
+
+
+def record_dtype():
+    import numpy as np
+
+    return np.dtype([
+        ("length", "u1"),
+        ("answer", "<u2"),
+        ("count", "u1"),
+        ("guesses", "<u2", MAX_GUESSES),
+        ("codes", "u1", MAX_GUESSES),
+    ])
+
+
+def scan(directory, digest=None, chunk_records=1 << 16):
+    """
+    Yield structured arrays of up to chunk_records records, segment by
+    segment. Each array is a view of a buffer that is reused for the next
+    chunk, so use it before asking for the next one. Segments of other
+    word lists (when digest is given) or versions are skipped, as are
+    records with a bad length byte.
+    """
+    import numpy as np
+
+    dtype = record_dtype()
+    want = None if digest is None else _digest_bytes(digest)
+    buffer = bytearray(chunk_records * RECORD.size)
+    for path in segments(directory):
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                continue
+            magic, version, size, segment_digest = HEADER.unpack(header)
+            if magic != MAGIC or version != LOG_VERSION or size != RECORD.size:
+                continue
+            if want is not None and segment_digest != want:
+                continue
+            while True:
+                got = f.readinto(buffer)
+                if got < RECORD.size:
+                    # end of segment, or a torn last record
+                    break
+                partial = got % RECORD.size
+                if partial:
+                    # a short read mid-file, reread the cut record next time
+                    f.seek(-partial, os.SEEK_CUR)
+                records = np.frombuffer(buffer, dtype=dtype, count=got // RECORD.size)
+                yield records[records["length"] == RECORD.size - 1]
+
+
+def _add(total, values, weights=None):
+    """total + bincount(values), growing total if values go past its end."""
+    import numpy as np
+
+    counts = np.bincount(values, weights=weights, minlength=len(total))
+    if len(counts) > len(total):
+        grown = np.zeros(len(counts), dtype=total.dtype)
+        grown[:len(total)] = total
+        total = grown
+    total += counts
+    return total
+
+
+def analyse(directory, digest=None, chunk_records=1 << 16):
+    """
+    Aggregate the log in one pass: games, distribution (index = guesses
+    needed, 0 = failed), opener counts per guess index and per-answer
+    plays, failures and total guesses (FAIL_GUESSES for a failure).
+    """
+    import numpy as np
+
+    distribution = np.zeros(MAX_GUESSES + 1, dtype=np.int64)
+    openers = np.zeros(0, dtype=np.int64)
+    plays = np.zeros(0, dtype=np.int64)
+    failures = np.zeros(0, dtype=np.int64)
+    guess_totals = np.zeros(0, dtype=np.float64)
+    for records in scan(directory, digest, chunk_records):
+        count = (records["count"] & COUNT_MASK).astype(np.intp)
+        played = (count > 0) & (count <= MAX_GUESSES)
+        records, count = records[played], count[played]
+        last = records["codes"][np.arange(len(records)), count - 1]
+        solved = last == ALL_CORRECT
+        answers = records["answer"]
+        distribution = _add(distribution, np.where(solved, count, 0))
+        openers = _add(openers, records["guesses"][:, 0])
+        plays = _add(plays, answers)
+        failures = _add(failures, answers[~solved])
+        guess_totals = _add(guess_totals, answers, np.where(solved, count, FAIL_GUESSES).astype(np.float64))
+    # failures only grew as far as the largest answer index that failed
+    failures = np.concatenate([failures, np.zeros(len(plays) - len(failures), dtype=np.int64)])
+    return {
+        "games": int(distribution.sum()),
+        "distribution": distribution,
+        "openers": openers,
+        "plays": plays,
+        "failures": failures,
+        "guess_totals": guess_totals,
+    }
+
+
+def report(stats, answers, guesses, top=10):
+    """Text summary of analyse() output; answers and guesses name the indices."""
+    import numpy as np
+
+    games = stats["games"]
+    if not games:
+        return "No games logged"
+    distribution = stats["distribution"]
+    solved = games - int(distribution[0])
+    mean = sum(n * int(distribution[n]) for n in range(1, MAX_GUESSES + 1)) / solved if solved else 0.0
+    lines = [f"{games} games, {solved / games:.1%} solved, {mean:.3f} guesses on average"]
+    widest = int(distribution.max())
+    for n in list(range(1, MAX_GUESSES + 1)) + [0]:
+        count = int(distribution[n])
+        bar = "#" * (40 * count // widest if widest else 0)
+        lines.append(f"  {n if n else 'X'}: {count:>10} {bar}")
+
+    openers = stats["openers"]
+    lines.append("Most common openers:")
+    for g in np.argsort(-openers, kind="stable")[:top]:
+        if openers[g]:
+            lines.append(f"  {guesses[g]} {int(openers[g])}")
+
+    plays = stats["plays"]
+    played = np.flatnonzero(plays)
+    means = stats["guess_totals"][played] / plays[played]
+    lines.append("Hardest answers (mean guesses, a failure counts as "
+                 f"{FAIL_GUESSES}):")
+    for i in np.argsort(-means, kind="stable")[:top]:
+        a = played[i]
+        lines.append(f"  {answers[a]} {means[i]:.2f} over {int(plays[a])} games, "
+                     f"{int(stats['failures'][a])} failed")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    from wordle_dictionary import get_dictionary
+
+    parser = argparse.ArgumentParser(description="Report on a binary game log.")
+    parser.add_argument("directory", nargs="?", default=os.environ.get(LOG_ENV, "game_log"))
+    parser.add_argument("--top", type=int, default=10, help="openers and answers to list")
+    parser.add_argument("--chunk", type=int, default=1 << 16, help="records read at a time")
+    args = parser.parse_args(argv)
+
+    dictionary = get_dictionary()
+    start = time.perf_counter()
+    stats = analyse(args.directory, dictionary.digest, args.chunk)
+    elapsed = time.perf_counter() - start
+    print(report(stats, dictionary.answers, dictionary.guesses, args.top))
+    print(f"Scanned in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
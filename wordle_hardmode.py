@@ -0,0 +1,87 @@
+"""
+Hard mode: every revealed hint must be used in later guesses.
+
+HardModeConstraints is updated once per guess and summarises all feedback
+so far: fixed greens, minimum letter counts (greens + yellows), maximum
+counts (a gray letter caps the count, 0 means excluded) and banned
+positions (a yellow letter cannot be where it was yellow). Checking a new
+guess therefore costs O(word length), not a replay of the history.
+
+legal_bitset() gives the whole hard-mode-legal guess set at once, as a
+bitset from a WordIndex, for solvers that play under hard-mode rules.
+"""
+
+from wordle_score import CORRECT, WORD_LEN, states
+
+ORDINALS = ("1st", "2nd", "3rd", "4th", "5th")
+
+
+class HardModeConstraints:
+    __slots__ = ("greens", "min_counts", "max_counts", "banned")
+
+    def __init__(self):
+        self.greens = [None] * WORD_LEN
+        # letter -> count
+        self.min_counts = {}
+        self.max_counts = {}
+        # (position, letter) pairs
+        self.banned = set()
+
+    @property
+    def excluded(self):
+        """Letters known not to be in the answer."""
+        return {letter for letter, count in self.max_counts.items() if count == 0}
+
+    def update(self, guess, code):
+        found = {}
+        gray = set()
+        for pos, state in enumerate(states(code)):
+            letter = guess[pos]
+            if state == CORRECT:
+                self.greens[pos] = letter
+            else:
+                self.banned.add((pos, letter))
+            if state:
+                found[letter] = found.get(letter, 0) + 1
+            else:
+                gray.add(letter)
+        for letter, count in found.items():
+            if count > self.min_counts.get(letter, 0):
+                self.min_counts[letter] = count
+        for letter in gray:
+            self.max_counts[letter] = found.get(letter, 0)
+
+    def check(self, word):
+        """Return None if word uses every hint, otherwise the reason it does not."""
+        counts = {}
+        for pos, letter in enumerate(word):
+            green = self.greens[pos]
+            if green is not None and letter != green:
+                return f"{ORDINALS[pos]} letter must be {green.upper()}"
+            if (pos, letter) in self.banned:
+                return f"{letter.upper()} cannot be the {ORDINALS[pos]} letter"
+            counts[letter] = counts.get(letter, 0) + 1
+        for letter, count in self.min_counts.items():
+            if counts.get(letter, 0) < count:
+                return f"Guess must contain {letter.upper()}" + (f" {count} times" if count > 1 else "")
+        for letter, count in counts.items():
+            limit = self.max_counts.get(letter)
+            if limit is not None and count > limit:
+                if limit == 0:
+                    return f"{letter.upper()} is not in the word"
+                return f"{letter.upper()} is in the word only {limit} time" + ("s" if limit > 1 else "")
+        return None
+
+    def legal_bitset(self, index):
+        """Bitset over index.words of every word that passes check()."""
+        bits = index.all
+        for pos, letter in enumerate(self.greens):
+            if letter is not None:
+                bits &= index.at[pos][ord(letter) - 97]
+        for pos, letter in self.banned:
+            bits &= ~index.at[pos][ord(letter) - 97]
+        for letter, count in self.min_counts.items():
+            bits &= index.at_least[ord(letter) - 97][count]
+        for letter, count in self.max_counts.items():
+            bits &= ~index.at_least[ord(letter) - 97][count + 1]
+        return bits
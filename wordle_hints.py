@@ -0,0 +1,125 @@
+"""
+Hints computed off the GUI thread.
+
+HintWorker runs the analysis in an executor (by default a single worker
+process, so not even the GIL is shared with the Tk mainloop) and hands
+finished results back through a queue that the GUI polls with after().
+Every request gets a new generation number: request() and cancel() bump
+it, cancel the pending future if it has not started, and poll() drops any
+result of an older generation. A hint that is still being computed when
+the player types or submits is never shown; its worker is stopped and the
+next request starts a fresh one, so a stale ranking never holds up a newer
+hint behind it.
+
+analyse() and analyse_boards() are the computations themselves; they are
+module-level functions so a worker process can run them.
+"""
+
+import multiprocessing
+import queue
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from time import perf_counter_ns
+
+from wordle_metrics import observe, timed
+
+
+@timed("hint")
+def analyse(dictionary, history, candidates, guesses=None, top=5):
+    """{"remaining": n, "ranking": [(guess, bits), ...]} for one board of a game over dictionary."""
+    from wordle_patterns import matrix_for
+    from wordle_solver import rank_guesses
+
+    ranking = rank_guesses(history, top=top, patterns=matrix_for(dictionary), candidates=candidates, guesses=guesses)
+    return {"remaining": len(candidates), "ranking": ranking}
+
+
+@timed("hint")
+def analyse_boards(dictionary, candidate_sets, top=5):
+    """Same for a multi-board game, ranked by information summed over the boards."""
+    from wordle_patterns import matrix_for
+    from wordle_solver import rank_boards
+
+    ranking = rank_boards(candidate_sets, top=top, patterns=matrix_for(dictionary))
+    return {"remaining": sum(map(len, candidate_sets)), "ranking": ranking}
+
+
+def _default_executor():
+    # spawn, so the worker does not inherit the GUI's display connection
+    return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _stop(executor):
+    """Shut executor down without waiting, killing a worker process still busy with a stale hint."""
+    # ProcessPoolExecutor cannot cancel a call once it runs, its processes are terminated instead;
+    # a thread pool (as in the tests) just finishes the call with nobody waiting for it
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+class HintWorker:
+
+    def __init__(self, executor_factory=None):
+        """executor_factory() creates the executor on first use (default: one worker process)."""
+        self.executor_factory = executor_factory or _default_executor
+        self.executor = None
+        self.results = queue.Queue()
+        self.generation = 0
+        self.future = None
+        self.requested = 0
+
+    @property
+    def pending(self):
+        """True while a request of the current generation has no result yet."""
+        return self.future is not None
+
+    def request(self, func, *args):
+        """Start func(*args), replacing any earlier request. Returns its generation."""
+        self.cancel()
+        if self.executor is None:
+            self.executor = self.executor_factory()
+        generation = self.generation
+        self.requested = perf_counter_ns()
+        self.future = self.executor.submit(func, *args)
+        # runs in an executor thread, the GUI only ever reads the queue
+        self.future.add_done_callback(lambda future: self.results.put((generation, future)))
+        return generation
+
+    def cancel(self):
+        """Forget the current request; its result will be dropped."""
+        self.generation += 1
+        if self.future is not None:
+            if not self.future.cancel() and not self.future.done():
+                # already running, the worker is busy until it is stopped
+                _stop(self.executor)
+                self.executor = None
+            self.future = None
+
+    def poll(self):
+        """
+        The result of the current request if it has finished, else None.
+        Raises whatever the computation raised, or BrokenExecutor if the
+        worker died.
+        """
+        while True:
+            try:
+                generation, future = self.results.get_nowait()
+            except queue.Empty:
+                return None
+            if generation == self.generation and not future.cancelled():
+                self.future = None
+                observe("hint_wait", perf_counter_ns() - self.requested)
+                try:
+                    return future.result()
+                except BrokenExecutor:
+                    # the worker died; start a new one on the next request
+                    _stop(self.executor)
+                    self.executor = None
+                    raise
+
+    def close(self):
+        self.cancel()
+        if self.executor is not None:
+            _stop(self.executor)
+            self.executor = None
@@ -0,0 +1,95 @@
+"""
+Bitset index for filtering candidate words by feedback.
+
+A set of words is a Python int with bit i set for words[i]. The index
+precomputes, for every position and letter, the set of words with that
+letter there, and for every letter and k the set of words containing the
+letter at least k times. Narrowing a candidate set by one feedback is then
+a few AND / AND NOT operations on those ints, no compare() per word.
+"""
+
+from wordle_metrics import timed
+from wordle_score import CORRECT, WORD_LEN, states
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+
+class WordIndex:
+
+    def __init__(self, words):
+        self.words = tuple(words)
+        self.all = (1 << len(self.words)) - 1
+
+        n_bytes = (len(self.words) + 7) // 8
+        at = [[bytearray(n_bytes) for _ in ALPHABET] for _ in range(WORD_LEN)]
+        at_least = [[bytearray(n_bytes) for _ in range(WORD_LEN + 2)] for _ in ALPHABET]
+        for i, word in enumerate(self.words):
+            byte, bit = divmod(i, 8)
+            mask = 1 << bit
+            counts = {}
+            for pos, letter in enumerate(word):
+                l = ord(letter) - 97
+                at[pos][l][byte] |= mask
+                counts[l] = counts.get(l, 0) + 1
+            for l, count in counts.items():
+                for k in range(1, count + 1):
+                    at_least[l][k][byte] |= mask
+
+        # at[pos][letter]: words with letter at pos
+        self.at = [[int.from_bytes(b, "little") for b in row] for row in at]
+        # at_least[letter][k]: words with letter at least k times
+        self.at_least = [[int.from_bytes(b, "little") for b in row] for row in at_least]
+        for row in self.at_least:
+            row[0] = self.all
+
+    @timed("filter")
+    def filter(self, candidates, guess, code):
+        """Return the candidates that would give feedback code for guess."""
+        bits = candidates
+        found = {}
+        gray = []
+        for pos, state in enumerate(states(code)):
+            l = ord(guess[pos]) - 97
+            if state == CORRECT:
+                bits &= self.at[pos][l]
+            else:
+                bits &= ~self.at[pos][l]
+            if state:
+                found[l] = found.get(l, 0) + 1
+            else:
+                gray.append(l)
+
+        for l, k in found.items():
+            bits &= self.at_least[l][k]
+        for l in gray:
+            # a gray letter caps the count at the number of green/yellow copies
+            bits &= ~self.at_least[l][found.get(l, 0) + 1]
+        return bits
+
+    def filter_history(self, history, candidates=None):
+        """Apply every (guess, code) of history, starting from all words."""
+        bits = self.all if candidates is None else candidates
+        for guess, code in history:
+            bits = self.filter(bits, guess, code)
+        return bits
+
+    def bits_of(self, indices):
+        """Bitset of the given word indices."""
+        b = bytearray((len(self.words) + 7) // 8)
+        for i in indices:
+            b[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(b, "little")
+
+    @staticmethod
+    def indices(bits):
+        """Word indices in a bitset, ascending."""
+        return [i for i, bit in enumerate(reversed(bin(bits)[2:])) if bit == "1"]
+
+    def members(self, bits):
+        """Words in a bitset, in index order."""
+        words = self.words
+        return [words[i] for i in self.indices(bits)]
+
+    @staticmethod
+    def count(bits):
+        return bits.bit_count()
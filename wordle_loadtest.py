@@ -0,0 +1,209 @@
+"""
+Load generator for wordle_server.
+
+Spawns N async clients that each play full games over the line protocol,
+guessing random words from wordle_ord.txt, at an optional overall request
+rate. Reports throughput, p50/p95/p99 GUESS latency and error counts, and
+can write the report as JSON so runs can be compared over time.
+
+python wordle_loadtest.py --spawn --clients 200 --duration 10 --output run.json
+python wordle_loadtest.py --port 8765 --clients 50 --games 20 --rate 2000
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from wordle_dictionary import get_dictionary
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    n = len(sorted_values)
+    # the smallest value with at least p% of the values at or below it; p * n first keeps it exact
+    rank = math.ceil(p * n / 100)
+    return sorted_values[min(max(rank, 1), n) - 1]
+
+
+class Pacer:
+    """Spaces requests of all clients evenly at rate per second (None = unlimited)."""
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate else 0
+        self.next = time.perf_counter()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        now = time.perf_counter()
+        slot = max(self.next, now)
+        self.next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class LoadStats:
+
+    def __init__(self):
+        self.latencies = []
+        # games that ended WON or LOST, and games given up after an error reply
+        self.games = 0
+        self.aborted = 0
+        self.errors = 0
+        self.error_messages = {}
+
+    def error(self, message):
+        self.errors += 1
+        self.error_messages[message] = self.error_messages.get(message, 0) + 1
+
+    def report(self, elapsed):
+        latencies = sorted(self.latencies)
+        ms = lambda v: None if v is None else round(v * 1000, 3)
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "games": self.games,
+            "aborted_games": self.aborted,
+            "guesses": len(latencies),
+            "throughput_guesses_per_s": round(len(latencies) / elapsed, 1) if elapsed else None,
+            "latency_ms": {
+                "p50": ms(percentile(latencies, 50)),
+                "p95": ms(percentile(latencies, 95)),
+                "p99": ms(percentile(latencies, 99)),
+                "max": ms(latencies[-1] if latencies else None),
+            },
+            "errors": self.errors,
+            "error_messages": self.error_messages,
+        }
+
+
+async def client(host, port, words, stats, pacer, deadline, games, rng):
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError as e:
+        stats.error(f"connect: {e.__class__.__name__}")
+        return
+
+    async def request(line):
+        writer.write(line.encode("ascii") + b"\n")
+        await writer.drain()
+        reply = await reader.readline()
+        if not reply:
+            raise ConnectionError("server closed the connection")
+        return reply.decode("ascii").split()
+
+    played = 0
+    try:
+        while played != games and time.perf_counter() < deadline:
+            reply = await request("NEW")
+            if reply[0] != "OK":
+                stats.error(" ".join(reply))
+                break
+            status = "IN_PROGRESS"
+            while status == "IN_PROGRESS":
+                await pacer.wait()
+                start = time.perf_counter()
+                reply = await request("GUESS " + rng.choice(words))
+                stats.latencies.append(time.perf_counter() - start)
+                if reply[0] != "OK":
+                    stats.error(" ".join(reply[:3]))
+                    status = None
+                    break
+                status = reply[3]
+            played += 1
+            if status in ("WON", "LOST"):
+                stats.games += 1
+            else:
+                stats.aborted += 1
+        await request("QUIT")
+    except (ConnectionError, asyncio.IncompleteReadError) as e:
+        stats.error(f"connection: {e}")
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, clients=10, duration=None, games=None, rate=None, seed=0):
+    """
+    Run the clients until duration seconds have passed or each client has
+    played games games (at least one of the two must be given).
+    """
+    if duration is None and games is None:
+        raise ValueError("give a duration or a number of games per client")
+    words = list(get_dictionary().answers)
+    stats = LoadStats()
+    pacer = Pacer(rate)
+    start = time.perf_counter()
+    deadline = start + duration if duration else float("inf")
+    await asyncio.gather(*(
+        client(host, port, words, stats, pacer, deadline, games if games else -1, random.Random(seed + i))
+        for i in range(clients)
+    ))
+    report = stats.report(time.perf_counter() - start)
+    report["config"] = {"clients": clients, "duration": duration, "games": games, "rate": rate}
+    return report
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def spawn_server(port):
+    """Start wordle_server.py in a subprocess and wait until it accepts connections."""
+    server = subprocess.Popen(
+        [sys.executable, str(Path(__file__).with_name("wordle_server.py")), "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+    )
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise RuntimeError("server did not start")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test a Wordle server on localhost.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--spawn", action="store_true", help="start a server subprocess on a free port")
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--duration", type=float, help="seconds to run")
+    parser.add_argument("--games", type=int, help="games per client")
+    parser.add_argument("--rate", type=float, help="total GUESS requests per second")
+    parser.add_argument("--output", help="also write the report as JSON to this file")
+    args = parser.parse_args(argv)
+    if args.duration is None and args.games is None:
+        args.duration = 10.0
+
+    server = None
+    if args.spawn:
+        args.host, args.port = "127.0.0.1", _free_port()
+        server = spawn_server(args.port)
+    try:
+        report = asyncio.run(run_load(args.host, args.port, args.clients, args.duration, args.games, args.rate))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    report["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Optional instrumentation of the hot paths: a latency histogram per stage
+and a few event counters, exported in the Prometheus text format.
+
+Set WORDLE_METRICS=1 to turn it on. It is decided once, when the modules
+are imported: with it off, timed() hands back the undecorated function,
+so the instrumented stages cost nothing at all. Stages may nest (a guess
+includes its validation, scoring and filtering):
+
+    guess            GameSession.submit / MultiBoardSession.submit
+    validate         is the word allowed (and legal in hard mode)
+    score            feedback code of a guess
+    filter           narrowing the candidate answers
+    compare          terminal scoring and rendering of a guess
+    check_word       Tkinter Enter handler, the whole guess
+    render_labels    Tkinter grid update
+    render_keyboard  Tkinter keyboard update
+    hint             computing a hint, where it runs
+    hint_wait        request to result of a background hint
+    dictionary_load  reading the word lists
+
+With metrics on they are written at exit, to $WORDLE_METRICS_FILE or
+stderr, and on SIGUSR1 where there is one; the server also serves them at
+GET /metrics. dump() writes them at any time. stdout is only used when
+asked for with WORDLE_METRICS_FILE=-, since it carries the data of
+--eval, the simulator summary and the load test report.
+
+WORDLE_PROFILE=FILE (or --profile FILE in the terminal) runs the next game
+under cProfile and writes the stats to FILE: python -m pstats FILE
+
+WORDLE_METRICS=1 WORDLE_METRICS_FILE=wordle.prom python wordle_tkinter.py
+"""
+
+import _thread
+import os
+import sys
+from bisect import bisect_left
+from time import perf_counter_ns
+
+METRICS_ENV = "WORDLE_METRICS"
+METRICS_FILE_ENV = "WORDLE_METRICS_FILE"
+PROFILE_ENV = "WORDLE_PROFILE"
+ENABLED = os.environ.get(METRICS_ENV, "") not in ("", "0")
+
+# upper bucket bounds in ns, 1 us to 2.5 s; one more bucket counts everything slower
+BUCKETS_NS = tuple(int(m * 10 ** e) for e in range(3, 10) for m in (1, 2.5, 5))[:-1]
+
+_histograms = {}
+_counters = {}
+# _thread rather than threading: every wordle module imports this one, and
+# threading would bring functools and weakref into all of them
+_lock = _thread.allocate_lock()
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "lock")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_NS) + 1)
+        self.total = 0
+        self.lock = _thread.allocate_lock()
+
+    def observe(self, ns):
+        i = bisect_left(BUCKETS_NS, ns)
+        with self.lock:
+            self.counts[i] += 1
+            self.total += ns
+
+
+def histogram(stage):
+    """The histogram of stage, created on first use."""
+    with _lock:
+        found = _histograms.get(stage)
+        if found is None:
+            found = _histograms[stage] = Histogram()
+        return found
+
+
+def timed(stage):
+    """Decorator timing every call of a function as stage; the function itself when disabled."""
+    if not ENABLED:
+        return lambda func: func
+    import functools
+
+    observe = histogram(stage).observe
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(perf_counter_ns() - start)
+        return wrapper
+    return decorate
+
+
+def observe(stage, ns):
+    """Record one duration of stage measured elsewhere, in ns."""
+    if ENABLED:
+        histogram(stage).observe(ns)
+
+
+def count(event, n=1):
+    """Add n to the counter of event."""
+    if ENABLED:
+        with _lock:
+            _counters[event] = _counters.get(event, 0) + n
+
+
+def reset():
+    """Zero everything, keeping the histograms timed() functions hold."""
+    with _lock:
+        for h in _histograms.values():
+            with h.lock:
+                h.counts = [0] * len(h.counts)
+                h.total = 0
+        _counters.clear()
+
+
+def render():
+    """Every histogram and counter in the Prometheus text format."""
+    # no locks, this also runs from a signal handler that may have interrupted observe()
+    lines = []
+    if _histograms:
+        lines.append("# HELP wordle_stage_seconds Time spent per call, by stage.")
+        lines.append("# TYPE wordle_stage_seconds histogram")
+    for stage, h in sorted(_histograms.items()):
+        counts, total = list(h.counts), h.total
+        cumulative = 0
+        for bound, n in zip(BUCKETS_NS, counts):
+            cumulative += n
+            lines.append(f'wordle_stage_seconds_bucket{{stage="{stage}",le="{bound / 1e9:g}"}} {cumulative}')
+        cumulative += counts[-1]
+        lines.append(f'wordle_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {cumulative}')
+        lines.append(f'wordle_stage_seconds_sum{{stage="{stage}"}} {total / 1e9!r}')
+        lines.append(f'wordle_stage_seconds_count{{stage="{stage}"}} {cumulative}')
+    if _counters:
+        lines.append("# HELP wordle_events_total Events counted on the hot paths.")
+        lines.append("# TYPE wordle_events_total counter")
+    for event, n in sorted(_counters.items()):
+        lines.append(f'wordle_events_total{{event="{event}"}} {n}')
+    return "".join(line + "\n" for line in lines)
+
+
+def dump(path=None):
+    """Write render() to path, default $WORDLE_METRICS_FILE, or stderr for neither ("-" is stdout)."""
+    path = path or os.environ.get(METRICS_FILE_ENV)
+    text = render()
+    if path in (None, "-"):
+        stream = sys.stdout if path == "-" else sys.stderr
+        stream.write(text)
+        stream.flush()
+        return
+    # a node exporter may scrape the file at any moment, it must not find half a dump
+    from wordle_files import write_atomic
+
+    write_atomic(path, text.encode())
+
+
+def _dump_at_exit():
+    # worker processes of a spawn pool run this too, only the parent writes
+    if sys.modules["__main__"].__name__ == "__mp_main__":
+        return
+    try:
+        dump()
+    except (OSError, ValueError):
+        # e.g. stdout already closed
+        pass
+
+
+def _install():
+    import atexit
+    import signal
+    import threading
+
+    atexit.register(_dump_at_exit)
+    if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGUSR1, lambda signum, frame: _dump_at_exit())
+
+
+class GameProfile:
+    """cProfile over one game: start() as it begins, stop() as it ends writes the stats to path."""
+
+    def __init__(self, path):
+        import cProfile
+
+        self.path = os.fspath(path)
+        self.profiler = cProfile.Profile()
+        self.running = False
+        self.done = False
+
+    def start(self):
+        """Start profiling, unless the game was already captured."""
+        if not self.running and not self.done:
+            self.profiler.enable()
+            self.running = True
+
+    def stop(self):
+        if self.running:
+            self.profiler.disable()
+            self.running = False
+            self.done = True
+            self.profiler.dump_stats(self.path)
+
+
+def game_profile(path=None):
+    """GameProfile writing to path (default: $WORDLE_PROFILE), None if neither is set."""
+    path = path or os.environ.get(PROFILE_ENV)
+    return GameProfile(path) if path else None
+
+
+if ENABLED:
+    _install()
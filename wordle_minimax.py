@@ -0,0 +1,233 @@
+"""
+Worst-case (minimax) solver.
+
+Where wordle_solver maximizes the expected information of the next guess,
+this solver minimizes the number of guesses needed in the worst case:
+
+    cost(C) = 1                                    if C has one answer
+    cost(C) = 1 + min over guesses g of
+              max over feedback codes of cost(C split by g)
+
+(the ALL_CORRECT bucket costs nothing more). The search is depth limited
+and iteratively deepened: search(C, limit) either finds a strategy within
+limit guesses or proves (for the guesses it considers) that there is none.
+Guesses are ordered by their largest bucket, counted with the same
+bincount pass as wordle_solver.entropies, and a guess is abandoned as soon
+as one of its buckets cannot be solved within the best bound found so far.
+
+Results are stored in a transposition table keyed on a hash of the
+candidate bitset, so a candidate set reached through different guesses is
+solved once. The table is an LRU capped by an estimate of its memory use.
+
+width limits the guesses tried per node to the best few by largest
+bucket. The costs found are then upper bounds given by real strategies;
+width=None tries every guess that splits the candidates and gives exact
+worst cases (a proof), which is only practical for small candidate sets.
+
+python wordle_minimax.py --width 20 [guess code ...]
+"""
+
+import argparse
+import hashlib
+import sys
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from wordle_patterns import get_matrix
+from wordle_score import ALL_CORRECT
+from wordle_solver import bucket_counts, candidate_mask
+
+# no strategy within the limit
+FAIL = float("inf")
+# rough bytes per table entry: 16 byte key, tuple, OrderedDict link
+ENTRY_BYTES = 200
+
+
+class TranspositionTable:
+    """LRU map from a candidate-set key to (cost, exact, guess)."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max(1, max_bytes // ENTRY_BYTES)
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+
+class SearchStats:
+    """Counters of one solve() call, with nodes and seconds per depth limit."""
+
+    def __init__(self):
+        self.nodes = 0
+        self.cutoffs = 0
+        self.depth_nodes = {}
+        self.depth_seconds = {}
+
+    def summary(self, table):
+        return {
+            "nodes": self.nodes,
+            "cutoffs": self.cutoffs,
+            "table_hits": table.hits,
+            "table_misses": table.misses,
+            "table_evictions": table.evictions,
+            "table_entries": len(table),
+            "depth_nodes": dict(self.depth_nodes),
+            "depth_seconds": {d: round(s, 4) for d, s in self.depth_seconds.items()},
+        }
+
+
+class MinimaxSolver:
+
+    def __init__(self, patterns=None, width=20, max_bytes=64 * 1024 * 1024):
+        self.patterns = patterns or get_matrix()
+        self.width = width
+        self.table = TranspositionTable(max_bytes)
+        self.stats = SearchStats()
+
+    def key(self, candidates):
+        """Hash of the candidate bitset over patterns.answers."""
+        mask = np.zeros(len(self.patterns.answers), dtype=bool)
+        mask[candidates] = True
+        return hashlib.blake2b(np.packbits(mask).tobytes(), digest_size=16).digest()
+
+    def ordered_guesses(self, candidates):
+        """
+        (guess indices, smallest largest bucket): guesses that split the
+        candidates, fewest worst-case answers left first, possible answers
+        first among equals.
+        """
+        n = len(candidates)
+        worst = np.empty(self.patterns.matrix.shape[0], dtype=np.int64)
+        for start, counts in bucket_counts(self.patterns.matrix, candidates):
+            worst[start:start + counts.shape[0]] = counts.max(axis=1)
+        not_candidate = np.ones(len(worst), dtype=bool)
+        not_candidate[candidates] = False
+        order = np.lexsort((not_candidate, worst))
+        order = order[worst[order] < n]
+        if self.width is not None:
+            order = order[:self.width]
+        return order, int(worst[order[0]])
+
+    def search(self, candidates, limit):
+        """(worst-case guesses, first guess) for these answer indices, or (FAIL, None) above limit."""
+        self.stats.nodes += 1
+        n = len(candidates)
+        if n == 1:
+            return (1, int(candidates[0])) if limit >= 1 else (FAIL, None)
+        if limit < 2:
+            return FAIL, None
+        if n == 2:
+            return 2, int(candidates[0])
+
+        key = self.key(candidates)
+        entry = self.table.get(key)
+        if entry is not None:
+            cost, exact, guess = entry
+            if exact:
+                return (cost, guess) if cost <= limit else (FAIL, None)
+            if cost > limit:
+                # an earlier search already failed with at least this limit
+                return FAIL, None
+
+        guesses, smallest_worst = self.ordered_guesses(candidates)
+        # two guesses are only enough if some guess leaves single answers
+        lower = 2 if smallest_worst == 1 else 3
+        best, best_guess = FAIL, None
+        if lower <= limit:
+            for guess in guesses:
+                cost = self.evaluate(int(guess), candidates, min(best - 1, limit))
+                if cost < best:
+                    best, best_guess = cost, int(guess)
+                    if best == lower:
+                        break
+
+        if best <= limit:
+            self.table.put(key, (best, True, best_guess))
+            return best, best_guess
+        self.table.put(key, (limit + 1, False, None))
+        return FAIL, None
+
+    def evaluate(self, guess, candidates, limit):
+        """Worst case of playing guess first, FAIL if it needs more than limit."""
+        row = np.asarray(self.patterns.matrix[guess, candidates])
+        counts = np.bincount(row, minlength=ALL_CORRECT + 1)
+        worst = 1
+        # biggest buckets first, they are the most likely to exceed the limit
+        for code in np.argsort(-counts, kind="stable"):
+            if counts[code] == 0:
+                break
+            if code == ALL_CORRECT:
+                continue
+            cost, _ = self.search(candidates[row == code], limit - 1)
+            if cost == FAIL:
+                self.stats.cutoffs += 1
+                return FAIL
+            worst = max(worst, 1 + cost)
+        return worst
+
+    def solve(self, candidates=None, max_depth=6):
+        """
+        Iteratively deepen from 1 to max_depth guesses. Returns (worst case,
+        first guess) for the answer indices (default all answers), or
+        (FAIL, None) if no strategy was found within max_depth.
+        """
+        if candidates is None:
+            candidates = np.arange(len(self.patterns.answers))
+        candidates = np.sort(np.asarray(candidates, dtype=np.intp))
+        self.stats = SearchStats()
+        for limit in range(1, max_depth + 1):
+            start = time.perf_counter()
+            nodes = self.stats.nodes
+            cost, guess = self.search(candidates, limit)
+            self.stats.depth_nodes[limit] = self.stats.nodes - nodes
+            self.stats.depth_seconds[limit] = time.perf_counter() - start
+            if cost != FAIL:
+                return cost, guess
+        return FAIL, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Minimize the worst-case number of guesses.")
+    parser.add_argument("history", nargs="*", help="guess code pairs played so far")
+    parser.add_argument("--width", type=int, default=20, help="guesses tried per node, 0 for all")
+    parser.add_argument("--depth", type=int, default=6, help="maximum number of guesses")
+    parser.add_argument("--memory-mb", type=int, default=64, help="transposition table cap")
+    args = parser.parse_args(argv)
+
+    solver = MinimaxSolver(width=args.width or None, max_bytes=args.memory_mb * 1024 * 1024)
+    history = [(args.history[i], int(args.history[i + 1])) for i in range(0, len(args.history) - 1, 2)]
+    candidates = np.flatnonzero(candidate_mask(solver.patterns, history))
+    if len(candidates) == 0:
+        sys.exit("No word matches the feedback given so far")
+    cost, guess = solver.solve(candidates, args.depth)
+    if cost == FAIL:
+        print(f"No strategy within {args.depth} guesses for {len(candidates)} answers")
+    else:
+        print(f"{solver.patterns.guesses[guess]} solves {len(candidates)} answers in at most {cost} guesses")
+    for name, value in solver.stats.summary(solver.table).items():
+        print(f"{name:16} {value}")
+
+
+if __name__ == "__main__":
+    main()
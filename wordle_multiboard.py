@@ -0,0 +1,118 @@
+"""
+Multi-board games (Quordle, Octordle, ...): every guess plays on K boards.
+
+MultiBoardSession is the K-board counterpart of wordle_session.GameSession:
+K answers, K + 5 attempts, and a board is done once its answer has been
+guessed. Each guess is scored against the answers of all boards still in
+play with one score_batch() call, and every board narrows its own
+candidate bitset with dictionary.index.
+
+State is kept compact like GameSession's: answer and guess indices in
+array('H'), and K feedback codes per guess in one bytearray, with SOLVED
+for boards that were already done.
+"""
+
+import random
+from array import array
+
+from wordle_metrics import count, timed
+from wordle_patterns import encode_words, encoded_answers, score_batch
+from wordle_score import ALL_CORRECT
+from wordle_session import IN_PROGRESS, LOST, WON, InvalidGuess
+
+BOARD_COUNTS = (2, 4, 8, 16)
+EXTRA_ATTEMPTS = 5
+# stored instead of a code for boards solved by an earlier guess
+SOLVED = 255
+
+
+class MultiBoardSession:
+    __slots__ = ("dictionary", "answers", "guesses", "codes", "solved", "status", "candidates", "max_attempts")
+
+    def __init__(self, dictionary, boards=4, rng=random, answers=None):
+        """answers are K distinct indices into dictionary.answers, random if None."""
+        self.dictionary = dictionary
+        if answers is None:
+            answers = rng.sample(range(len(dictionary.answers)), boards)
+        self.answers = array("H", answers)
+        self.guesses = array("H")
+        self.codes = bytearray()
+        # per board: the attempt that solved it, 0 while unsolved
+        self.solved = bytearray(len(self.answers))
+        self.status = IN_PROGRESS
+        self.candidates = [dictionary.index.all] * len(self.answers)
+        self.max_attempts = len(self.answers) + EXTRA_ATTEMPTS
+
+    @property
+    def boards(self):
+        return len(self.answers)
+
+    @property
+    def answer_words(self):
+        return [self.dictionary.answers[a] for a in self.answers]
+
+    @property
+    def attempts(self):
+        return len(self.guesses)
+
+    @property
+    def attempts_left(self):
+        return self.max_attempts - len(self.guesses)
+
+    @property
+    def remaining(self):
+        """Answers still possible, summed over the unsolved boards."""
+        return sum(self.remaining_by_board())
+
+    def remaining_by_board(self):
+        return [0 if solved else bits.bit_count() for bits, solved in zip(self.candidates, self.solved)]
+
+    def active_boards(self):
+        return [b for b, solved in enumerate(self.solved) if not solved]
+
+    def possible_answers(self, board):
+        return self.dictionary.index.members(self.candidates[board])
+
+    def candidate_indices(self, board):
+        return self.dictionary.index.indices(self.candidates[board])
+
+    def history(self):
+        """[(guess, (code or None per board)), ...]; None for boards already solved."""
+        guesses = self.dictionary.guesses
+        k = self.boards
+        return [
+            (guesses[g], tuple(None if c == SOLVED else c for c in self.codes[i * k:(i + 1) * k]))
+            for i, g in enumerate(self.guesses)
+        ]
+
+    def board_history(self, board):
+        """[(guess, code), ...] of one board, up to the guess that solved it."""
+        return [(guess, codes[board]) for guess, codes in self.history() if codes[board] is not None]
+
+    @timed("guess")
+    def submit(self, word):
+        """Score a guess on every unsolved board. Returns (codes, status), raises InvalidGuess."""
+        if self.status != IN_PROGRESS:
+            raise InvalidGuess("The game is over")
+        index = self.dictionary.guess_index.get(word)
+        if index is None:
+            count("invalid_guess")
+            raise InvalidGuess(f"{word!r} is not a valid word")
+
+        active = self.active_boards()
+        encoded = encoded_answers(self.dictionary)
+        scored = score_batch(encode_words([word]), encoded[[self.answers[b] for b in active]])[0]
+        codes = [SOLVED] * self.boards
+        self.guesses.append(index)
+        for b, code in zip(active, scored.tolist()):
+            codes[b] = code
+            self.candidates[b] = self.dictionary.index.filter(self.candidates[b], word, code)
+            if code == ALL_CORRECT:
+                self.solved[b] = len(self.guesses)
+        self.codes.extend(codes)
+
+        if all(self.solved):
+            self.status = WON
+        elif len(self.guesses) >= self.max_attempts:
+            self.status = LOST
+        return tuple(None if c == SOLVED else c for c in codes), self.status
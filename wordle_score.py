@@ -0,0 +1,91 @@
+"""
+Scoring core shared by the terminal and Tkinter versions.
+
+A guess is scored against the answer as one integer feedback code in the
+range 0..242, one base-3 digit per letter (first letter = lowest digit):
+
+    0 - INCORRECT     letter is not in the word (gray)
+    1 - HALF_CORRECT  letter is in the word, wrong position (yellow)
+    2 - CORRECT       letter is in the correct position (green)
+
+Coloring is a separate step: states() turns a code back into per-letter
+states and render() maps them through a style table (ANSI, Tk colors, ...).
+"""
+
+WORD_LEN = 5
+
+INCORRECT = 0
+HALF_CORRECT = 1
+CORRECT = 2
+
+NUM_PATTERNS = 3 ** WORD_LEN
+ALL_CORRECT = NUM_PATTERNS - 1
+
+_WEIGHTS = tuple(3 ** i for i in range(WORD_LEN))
+_GREEN = tuple(CORRECT * w for w in _WEIGHTS)
+
+
+def score(guess, answer):
+    """
+    Return the feedback code of guess against answer.
+
+    Green letters are removed from a per-letter count table of the answer,
+    yellow letters then consume from that table left to right, so repeated
+    letters are only marked as often as they occur in the answer.
+    """
+    code = 0
+    counts = {}
+    for i in range(WORD_LEN):
+        letter = answer[i]
+        if guess[i] == letter:
+            code += _GREEN[i]
+        else:
+            counts[letter] = counts.get(letter, 0) + 1
+
+    if counts:
+        for i in range(WORD_LEN):
+            letter = guess[i]
+            if letter != answer[i] and counts.get(letter):
+                counts[letter] -= 1
+                code += _WEIGHTS[i]
+    return code
+
+
+def _decode(code):
+    digits = []
+    for _ in range(WORD_LEN):
+        code, digit = divmod(code, 3)
+        digits.append(digit)
+    return tuple(digits)
+
+
+_STATES = tuple(_decode(code) for code in range(NUM_PATTERNS))
+
+
+def states(code):
+    """Return the per-letter states (INCORRECT/HALF_CORRECT/CORRECT) of a code."""
+    return _STATES[code]
+
+
+def encode(letter_states):
+    """Inverse of states(): pack per-letter states into a feedback code."""
+    return sum(state * weight for state, weight in zip(letter_states, _WEIGHTS))
+
+
+PATTERN_CHARS = "-YG"
+_PATTERN_STRINGS = tuple("".join(PATTERN_CHARS[state] for state in digits) for digits in _STATES)
+
+
+def pattern_string(code):
+    """Compact text form of a code, e.g. "-YG--" (gray, yellow, green)."""
+    return _PATTERN_STRINGS[code]
+
+
+def render(guess, code, styles):
+    """
+    Render a scored guess.
+
+    styles is indexed by letter state and holds a function that formats a
+    single letter, e.g. (incorrect_letter, correct_letter, correct_place).
+    """
+    return "".join(styles[state](letter) for letter, state in zip(guess, _STATES[code]))
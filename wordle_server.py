@@ -0,0 +1,373 @@
+"""
+Asyncio game server: many independent games in one event loop.
+
+Line protocol over TCP, one game per connection:
+
+    NEW [HARD]          -> OK NEW <attempts>
+    GUESS <word>        -> OK <pattern> <code> IN_PROGRESS|WON|LOST <attempts left> [answer]
+    HINT                -> OK HINT <remaining> <guess> <guess> ...
+    QUIT                -> BYE
+    anything else       -> ERR <message>
+
+<pattern> is wordle_score.pattern_string(), e.g. "-YG--". With --http-port
+the same games are also offered as JSON over a minimal HTTP/1.1 endpoint:
+
+    POST /new    {"hard": true} (optional)   -> {"session": id, ...}
+    POST /guess  {"session": id, "word": w}  -> {"pattern": ..., "status": ...}
+    GET  /hint?session=id                    -> {"remaining": n, "guesses": [...]}
+    GET  /metrics                            -> Prometheus text (see wordle_metrics)
+
+Connections and HTTP sessions idle for longer than --idle-timeout are
+dropped. Lines and request bodies are size-limited, and every write waits
+for the transport to drain (with a timeout), so a slow client only ever
+holds a small, bounded buffer.
+
+python wordle_server.py --port 8765 --http-port 8080
+"""
+
+import argparse
+import asyncio
+import json
+import secrets
+import time
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from wordle_dictionary import get_dictionary
+from wordle_hardmode import HardModeConstraints
+from wordle_metrics import render, timed
+from wordle_score import pattern_string
+from wordle_session import IN_PROGRESS, LOST, WON, GameSession, InvalidGuess
+
+STATUS_NAMES = {IN_PROGRESS: "IN_PROGRESS", WON: "WON", LOST: "LOST"}
+
+MAX_LINE = 256
+MAX_BODY = 4096
+WRITE_BUFFER_HIGH = 16 * 1024
+HINT_COUNT = 5
+# all hosted games share one stats profile
+STATS_PROFILE = "server"
+
+
+class ProtocolError(Exception):
+    """A request the server answers with an error instead of a result."""
+
+
+def guess_result(session, word):
+    try:
+        code, status = session.submit(word)
+    except InvalidGuess as e:
+        raise ProtocolError(str(e))
+    result = {
+        "pattern": pattern_string(code),
+        "code": code,
+        "status": STATUS_NAMES[status],
+        "attempts_left": session.attempts_left,
+        "remaining": session.remaining,
+    }
+    if status != IN_PROGRESS:
+        result["answer"] = session.answer_word
+    return result
+
+
+def hint_snapshot(session):
+    """
+    (dictionary, history, candidate bitset, hard mode) of a session. Taken
+    on the event loop and immutable, so a guess for the same session that
+    is handled while the hint runs cannot change what the worker reads.
+    """
+    return session.dictionary, session.history(), session.candidates, session.hard is not None
+
+
+@timed("hint")
+def hint_result(dictionary, history, candidates, hard):
+    """Solver hint for a hint_snapshot(), run in a worker thread since a ranking takes ~0.3 s."""
+    from wordle_tree import tree_guess
+
+    remaining = candidates.bit_count()
+    # the tree ignores hard-mode rules
+    guess = None if hard else tree_guess(dictionary, history)
+    if guess:
+        return {"remaining": remaining, "guesses": [guess]}
+    try:
+        from wordle_patterns import matrix_for
+        from wordle_solver import rank_guesses
+    except ImportError:
+        raise ProtocolError("hints need numpy")
+    guesses = None
+    if hard:
+        # rebuilt from the history rather than read from the live session
+        constraints = HardModeConstraints()
+        for word, code in history:
+            constraints.update(word, code)
+        index = dictionary.guess_word_index
+        guesses = index.indices(constraints.legal_bitset(index))
+    try:
+        ranking = rank_guesses(history, top=HINT_COUNT, patterns=matrix_for(dictionary),
+                               candidates=dictionary.index.indices(candidates), guesses=guesses)
+    except (KeyError, ValueError):
+        raise ProtocolError("no hint available")
+    return {"remaining": remaining, "guesses": [guess for guess, _ in ranking]}
+
+
+class GameServer:
+
+    def __init__(self, dictionary=None, idle_timeout=300.0, write_timeout=10.0, max_sessions=100_000, stats=None):
+        """stats is an optional wordle_stats.StatsStore that finished games are queued to."""
+        self.dictionary = dictionary or get_dictionary()
+        self.stats = stats
+        self.idle_timeout = idle_timeout
+        self.write_timeout = write_timeout
+        self.max_sessions = max_sessions
+        # HTTP sessions: id -> [session, last used]
+        self.sessions = {}
+        self.connections = 0
+        self._servers = []
+
+    def new_session(self, hard_mode=False):
+        return GameSession(self.dictionary, hard_mode=hard_mode)
+
+    def guess(self, session, word):
+        result = guess_result(session, word)
+        if self.stats is not None and session.status != IN_PROGRESS:
+            # only a queue put, the store commits in its own thread
+            self.stats.record_session(session, profile=STATS_PROFILE)
+        return result
+
+    async def hint(self, session):
+        if session.status != IN_PROGRESS:
+            raise ProtocolError("the game is over")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, hint_result, *hint_snapshot(session))
+
+    async def send(self, writer, data):
+        writer.write(data)
+        # backpressure: wait until the client has read what we sent
+        await asyncio.wait_for(writer.drain(), self.write_timeout)
+
+    # --- line protocol ---
+
+    async def handle_command(self, state, line):
+        command, _, arg = line.strip().partition(" ")
+        command = command.upper()
+        if command == "NEW":
+            mode = arg.strip().upper()
+            if mode not in ("", "HARD"):
+                raise ProtocolError(f"unknown mode {mode!r}")
+            state[0] = self.new_session(hard_mode=mode == "HARD")
+            return f"OK NEW {state[0].max_attempts}"
+        if command == "QUIT":
+            return "BYE"
+        if state[0] is None:
+            raise ProtocolError("send NEW first")
+        if command == "GUESS":
+            result = self.guess(state[0], arg.strip().lower())
+            reply = "OK {pattern} {code} {status} {attempts_left}".format(**result)
+            if "answer" in result:
+                reply += " " + result["answer"]
+            return reply
+        if command == "HINT":
+            result = await self.hint(state[0])
+            return "OK HINT {} {}".format(result["remaining"], " ".join(result["guesses"]))
+        raise ProtocolError(f"unknown command {command!r}")
+
+    async def handle_client(self, reader, writer):
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_HIGH)
+        self.connections += 1
+        state = [None]
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    await self.send(writer, b"ERR idle timeout\n")
+                    break
+                except (ValueError, asyncio.LimitOverrunError):
+                    await self.send(writer, b"ERR line too long\n")
+                    break
+                if not line:
+                    break
+                try:
+                    reply = await self.handle_command(state, line.decode("ascii", "replace"))
+                except ProtocolError as e:
+                    reply = f"ERR {e}"
+                await self.send(writer, reply.encode("ascii", "replace") + b"\n")
+                if reply == "BYE":
+                    break
+        except (ConnectionError, asyncio.TimeoutError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    # --- HTTP/JSON ---
+
+    def expire_sessions(self):
+        deadline = time.monotonic() - self.idle_timeout
+        for key in [k for k, (_, used) in self.sessions.items() if used < deadline]:
+            del self.sessions[key]
+
+    def get_http_session(self, key):
+        entry = self.sessions.get(key)
+        if entry is None:
+            raise ProtocolError("unknown or expired session")
+        entry[1] = time.monotonic()
+        return entry[0]
+
+    async def handle_http_request(self, method, path, body):
+        url = urlsplit(path)
+        if method == "POST" and url.path == "/new":
+            if len(self.sessions) >= self.max_sessions:
+                self.expire_sessions()
+                if len(self.sessions) >= self.max_sessions:
+                    return HTTPStatus.SERVICE_UNAVAILABLE, {"error": "too many sessions"}
+            try:
+                hard_mode = json.loads(body or b"{}").get("hard", False)
+            except (ValueError, AttributeError):
+                raise ProtocolError("expected a JSON object")
+            # a real JSON boolean, "false" as a string would be truthy
+            if not isinstance(hard_mode, bool):
+                raise ProtocolError("hard must be true or false")
+            key = secrets.token_hex(8)
+            session = self.new_session(hard_mode=hard_mode)
+            self.sessions[key] = [session, time.monotonic()]
+            return HTTPStatus.OK, {"session": key, "attempts": session.max_attempts}
+        if method == "POST" and url.path == "/guess":
+            try:
+                data = json.loads(body or b"{}")
+                key, word = data["session"], data["word"]
+            except (ValueError, KeyError, TypeError):
+                raise ProtocolError("expected JSON with session and word")
+            # anything but strings would fail as a dict key or in validation, after the reply is due
+            if not isinstance(key, str) or not isinstance(word, str):
+                raise ProtocolError("expected JSON with session and word")
+            word = word.lower()
+            return HTTPStatus.OK, self.guess(self.get_http_session(key), word)
+        if method == "GET" and url.path == "/hint":
+            key = parse_qs(url.query).get("session", [""])[0]
+            return HTTPStatus.OK, await self.hint(self.get_http_session(key))
+        if method == "GET" and url.path == "/metrics":
+            # empty unless WORDLE_METRICS is set
+            return HTTPStatus.OK, render()
+        return HTTPStatus.NOT_FOUND, {"error": "not found"}
+
+    async def read_http_request(self, reader):
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        try:
+            method, path, _ = request_line.decode("ascii").split(" ", 2)
+        except ValueError:
+            raise ProtocolError("bad request line")
+        length = 0
+        keep_alive = True
+        while True:
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            if name == "content-length":
+                length = int(value.strip() or 0)
+            elif name == "connection":
+                keep_alive = value.strip().lower() != "close"
+        if length > MAX_BODY:
+            raise ProtocolError("request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method, path, body, keep_alive
+
+    async def handle_http(self, reader, writer):
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_HIGH)
+        self.connections += 1
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(self.read_http_request(reader), self.idle_timeout)
+                    if request is None:
+                        break
+                    method, path, body, keep_alive = request
+                    status, payload = await self.handle_http_request(method, path, body)
+                except ProtocolError as e:
+                    status, payload, keep_alive = HTTPStatus.BAD_REQUEST, {"error": str(e)}, False
+                except (ValueError, asyncio.LimitOverrunError):
+                    status, payload, keep_alive = HTTPStatus.BAD_REQUEST, {"error": "bad request"}, False
+                if isinstance(payload, str):
+                    data, content_type = payload.encode(), "text/plain; version=0.0.4"
+                else:
+                    data, content_type = json.dumps(payload).encode(), "application/json"
+                head = (
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                )
+                await self.send(writer, head.encode("ascii") + data)
+        except (ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _expire_loop(self):
+        while True:
+            await asyncio.sleep(min(self.idle_timeout, 60))
+            self.expire_sessions()
+
+    # --- running ---
+
+    async def start(self, host="127.0.0.1", port=8765, http_port=None):
+        """Start listening; returns the bound (host, port) of the line server."""
+        self.dictionary.guess_index  # load the word lists before the first client
+        server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE)
+        self._servers.append(server)
+        if http_port is not None:
+            http = await asyncio.start_server(self.handle_http, host, http_port, limit=MAX_LINE)
+            self._servers.append(http)
+            self._expire_task = asyncio.create_task(self._expire_loop())
+        return server.sockets[0].getsockname()[:2]
+
+    def http_address(self):
+        return self._servers[1].sockets[0].getsockname()[:2]
+
+    async def close(self):
+        if hasattr(self, "_expire_task"):
+            self._expire_task.cancel()
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+
+    async def serve_forever(self, **kwargs):
+        await self.start(**kwargs)
+        await asyncio.gather(*(server.serve_forever() for server in self._servers))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Host Wordle games over TCP and HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--http-port", type=int)
+    parser.add_argument("--idle-timeout", type=float, default=300.0)
+    parser.add_argument("--stats", metavar="FILE", help="keep statistics of finished games in this database")
+    args = parser.parse_args(argv)
+
+    stats = None
+    if args.stats:
+        from wordle_stats import StatsStore
+
+        stats = StatsStore(args.stats)
+    server = GameServer(idle_timeout=args.idle_timeout, stats=stats)
+    print(f"Wordle server on {args.host}:{args.port}"
+          + (f", HTTP on port {args.http_port}" if args.http_port else ""))
+    try:
+        asyncio.run(server.serve_forever(host=args.host, port=args.port, http_port=args.http_port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if stats is not None:
+            stats.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Game session: one game of Wordle as a pure state machine.
+
+submit() takes a guess and returns (feedback code, status); there is no
+input, printing or exiting, so one process can hold any number of games.
+The terminal and Tkinter versions, the simulator and the server are all
+thin adapters around it.
+
+State is kept compact: the answer as an index into dictionary.answers,
+guesses as indices into dictionary.guesses in an array('H') and feedback
+codes in a bytearray. The dictionary itself is shared by all sessions.
+
+Each session also tracks the answers still consistent with its feedback as
+a bitset over dictionary.answers, narrowed by dictionary.index after every
+guess, so the remaining count and the possible answers are available at
+any time without replaying the history.
+
+In hard mode (hard_mode=True) a HardModeConstraints object rejects guesses
+that ignore earlier hints. Subclasses can override feedback() to pick the
+answer differently, e.g. wordle_absurdle.
+"""
+
+import random
+from array import array
+
+from wordle_hardmode import HardModeConstraints
+from wordle_metrics import count, timed
+from wordle_score import ALL_CORRECT, score
+
+MAX_ATTEMPTS = 6
+
+IN_PROGRESS = 0
+WON = 1
+LOST = 2
+
+
+class InvalidGuess(ValueError):
+    """The guess is not an allowed word, or the game is already over."""
+
+
+class HardModeViolation(InvalidGuess):
+    """The guess is a valid word but does not use every revealed hint."""
+
+
+class GameSession:
+    __slots__ = ("dictionary", "answer", "guesses", "codes", "status", "candidates", "hard")
+
+    max_attempts = MAX_ATTEMPTS
+    # True where feedback() picks the answer as the game goes (Absurdle)
+    adversarial = False
+
+    def __init__(self, dictionary, answer=None, rng=random, hard_mode=False):
+        """answer is an index into dictionary.answers, random if None."""
+        self.dictionary = dictionary
+        if answer is None:
+            answer = rng.randrange(len(dictionary.answers))
+        self.answer = answer
+        self.guesses = array("H")
+        self.codes = bytearray()
+        self.status = IN_PROGRESS
+        self.candidates = dictionary.index.all
+        self.hard = HardModeConstraints() if hard_mode else None
+
+    @property
+    def answer_word(self):
+        return self.dictionary.answers[self.answer]
+
+    @property
+    def attempts(self):
+        return len(self.codes)
+
+    @property
+    def attempts_left(self):
+        return self.max_attempts - len(self.codes)
+
+    @property
+    def remaining(self):
+        """Number of answers still consistent with the feedback so far."""
+        return self.candidates.bit_count()
+
+    def possible_answers(self):
+        return self.dictionary.index.members(self.candidates)
+
+    def candidate_indices(self):
+        """Indices into dictionary.answers of the possible answers."""
+        return self.dictionary.index.indices(self.candidates)
+
+    def legal_guess_indices(self):
+        """Indices into dictionary.guesses allowed now (all guesses unless in hard mode)."""
+        index = self.dictionary.guess_word_index
+        if self.hard is None:
+            return range(len(index.words))
+        return index.indices(self.hard.legal_bitset(index))
+
+    def history(self):
+        """[(guess, code), ...] in the order they were submitted."""
+        guesses = self.dictionary.guesses
+        return [(guesses[g], c) for g, c in zip(self.guesses, self.codes)]
+
+    @timed("score")
+    def feedback(self, word):
+        """Feedback code of a valid guess (a subclass may choose the answer here)."""
+        return score(word, self.dictionary.answers[self.answer])
+
+    @timed("validate")
+    def validate(self, word):
+        """Index of word in dictionary.guesses if it may be played now, raises InvalidGuess."""
+        if self.status != IN_PROGRESS:
+            raise InvalidGuess("The game is over")
+        index = self.dictionary.guess_index.get(word)
+        if index is None:
+            count("invalid_guess")
+            raise InvalidGuess(f"{word!r} is not a valid word")
+        if self.hard is not None:
+            violation = self.hard.check(word)
+            if violation:
+                count("hard_mode_violation")
+                raise HardModeViolation(violation)
+        return index
+
+    @timed("guess")
+    def submit(self, word):
+        """Score a guess. Returns (code, status), raises InvalidGuess."""
+        index = self.validate(word)
+        code = self.feedback(word)
+        self.guesses.append(index)
+        self.codes.append(code)
+        self.candidates = self.dictionary.index.filter(self.candidates, word, code)
+        if self.hard is not None:
+            self.hard.update(word, code)
+        if code == ALL_CORRECT:
+            self.status = WON
+        elif len(self.codes) >= self.max_attempts:
+            self.status = LOST
+        return code, self.status
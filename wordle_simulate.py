@@ -0,0 +1,269 @@
+"""
+Headless batch game simulator.
+
+Plays every answer x strategy x seed as wordle_session.GameSession objects,
+without input()/print()/exit(). Games are split into chunks and run across
+a ProcessPoolExecutor; each worker loads the word lists once and returns a
+compact per-chunk summary that is merged in the parent.
+
+python wordle_simulate.py --strategy random first --seeds 5 --workers 4
+
+A strategy is a class with new_game(rng) and guess(history) methods, where
+history is [(guess, feedback code), ...]. Besides the built-in names,
+--strategy accepts "module:Class" to plug in your own.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from wordle_dictionary import get_dictionary
+from wordle_gamelog import RECORD, GameLog, decode_record, session_record
+from wordle_index import WordIndex
+from wordle_score import ALL_CORRECT
+from wordle_session import IN_PROGRESS, MAX_ATTEMPTS, WON, GameSession
+
+
+class CandidateStrategy:
+    """Guess a word that is still possible, narrowing with the bitset index."""
+
+    def __init__(self, dictionary):
+        self.index = WordIndex(dictionary.answers)
+
+    def new_game(self, rng):
+        self.rng = rng
+        self.candidates = self.index.all
+        self.seen = 0
+
+    def guess(self, history):
+        for word, code in history[self.seen:]:
+            self.candidates = self.index.filter(self.candidates, word, code)
+        self.seen = len(history)
+        return self.pick(self.index.indices(self.candidates))
+
+    def pick(self, indices):
+        return self.index.words[self.rng.choice(indices)]
+
+
+class FirstCandidate(CandidateStrategy):
+    """Always the first remaining candidate in word-list order."""
+
+    def pick(self, indices):
+        return self.index.words[indices[0]]
+
+
+class EntropyStrategy:
+    """Best guess from wordle_solver; the opening guess is computed once."""
+
+    def __init__(self, dictionary):
+        from wordle_solver import rank_guesses
+
+        self.rank_guesses = rank_guesses
+        self.opener = rank_guesses(top=1)[0][0]
+
+    def new_game(self, rng):
+        pass
+
+    def guess(self, history):
+        if not history:
+            return self.opener
+        return self.rank_guesses(history, top=1)[0][0]
+
+
+STRATEGIES = {
+    "random": CandidateStrategy,
+    "first": FirstCandidate,
+    "entropy": EntropyStrategy,
+}
+
+
+def get_strategy(name):
+    """Strategy class by built-in name or "module:Class"."""
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    module, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown strategy {name!r}, expected one of {sorted(STRATEGIES)} or module:Class")
+    return getattr(importlib.import_module(module), attr)
+
+
+def play_game(strategy, session, rng):
+    """Let strategy play session to the end, returns its history."""
+    strategy.new_game(rng)
+    history = []
+    while session.status == IN_PROGRESS:
+        guess = strategy.guess(history)
+        code, _ = session.submit(guess)
+        history.append((guess, code))
+    return history
+
+
+class SimulationResult:
+    """Guess-count distribution per strategy, failures and optional traces."""
+
+    def __init__(self):
+        # strategy -> Counter(guesses needed), 0 counts failures
+        self.distribution = {}
+        self.traces = []
+        # strategy -> wordle_gamelog records of the games, if asked for; written, not merged
+        self.records = {}
+
+    def add(self, strategy, session, trace=None, record=False):
+        solved = session.status == WON
+        self.distribution.setdefault(strategy, Counter())[session.attempts if solved else 0] += 1
+        if trace is not None:
+            self.traces.append(trace)
+        if record:
+            self.records.setdefault(strategy, bytearray()).extend(session_record(session))
+
+    def merge(self, other):
+        for strategy, counts in other.distribution.items():
+            self.distribution.setdefault(strategy, Counter()).update(counts)
+        self.traces.extend(other.traces)
+        return self
+
+    def summary(self):
+        rows = {}
+        for strategy, counts in sorted(self.distribution.items()):
+            games = sum(counts.values())
+            failures = counts[0]
+            solved = games - failures
+            rows[strategy] = {
+                "games": games,
+                "failure_rate": failures / games if games else 0.0,
+                "mean_guesses": sum(n * c for n, c in counts.items()) / solved if solved else None,
+                "distribution": {n: counts[n] for n in range(1, MAX_ATTEMPTS + 1)},
+            }
+        return rows
+
+
+_worker_strategies = {}
+
+
+def _get_worker_strategy(name):
+    # one instance per strategy and process, reused across chunks
+    if name not in _worker_strategies:
+        _worker_strategies[name] = get_strategy(name)(get_dictionary())
+    return _worker_strategies[name]
+
+
+def run_chunk(unit):
+    """Play one work unit: (strategy name, seed, answer indices, keep traces, keep log records)."""
+    name, seed, answer_indices, keep_traces, keep_records = unit
+    dictionary = get_dictionary()
+    strategy = _get_worker_strategy(name)
+    result = SimulationResult()
+    for a in answer_indices:
+        session = GameSession(dictionary, a)
+        history = play_game(strategy, session, random.Random(seed * 100_003 + a))
+        trace = None
+        if keep_traces:
+            trace = {"strategy": name, "seed": seed, "answer": session.answer_word,
+                     "guesses": [g for g, _ in history], "codes": [c for _, c in history]}
+        result.add(name, session, trace, keep_records)
+    return result
+
+
+def record_stats(stats, strategy, records):
+    """Count gamelog records of one strategy in a StatsStore."""
+    answers = get_dictionary().answers
+    for offset in range(0, len(records), RECORD.size):
+        answer, guesses, codes, _ = decode_record(records[offset:offset + RECORD.size])
+        stats.record(codes[-1] == ALL_CORRECT, len(guesses), answers[answer], profile=f"sim-{strategy}")
+
+
+def work_units(strategies, seeds, n_answers, chunk_size, keep_traces=False, keep_records=False):
+    for name in strategies:
+        for seed in seeds:
+            for start in range(0, n_answers, chunk_size):
+                yield (name, seed, range(start, min(start + chunk_size, n_answers)), keep_traces, keep_records)
+
+
+def simulate(strategies, seeds=(0,), answers=None, workers=None, chunk_size=100, keep_traces=False, log=None,
+             stats=None):
+    """
+    Play every answer (or the given answer indices) with every strategy
+    and seed. workers=1 plays in this process, otherwise a process pool of
+    that many workers (default: all cores) is used. With a
+    wordle_gamelog.GameLog as log, every game is appended to it as its
+    chunk comes back; with a wordle_stats.StatsStore as stats, every game
+    is counted under the profile "sim-<strategy>".
+    """
+    if answers is None:
+        answers = range(len(get_dictionary().answers))
+    answers = list(answers)
+    units = [
+        (name, seed, [answers[i] for i in chunk], traces, records)
+        for name, seed, chunk, traces, records in work_units(
+            strategies, seeds, len(answers), chunk_size, keep_traces, log is not None or stats is not None)
+    ]
+    result = SimulationResult()
+
+    def collect(chunk_result):
+        for name, records in chunk_result.records.items():
+            if log is not None:
+                log.write(records)
+            if stats is not None:
+                record_stats(stats, name, records)
+        result.merge(chunk_result)
+
+    if workers == 1:
+        for unit in units:
+            collect(run_chunk(unit))
+        return result
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_result in pool.map(run_chunk, units):
+            collect(chunk_result)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play Wordle games without a player.")
+    parser.add_argument("--strategy", nargs="+", default=["random"],
+                        help=f"built-in {sorted(STRATEGIES)} or module:Class")
+    parser.add_argument("--seeds", type=int, default=1, help="number of seeds per answer")
+    parser.add_argument("--limit", type=int, help="only play the first N answers")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--traces", help="write per-game traces as JSON lines to this file")
+    parser.add_argument("--log", metavar="DIR", help="append every game to a binary game log (see wordle_gamelog)")
+    parser.add_argument("--stats", metavar="FILE", help="count every game in this statistics database "
+                                                        "(see wordle_stats)")
+    args = parser.parse_args(argv)
+
+    answers = range(args.limit) if args.limit else None
+    log = GameLog(args.log, get_dictionary().digest) if args.log else None
+    stats = None
+    if args.stats:
+        from wordle_stats import StatsStore
+
+        stats = StatsStore(args.stats)
+    start = time.perf_counter()
+    try:
+        result = simulate(args.strategy, range(args.seeds), answers, args.workers,
+                          args.chunk_size, keep_traces=bool(args.traces), log=log, stats=stats)
+    finally:
+        if log is not None:
+            log.close()
+        if stats is not None:
+            stats.close()
+    elapsed = time.perf_counter() - start
+
+    summary = result.summary()
+    games = sum(row["games"] for row in summary.values())
+    json.dump(summary, sys.stdout, indent=2)
+    print(f"\n{games} games in {elapsed:.2f}s ({games / elapsed:.0f} games/s)")
+    if args.traces:
+        with open(args.traces, "w") as f:
+            for trace in result.traces:
+                f.write(json.dumps(trace) + "\n")
+
+
+if __name__ == "__main__":
+    main()
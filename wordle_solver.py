@@ -0,0 +1,140 @@
+"""
+Entropy-maximizing solver / hint engine.
+
+For a guess history [(guess, feedback code), ...] the remaining candidates
+are the answers consistent with every feedback. Each possible guess splits
+those candidates into up to 243 buckets by feedback pattern; the expected
+information gain of the guess is the entropy of that bucket distribution.
+
+All guesses are scored at once: the pattern rows of the candidates are
+counted with one numpy bincount per chunk of guesses, no Python loop over
+words or answers.
+
+python wordle_solver.py [guess code ...]      # e.g. python wordle_solver.py raise 0
+"""
+
+import sys
+
+import numpy as np
+
+from wordle_patterns import get_matrix
+from wordle_score import NUM_PATTERNS
+
+# guesses scored per bincount call, bounds the temporary arrays to ~20 MB
+CHUNK_SIZE = 1024
+
+
+def candidate_mask(patterns, history):
+    """Boolean mask over patterns.answers of the answers consistent with history."""
+    mask = np.ones(len(patterns.answers), dtype=bool)
+    for guess, code in history:
+        mask &= patterns.matrix[patterns.guess_index[guess]] == code
+    return mask
+
+
+def candidates(patterns, history):
+    """Indices into patterns.answers of the answers consistent with history."""
+    return np.flatnonzero(candidate_mask(patterns, history))
+
+
+def bucket_counts(matrix, answer_indices):
+    """
+    Yield (start, counts) per chunk of guess rows, where counts[i, code] is
+    the number of the given answers that guess start + i sorts into code.
+    """
+    for start in range(0, matrix.shape[0], CHUNK_SIZE):
+        rows = matrix[start:start + CHUNK_SIZE, answer_indices]
+        offsets = np.arange(rows.shape[0])[:, None] * NUM_PATTERNS
+        # bucket order does not matter, ravel("K") avoids copying a Fortran-ordered slice
+        counts = np.bincount((rows + offsets).ravel("K"), minlength=rows.shape[0] * NUM_PATTERNS)
+        yield start, counts.reshape(rows.shape[0], NUM_PATTERNS)
+
+
+def entropies(matrix, answer_indices):
+    """Expected information (bits) of every guess row against the given answers."""
+    n = len(answer_indices)
+    result = np.zeros(matrix.shape[0])
+    if n <= 1:
+        return result
+    log_n = np.log2(n)
+    for start, counts in bucket_counts(matrix, answer_indices):
+        # H = log2(n) - sum(c * log2(c)) / n, empty buckets contribute nothing
+        weighted = (counts * np.log2(np.maximum(counts, 1))).sum(axis=1)
+        result[start:start + counts.shape[0]] = log_n - weighted / n
+    return result
+
+
+def rank_guesses(history=(), top=10, patterns=None, candidates=None, guesses=None):
+    """
+    Return [(guess, bits), ...] best first.
+
+    candidates are the indices of the answers still possible, if the caller
+    already tracks them (e.g. GameSession.candidate_indices()); otherwise
+    they are derived from history. guesses restricts the ranking to these
+    guess indices, e.g. the hard-mode legal set. Ties are broken in favour
+    of guesses that can still be the answer. Raises ValueError if no answer
+    is possible.
+    """
+    patterns = patterns or get_matrix()
+    if candidates is None:
+        mask = candidate_mask(patterns, history)
+    else:
+        mask = np.zeros(len(patterns.answers), dtype=bool)
+        mask[np.asarray(candidates, dtype=np.intp)] = True
+    answer_indices = np.flatnonzero(mask)
+    if len(answer_indices) == 0:
+        raise ValueError("No word matches the feedback given so far")
+
+    is_candidate = np.zeros(len(patterns.guesses), dtype=bool)
+    is_candidate[:len(patterns.answers)] = mask
+    if guesses is None:
+        guess_indices = np.arange(len(patterns.guesses))
+        bits = entropies(patterns.matrix, answer_indices)
+    else:
+        guess_indices = np.asarray(guesses, dtype=np.intp)
+        bits = entropies(patterns.matrix[guess_indices], answer_indices)
+    # lexsort sorts by the last key first
+    order = np.lexsort((~is_candidate[guess_indices], -bits))
+    if top is not None:
+        order = order[:top]
+    return [(patterns.guesses[guess_indices[i]], float(bits[i])) for i in order]
+
+
+def rank_boards(candidate_sets, top=10, patterns=None):
+    """
+    Rank guesses for a multi-board game by the information they give
+    summed over all boards: [(guess, bits), ...] best first.
+
+    candidate_sets are the candidate answer indices of each unsolved
+    board. Boards with the same candidates (e.g. all of them before the
+    first guess) are scored once. Ties are broken in favour of guesses
+    that can still be the answer on some board.
+    """
+    patterns = patterns or get_matrix()
+    sets = {}
+    for indices in candidate_sets:
+        indices = np.asarray(indices, dtype=np.intp)
+        if len(indices) == 0:
+            raise ValueError("No word matches the feedback given so far")
+        key = indices.tobytes()
+        sets[key] = (indices, sets[key][1] + 1 if key in sets else 1)
+
+    bits = np.zeros(len(patterns.guesses))
+    is_candidate = np.zeros(len(patterns.guesses), dtype=bool)
+    for indices, count in sets.values():
+        bits += count * entropies(patterns.matrix, indices)
+        is_candidate[indices] = True
+    order = np.lexsort((~is_candidate, -bits))
+    if top is not None:
+        order = order[:top]
+    return [(patterns.guesses[i], float(bits[i])) for i in order]
+
+
+def main(argv):
+    history = [(argv[i], int(argv[i + 1])) for i in range(0, len(argv) - 1, 2)]
+    for guess, bits in rank_guesses(history):
+        print(f"{guess}  {bits:.3f} bits")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
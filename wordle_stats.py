@@ -0,0 +1,240 @@
+"""
+Persistent game statistics: played, won, streaks and guess distribution.
+
+Results are kept in SQLite (WAL mode, so the stats panel can read while
+games are being written). record() only puts the result on a queue; a
+writer thread takes everything queued so far and commits it as one
+transaction, so under load many games share one commit and a slow disk
+never blocks a GUI event or the server's event loop.
+
+Every game is a row in games, and the same transaction updates running
+totals in totals (one row per profile and mode) and distribution (one row
+per profile, mode and guess count). Modes are kept apart because their
+numbers do not mix: an absurdle or 8-board game takes far more guesses
+than a normal one. summary() reads those few rows instead of scanning the
+games, so the stats panel opens in constant time however many games were
+played. The totals are updated with SQL expressions
+rather than values computed here, so several processes can share one
+database file.
+
+python wordle_stats.py [--profile NAME] [--mode MODE]     # print the stats
+"""
+
+import argparse
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+# file used when neither a path nor $WORDLE_STATS is given
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".wordle_stats.sqlite3")
+STATS_ENV = "WORDLE_STATS"
+DEFAULT_PROFILE = "default"
+DEFAULT_MODE = "normal"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    finished REAL NOT NULL,
+    answer TEXT NOT NULL,
+    guesses INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    mode TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS totals (
+    profile TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    played INTEGER NOT NULL DEFAULT 0,
+    won INTEGER NOT NULL DEFAULT 0,
+    current_streak INTEGER NOT NULL DEFAULT 0,
+    max_streak INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (profile, mode)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS distribution (
+    profile TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    guesses INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (profile, mode, guesses)
+) WITHOUT ROWID;
+"""
+
+INSERT_GAME = "INSERT INTO games (profile, finished, answer, guesses, won, mode) VALUES (?, ?, ?, ?, ?, ?)"
+ENSURE_TOTALS = "INSERT INTO totals (profile, mode) VALUES (?, ?) ON CONFLICT DO NOTHING"
+# right-hand sides see the old row, so max_streak uses the streak before this game
+UPDATE_TOTALS = """
+UPDATE totals SET
+    played = played + 1,
+    won = won + :won,
+    current_streak = CASE WHEN :won THEN current_streak + 1 ELSE 0 END,
+    max_streak = MAX(max_streak, CASE WHEN :won THEN current_streak + 1 ELSE 0 END)
+WHERE profile = :profile AND mode = :mode
+"""
+ADD_DISTRIBUTION = """
+INSERT INTO distribution (profile, mode, guesses, count) VALUES (?, ?, ?, 1)
+ON CONFLICT (profile, mode, guesses) DO UPDATE SET count = count + 1
+"""
+
+_STOP = object()
+
+
+def connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # with WAL this still never corrupts the file, a power cut can only lose the last commits
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def session_mode(session):
+    """Short name of the game variant, e.g. "hard", "absurdle" or "boards4"."""
+    if hasattr(session, "answer_words"):
+        return f"boards{len(session.answer_words)}"
+    if session.adversarial:
+        return "absurdle"
+    return "hard" if session.hard is not None else "normal"
+
+
+class StatsStore:
+
+    def __init__(self, path=None, batch_size=1000):
+        """path defaults to $WORDLE_STATS or DEFAULT_PATH; at most batch_size games go in one commit."""
+        self.path = os.fspath(path or os.environ.get(STATS_ENV) or DEFAULT_PATH)
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.error = None
+        # games written so far, and commits used for them
+        self.written = 0
+        self.commits = 0
+        self.reader = connect(self.path)
+        self.read_lock = threading.Lock()
+        self.writer = threading.Thread(target=self._write_loop, name="stats-writer", daemon=True)
+        self.writer.start()
+
+    @property
+    def pending(self):
+        """Games recorded but not committed yet."""
+        return self.queue.unfinished_tasks
+
+    def record(self, won, guesses, answer, mode=DEFAULT_MODE, profile=DEFAULT_PROFILE):
+        """Queue one finished game, returns at once."""
+        self.queue.put((profile, time.time(), answer, guesses, int(bool(won)), mode))
+
+    def record_session(self, session, profile=DEFAULT_PROFILE):
+        """Queue a finished GameSession, AbsurdleSession or MultiBoardSession."""
+        from wordle_session import WON
+
+        answer = " ".join(session.answer_words) if hasattr(session, "answer_words") else session.answer_word
+        self.record(session.status == WON, session.attempts, answer, session_mode(session), profile)
+
+    def _write_loop(self):
+        conn = connect(self.path)
+        try:
+            while True:
+                batch = [self.queue.get()]
+                # everything queued meanwhile goes in the same commit
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = batch[-1] is _STOP
+                games = [game for game in batch if game is not _STOP]
+                try:
+                    if games:
+                        self._write(conn, games)
+                except sqlite3.Error as e:
+                    self.error = e
+                for _ in batch:
+                    self.queue.task_done()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _write(self, conn, games):
+        with conn:
+            conn.executemany(INSERT_GAME, games)
+            conn.executemany(ENSURE_TOTALS, {(game[0], game[5]) for game in games})
+            conn.executemany(UPDATE_TOTALS, [{"won": game[4], "profile": game[0], "mode": game[5]} for game in games])
+            conn.executemany(ADD_DISTRIBUTION, [(game[0], game[5], game[3]) for game in games if game[4]])
+        self.written += len(games)
+        self.commits += 1
+
+    def flush(self):
+        """Wait until every recorded game is committed. Raises the writer's last error."""
+        self.queue.join()
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def summary(self, profile=DEFAULT_PROFILE, mode=DEFAULT_MODE):
+        """
+        {"played", "won", "win_rate", "current_streak", "max_streak",
+        "distribution": {guesses: wins}} of one mode (see session_mode)
+        from the running totals. Games still pending are not included yet.
+        """
+        with self.read_lock:
+            row = self.reader.execute(
+                "SELECT played, won, current_streak, max_streak FROM totals WHERE profile = ? AND mode = ?",
+                (profile, mode),
+            ).fetchone()
+            distribution = dict(self.reader.execute(
+                "SELECT guesses, count FROM distribution WHERE profile = ? AND mode = ? ORDER BY guesses",
+                (profile, mode),
+            ))
+        played, won, current, best = row or (0, 0, 0, 0)
+        return {
+            "played": played,
+            "won": won,
+            "win_rate": won / played if played else 0.0,
+            "current_streak": current,
+            "max_streak": best,
+            "distribution": distribution,
+        }
+
+    def close(self):
+        if self.writer.is_alive():
+            self.queue.put(_STOP)
+            self.writer.join()
+        self.reader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def summary_lines(summary, max_guesses=6, width=20):
+    """The stats panel as text: totals, then one bar per guess count."""
+    lines = [
+        f"Played {summary['played']}  Won {summary['win_rate']:.0%}  "
+        f"Streak {summary['current_streak']}  Max streak {summary['max_streak']}"
+    ]
+    distribution = summary["distribution"]
+    rows = max([max_guesses, *distribution])
+    widest = max(distribution.values(), default=0)
+    for n in range(1, rows + 1):
+        count = distribution.get(n, 0)
+        bar = "#" * (width * count // widest if widest else 0)
+        lines.append(f"{n:>2} {bar} {count}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show the stored game statistics.")
+    parser.add_argument("--path", help=f"database file (default ${STATS_ENV} or {DEFAULT_PATH})")
+    parser.add_argument("--profile", default=DEFAULT_PROFILE)
+    parser.add_argument("--mode", default=DEFAULT_MODE, help="normal, hard, absurdle or boardsN (default normal)")
+    args = parser.parse_args(argv)
+    with StatsStore(args.path) as store:
+        print("\n".join(summary_lines(store.summary(args.profile, args.mode))))
+
+
+if __name__ == "__main__":
+    main()
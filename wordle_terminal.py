@@ -1,83 +1,399 @@
-from colorama import Fore, Back, Style, init
-
-init()
+import os
 import random
+import sys
+
+from wordle_dictionary import Dictionary, get_dictionary
+from wordle_metrics import game_profile, timed
+from wordle_score import CORRECT, HALF_CORRECT, INCORRECT, WORD_LEN, pattern_string, score, render, states
+from wordle_session import IN_PROGRESS, WON, GameSession, HardModeViolation, InvalidGuess
+
+# (letter, state) -> colored letter, filled on first use
+_CELLS = {}
+_ansi_ready = False
+
+
+def ansi(wrap=False):
+    """
+    colorama, imported on first use rather than with this module. wrap=True
+    (interactive play) also runs colorama.init() once, which makes the
+    codes work on Windows consoles and strips them when not on a terminal.
+    """
+    global _ansi_ready
+    import colorama
+
+    if wrap and not _ansi_ready:
+        colorama.init()
+        _ansi_ready = True
+    return colorama
+
 
-with open("wordle_ord.txt", "r") as f:
-    wordlist = [line.strip() for line in f]
+def cell(letter, state):
+    """The ANSI-colored letter for a state, built once per (letter, state)."""
+    try:
+        return _CELLS[letter, state]
+    except KeyError:
+        colorama = ansi()
+        prefix = {INCORRECT: colorama.Style.DIM, HALF_CORRECT: colorama.Back.YELLOW, CORRECT: colorama.Back.GREEN}
+        text = _CELLS[letter, state] = prefix[state] + letter + colorama.Back.RESET
+        return text
 
 
 def correct_place(letter):
-    return Back.GREEN + letter + Back.RESET
+    return cell(letter, CORRECT)
 
 
 def correct_letter(letter):
-    return Back.YELLOW + letter + Back.RESET
+    return cell(letter, HALF_CORRECT)
 
 
 def incorrect_letter(letter):
-    return Style.DIM + letter + Back.RESET
+    return cell(letter, INCORRECT)
 
 
+STYLES = (incorrect_letter, correct_letter, correct_place)
+# records scored before their output is written in one call
+EVAL_BATCH = 4096
+MAX_SHOWN_WORDS = 30
+# as in wordle_multiboard, which needs numpy and is only imported for a game
+BOARD_COUNTS = (2, 4, 8, 16)
+
+
+@timed("compare")
 def compare(input_from_user, word):
-    output = [""] * len(input_from_user)
-    remaining_letters = list(word)
-
-    # Mark correct letter and position - Green
-    for i, letter in enumerate(input_from_user):
-        if letter == remaining_letters[i]:
-            output[i] = correct_place(letter)
-            remaining_letters[i] = None
-
-    # Mark correct letter anbut not position - Yellow
-    for i, letter in enumerate(input_from_user):
-        if output[i]:
+    return render(input_from_user, score(input_from_user, word), STYLES)
+
+
+def render_ansi(guess, code):
+    """Same as render(guess, code, STYLES), straight from the cell table."""
+    cells = _CELLS
+    return "".join(cells.get(key) or cell(*key) for key in zip(guess, states(code)))
+
+
+def parse_record(line):
+    """
+    "answer,guess[,guess...]" -> (answer, [guesses]). Raises ValueError
+    unless every word is WORD_LEN ascii letters.
+    """
+    words = line.strip().lower().split(",")
+    if len(words) < 2:
+        raise ValueError("expected answer,guess[,guess...]")
+    for word in words:
+        if len(word) != WORD_LEN or not word.isascii() or not word.isalpha():
+            raise ValueError(f"not a {WORD_LEN} letter word: {word!r}")
+    return words[0], words[1:]
+
+
+def format_record(answer, guesses, codes, fmt="json", color=False):
+    """One output line (with newline) for a scored record, color wins over fmt."""
+    if color:
+        return " ".join(map(render_ansi, guesses, codes)) + "\n"
+    if fmt == "json":
+        # parse_record() only lets ascii letters through, nothing needs escaping
+        words = '", "'.join(guesses)
+        numbers = ", ".join(map(str, codes))
+        patterns = '", "'.join(map(pattern_string, codes))
+        return f'{{"answer": "{answer}", "guesses": ["{words}"], "codes": [{numbers}], "patterns": ["{patterns}"]}}\n'
+    return " ".join(map(pattern_string, codes)) + "\n"
+
+
+def evaluate(lines, out, fmt="json", color=False, errors=sys.stderr):
+    """
+    Score a stream of records (see parse_record) and write one line per
+    record to out. Input is consumed lazily and output is written in
+    batches of EVAL_BATCH lines, so memory stays constant however long
+    the stream. Malformed lines are reported to errors and skipped.
+
+    Returns (records written, lines skipped).
+    """
+    written = skipped = 0
+    batch = []
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
             continue
-        if letter in remaining_letters:
-            output[i] = correct_letter(letter)
-            remaining_letters[remaining_letters.index(letter)] = None
-        else:
-            output[i] = incorrect_letter(letter)
-    return "".join(output)
+        try:
+            answer, guesses = parse_record(line)
+        except ValueError as e:
+            errors.write(f"line {number}: {e}\n")
+            skipped += 1
+            continue
+        codes = [score(guess, answer) for guess in guesses]
+        batch.append(format_record(answer, guesses, codes, fmt, color))
+        if len(batch) >= EVAL_BATCH:
+            out.write("".join(batch))
+            written += len(batch)
+            batch.clear()
+    out.write("".join(batch))
+    written += len(batch)
+    out.flush()
+    return written, skipped
+
+
+def print_hint(session):
+    from wordle_tree import tree_hint
+
+    # instant if the decision tree has been built and the game follows it
+    guess = tree_hint(session)
+    if guess:
+        print("Best guess:", guess)
+        return
+    try:
+        from wordle_patterns import matrix_for
+        from wordle_solver import rank_guesses
+    except ImportError:
+        print("Hints need numpy: pip install numpy")
+        return
+    try:
+        guesses = session.legal_guess_indices() if session.hard else None
+        ranking = rank_guesses(session.history(), top=5, patterns=matrix_for(session.dictionary),
+                               candidates=session.candidate_indices(), guesses=guesses)
+    except (KeyError, ValueError):
+        print("No hint available")
+        return
+    print("Best guesses:", ", ".join(f"{guess} ({bits:.2f} bits)" for guess, bits in ranking))
+
+
+def finish(session, log=None, stats=None):
+    """Record a finished game to the game log and the stats store, and show the stats."""
+    if log is not None:
+        log.record(session)
+    if stats is not None:
+        import sqlite3
+
+        from wordle_stats import session_mode, summary_lines
+
+        stats.record_session(session)
+        try:
+            stats.flush()
+        except sqlite3.Error:
+            # e.g. the file is locked by a simulator or server run, the game itself is not lost
+            print("Could not save the statistics")
+            return
+        print("\n".join(summary_lines(stats.summary(mode=session_mode(session)))))
 
 
-def check_word(wordlist):
-    word = random.choice(wordlist)
-    attempts = 0
-    max_attempts = 6
-    while attempts < max_attempts:
+def check_word(wordlist, allowed=None, hard_mode=False, absurdle=False, log=None, stats=None):
+    """
+    Play one game. wordlist is a Dictionary, or a list of possible answers
+    with allowed the valid guesses (defaults to the answers). In hard mode
+    every revealed hint must be used in later guesses. In absurdle mode the
+    answer is not fixed, each guess keeps the largest group of answers.
+    A finished (not quit) game is recorded to log, a wordle_gamelog.GameLog,
+    and to stats, a wordle_stats.StatsStore.
+
+    Returns True if the word was guessed, False after max attempts and
+    None if the player typed "no" to quit.
+    """
+    if isinstance(wordlist, Dictionary):
+        dictionary = wordlist
+    else:
+        dictionary = Dictionary.from_words(wordlist, allowed or ())
+    if absurdle:
+        from wordle_absurdle import AbsurdleSession
+
+        session = AbsurdleSession(dictionary, hard_mode=hard_mode)
+    else:
+        word = random.choice(dictionary.answers)
+        session = GameSession(dictionary, dictionary.answer_index[word], hard_mode=hard_mode)
+    colorama = ansi(wrap=True)
+    while session.status == IN_PROGRESS:
         user_word = input().lower()
         if user_word == "no":
-            exit()
-        if len(user_word) != 5 or not user_word.isalpha() or user_word not in wordlist:
+            return None
+        if user_word == "hint":
+            print_hint(session)
+            continue
+        if user_word == "words":
+            words = session.possible_answers()
+            print(f"{len(words)} possible words:", " ".join(words[:MAX_SHOWN_WORDS]),
+                  "..." if len(words) > MAX_SHOWN_WORDS else "")
+            continue
+        try:
+            code, status = session.submit(user_word)
+        except HardModeViolation as e:
+            print(f"Hard mode: {e}")
+            continue
+        except InvalidGuess:
             print("Please enter a 5 letter valid word")
             continue
-        elif user_word == word:
-            print(Back.WHITE + Fore.RED + "Congrats! the word was:" + word)
-            exit()
-            
-        else:
-            attempts += 1
-            print(compare(user_word, word))
-            print("Try again. Attempts left: ", max_attempts - attempts)
-        
-    print("You reached max attempts. The word was:", word)
-    exit()
+        if status == WON:
+            print(colorama.Back.WHITE + colorama.Fore.RED + "Congrats! the word was:" + session.answer_word)
+            finish(session, log, stats)
+            return True
+        print(render(user_word, code, STYLES))
+        print("Try again. Attempts left: ", session.attempts_left, " Possible words: ", session.remaining)
+
+    print("You reached max attempts. The word was:", session.answer_word)
+    finish(session, log, stats)
+    return False
+
+
+def play_boards(dictionary, boards, stats=None):
+    """
+    Play one multi-board game: every guess counts on all boards still
+    unsolved, shown as one stacked row per board. Same return values as
+    check_word(), a finished game is recorded to stats.
+    """
+    from wordle_multiboard import MultiBoardSession
+
+    session = MultiBoardSession(dictionary, boards)
+    colorama = ansi(wrap=True)
+    print(f"{boards} boards, {session.max_attempts} attempts")
+    while session.status == IN_PROGRESS:
+        user_word = input().lower()
+        if user_word == "no":
+            return None
+        if user_word == "hint":
+            try:
+                from wordle_patterns import matrix_for
+                from wordle_solver import rank_boards
+
+                sets = [session.candidate_indices(b) for b in session.active_boards()]
+                ranking = rank_boards(sets, top=5, patterns=matrix_for(dictionary))
+            except ImportError:
+                print("Hints need numpy: pip install numpy")
+                continue
+            print("Best guesses:", ", ".join(f"{guess} ({bits:.2f} bits)" for guess, bits in ranking))
+            continue
+        if user_word == "words":
+            for b in session.active_boards():
+                words = session.possible_answers(b)
+                print(f"Board {b + 1}: {len(words)} possible words:", " ".join(words[:MAX_SHOWN_WORDS]),
+                      "..." if len(words) > MAX_SHOWN_WORDS else "")
+            continue
+        try:
+            codes, status = session.submit(user_word)
+        except InvalidGuess:
+            print("Please enter a 5 letter valid word")
+            continue
+        for b, code in enumerate(codes):
+            if code is not None:
+                print(f"{b + 1:>2} " + render(user_word, code, STYLES))
+        if status == WON:
+            print(colorama.Back.WHITE + colorama.Fore.RED + "Congrats! the words were:" + " ".join(session.answer_words))
+            finish(session, stats=stats)
+            return True
+        print("Try again. Attempts left: ", session.attempts_left,
+              " Boards left: ", len(session.active_boards()), " Possible words: ", session.remaining)
+
+    print("You reached max attempts. The words were:", " ".join(session.answer_words))
+    finish(session, stats=stats)
+    return False
+
+
+def run_eval(path, fmt="json", color=False):
+    """Score the records in path ("-" for stdin) to stdout. Returns the exit status."""
+    source = sys.stdin if path == "-" else open(path, encoding="ascii", errors="replace", buffering=1 << 20)
+    try:
+        _, skipped = evaluate(source, sys.stdout, fmt, color)
+    except BrokenPipeError:
+        # e.g. piped into head
+        return 0
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    return 1 if skipped else 0
+
+
+def main(argv=()):
+    """
+    Interactive game. With --eval, score answer,guess records from a file
+    or stdin without prompts instead. argv defaults to none so callers
+    (and tests) get the game; the script passes sys.argv[1:].
+    """
+    # imported here, most starts are games that never parse arguments
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play Wordle in the terminal, or score archived games.")
+    parser.add_argument("--eval", metavar="FILE", nargs="?", const="-",
+                        help="score 'answer,guess[,guess...]' lines from FILE (default stdin), one result per line")
+    parser.add_argument("--format", choices=("json", "pattern"), default="json",
+                        help="JSON lines, or compact patterns like -YG-- (with --eval)")
+    parser.add_argument("--color", action="store_true", help="ANSI-colored guesses instead of JSON or patterns (with --eval)")
+    parser.add_argument("--log", metavar="DIR", help="record finished games to a binary game log "
+                                                     "(default $WORDLE_GAME_LOG, see wordle_gamelog)")
+    parser.add_argument("--stats", metavar="FILE", help="statistics database (default $WORDLE_STATS or "
+                                                        "~/.wordle_stats.sqlite3, see wordle_stats)")
+    parser.add_argument("--no-stats", action="store_true", help="don't keep statistics")
+    parser.add_argument("--profile", metavar="FILE", help="run the first game under cProfile and write the stats "
+                                                          "to FILE (default $WORDLE_PROFILE, see wordle_metrics)")
+    args = parser.parse_args(argv)
+    if args.eval is not None:
+        return run_eval(args.eval, args.format, args.color)
+
+    log = stats = None
+    # checked here so wordle_gamelog is only imported when logging
+    if args.log or os.environ.get("WORDLE_GAME_LOG"):
+        from wordle_gamelog import open_log
+
+        log = open_log(get_dictionary(), args.log)
+    if not args.no_stats:
+        import sqlite3
+
+        from wordle_stats import StatsStore
+
+        try:
+            stats = StatsStore(args.stats)
+        except (OSError, sqlite3.Error) as e:
+            # an unusable path (missing directory, read-only home) only turns the stats off
+            print(f"Statistics are off, could not open them: {e}")
+    try:
+        play(log, stats, game_profile(args.profile))
+    finally:
+        if log is not None:
+            log.close()
+        if stats is not None:
+            stats.close()
 
 
-def main():
+def play(log=None, stats=None, profile=None):
+    """
+    The start menu loop, finished games are recorded to log and stats if
+    given. profile, a wordle_metrics.GameProfile, captures the first game.
+    """
+    colorama = ansi(wrap=True)
     while True:
-        print(Back.WHITE + Fore.BLACK + "Start the game? (yes/no))" + Style.RESET_ALL)
+        print(colorama.Back.WHITE + colorama.Fore.BLACK + "Start the game? (yes/hard/absurdle/boards N/no)"
+              + colorama.Style.RESET_ALL)
         input_from_user = input()
         if input_from_user == "no":
             break
-        elif input_from_user == "yes":
-            print("Enter your word: ")
-            check_word(wordlist)
+        elif input_from_user in ("yes", "hard", "absurdle"):
+            print("Enter your word ('hint' for suggestions, 'words' for possible answers): ")
+            if profile is not None:
+                profile.start()
+            try:
+                result = check_word(get_dictionary(), hard_mode=input_from_user == "hard",
+                                    absurdle=input_from_user == "absurdle", log=log, stats=stats)
+            except ImportError:
+                print("Absurdle needs numpy: pip install numpy")
+                continue
+            finally:
+                if profile is not None:
+                    profile.stop()
+            if result is None:
+                break
+        elif input_from_user.startswith("boards"):
+            boards = input_from_user.split()[-1]
+            if not boards.isdigit() or int(boards) not in BOARD_COUNTS:
+                print("Boards can be", ", ".join(map(str, BOARD_COUNTS)))
+                continue
+            print("Enter your word ('hint' for suggestions, 'words' for possible answers): ")
+            if profile is not None:
+                profile.start()
+            try:
+                result = play_boards(get_dictionary(), int(boards), stats)
+            except ImportError:
+                print("Multiple boards need numpy: pip install numpy")
+                continue
+            finally:
+                if profile is not None:
+                    profile.stop()
+            if result is None:
+                break
         else:
             print("Please enter yes or no")
     print("Thanks for playing!")
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
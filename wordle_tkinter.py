@@ -1,21 +1,37 @@
-import random
-
 from tkinter import ttk
 from pathlib import Path
+from importlib.util import find_spec
 import tkinter as tk
-import random
+import os
 import string
 import sys
 
+from wordle_dictionary import Dictionary
+from wordle_metrics import game_profile, timed
+from wordle_score import ALL_CORRECT, states
+from wordle_session import IN_PROGRESS, LOST, WON, GameSession, HardModeViolation, InvalidGuess
+from wordle_view import Renderer, ToastManager
+
+# absurdle and multi-board games need numpy, their options are hidden without it;
+# the modules themselves are imported by the first game that uses them
+HAS_NUMPY = find_spec("numpy") is not None
+
 WORD_LEN = 5
-MAX_TRIES = 6
 COLOR_BORDER_HIGHLIGHT = "#565758"
 COLOR_BLANK = "#121213"
 COLOR_INCORRECT = "#3a3a3c"
 COLOR_HALF_CORRECT = "#b59f3b"
 COLOR_CORRECT = "#538d4e"
+STATE_COLORS = (COLOR_INCORRECT, COLOR_HALF_CORRECT, COLOR_CORRECT)
 BOX_SIZE = 55
 PADDING = 3
+BOARD_CHOICES = (1, 2, 4, 8, 16)
+# how often a pending hint or stats write is checked for, in ms
+HINT_POLL_MS = 15
+STATS_POLL_MS = 15
+# cell size and font size, and boards per grid row, by number of boards
+BOARD_SIZES = {1: (BOX_SIZE, 24), 2: (40, 18), 4: (30, 14), 8: (24, 11), 16: (18, 9)}
+BOARD_COLUMNS = {1: 1, 2: 2, 4: 4, 8: 4, 16: 8}
 
 
 try:
@@ -23,10 +39,9 @@ try:
 except AttributeError:
     BASE_PATH = Path(".")
 
-WORDLIST = BASE_PATH / "wordle_ord.txt"
-
-with open(WORDLIST, "r") as f:
-    WORD = set(word.strip().lower() for word in f)
+DICTIONARY = Dictionary(BASE_PATH)
+# finished single-board games are recorded here if set, see wordle_gamelog
+GAME_LOG_DIR = os.environ.get("WORDLE_GAME_LOG")
 
 
 class MainScreen(tk.Frame):
@@ -38,19 +53,56 @@ class MainScreen(tk.Frame):
         self.bind("<BackSpace>", self.remove_letter)
         self.bind("<Key>", self.enter_letter)
 
+        # grid and keyboard changes are pushed once per event, and only if they differ
+        self.view = Renderer(self.after_idle)
+        # hints are computed in a worker process and polled for, started by the first request
+        self.hints = None
+        self.hint_poll = None
+        self.game_log = None
+        if GAME_LOG_DIR:
+            from wordle_gamelog import GameLog
+
+            self.game_log = GameLog(GAME_LOG_DIR, DICTIONARY.digest)
+        # results are written by the store's own thread, the dialog polls for them
+        self.stats = None
+        self.stats_poll = None
+        try:
+            import sqlite3
+
+            from wordle_stats import StatsStore
+
+            self.stats = StatsStore()
+        except (OSError, sqlite3.Error):
+            pass
+        # with $WORDLE_PROFILE, the first game runs under cProfile
+        self.profile = game_profile()
         self.init_ui()
         self.new_game()
 
     def new_game(self):
-        self.answer = random.choice(list(WORD)).lower()
-        self.words = [""] * 6
-        self.correct_letters = set()
-        self.half_correct_letters = set()
-        self.incorrect_letters = set()
+        self.cancel_hint(clear=True)
+        boards = self.board_count.get()
+        if boards > 1:
+            # hard mode and absurdle are single-board only
+            from wordle_multiboard import MultiBoardSession
+
+            self.session = MultiBoardSession(DICTIONARY, boards)
+        elif self.absurdle.get():
+            from wordle_absurdle import AbsurdleSession
+
+            self.session = AbsurdleSession(DICTIONARY, hard_mode=self.hard_mode.get())
+        else:
+            self.session = GameSession(DICTIONARY, hard_mode=self.hard_mode.get())
+        if (boards, self.session.max_attempts) != (self.boards, len(self.words)):
+            self.build_boards(boards, self.session.max_attempts)
+        self.words = [""] * self.session.max_attempts
+        # per board: letter -> best state seen, and whether the board is solved
+        self.key_states = [{} for _ in range(boards)]
+        self.done = [False] * boards
         self.current_word = 0
 
         # reset the grid and keyboard
-        for i in range(MAX_TRIES):
+        for i in range(len(self.words)):
             self.use_word = i
             self.update_labels()
         self.use_word = self.current_word
@@ -58,15 +110,53 @@ class MainScreen(tk.Frame):
 
         # hide the game over dialog
         self.game_over_dialog.place_forget()
+        if self.profile is not None:
+            self.profile.start()
+
+    def record_stats(self):
+        """Queue the finished game and show the stats once it is written."""
+        if self.stats is None:
+            self.game_over_stats.set("")
+            return
+        from wordle_stats import session_mode
+
+        self.stats.record_session(self.session)
+        # the panel shows the stats of the mode just played
+        self.stats_mode = session_mode(self.session)
+        self.game_over_stats.set("")
+        if self.stats_poll is None:
+            self.stats_poll = self.after(STATS_POLL_MS, self.show_stats)
+
+    def show_stats(self):
+        if self.stats.error is not None:
+            # the write failed, waiting longer would not bring the game in
+            self.stats_poll = None
+            self.stats.error = None
+            self.toast("Could not save the statistics")
+            return
+        if self.stats.pending:
+            self.stats_poll = self.after(STATS_POLL_MS, self.show_stats)
+            return
+        from wordle_stats import summary_lines
+
+        self.stats_poll = None
+        self.game_over_stats.set("\n".join(summary_lines(self.stats.summary(mode=self.stats_mode))))
 
     def congratulate(self):
         self.game_over_dialog_title.set("Congrats!")
-        self.game_over_dialog_message.set(f"You guessed the word {self.answer.upper()}. Play again?")
+        if self.boards > 1:
+            self.game_over_dialog_message.set(f"You guessed all {self.boards} words. Play again?")
+        else:
+            self.game_over_dialog_message.set(f"You guessed the word {self.session.answer_word.upper()}. Play again?")
         self.game_over_dialog.place(relx=0.5, rely=0.5, anchor="center")
 
     def humiliate(self):
         self.game_over_dialog_title.set("Max attemts reached")
-        self.game_over_dialog_message.set(f"The word was {self.answer.upper()}. Play again?")
+        if self.boards > 1:
+            words = ", ".join(word.upper() for word in self.session.answer_words)
+            self.game_over_dialog_message.set(f"The words were {words}. Play again?")
+        else:
+            self.game_over_dialog_message.set(f"The word was {self.session.answer_word.upper()}. Play again?")
         self.game_over_dialog.place(relx=0.5, rely=0.5, anchor="center")
 
     def init_ui(self):
@@ -94,6 +184,34 @@ class MainScreen(tk.Frame):
             font=("Helvetica Neue", 10),
         ).grid(row=1, column=1)
 
+        # game modes, apply from the next game on
+        self.hard_mode = tk.BooleanVar(self, value=False)
+        self.absurdle = tk.BooleanVar(self, value=False)
+        modes = [("Hard mode", self.hard_mode)]
+        if HAS_NUMPY:
+            modes.append(("Absurdle", self.absurdle))
+        for row, (text, variable) in enumerate(modes):
+            tk.Checkbutton(
+                container,
+                text=text,
+                variable=variable,
+                fg="#d7dadc",
+                bg=COLOR_BLANK,
+                selectcolor=COLOR_INCORRECT,
+                activebackground=COLOR_BLANK,
+                activeforeground="#d7dadc",
+                takefocus=0,
+                font=("Helvetica Neue", 10),
+            ).grid(row=row, column=2, padx=10, sticky="w")
+
+        # number of boards, applies from the next game on
+        self.board_count = tk.IntVar(self, value=1)
+        if HAS_NUMPY:
+            boards = tk.OptionMenu(container, self.board_count, *BOARD_CHOICES)
+            boards.config(fg="#d7dadc", bg=COLOR_BLANK, activebackground=COLOR_INCORRECT,
+                          highlightthickness=0, takefocus=0, font=("Helvetica Neue", 10))
+            boards.grid(row=len(modes), column=2, padx=10, sticky="w")
+
         # top
         ttk.Separator(self).grid(sticky="ew")
         self.top_separator = tk.Frame(self, bg=COLOR_BLANK, height=45)
@@ -101,44 +219,42 @@ class MainScreen(tk.Frame):
         self.top_separator.grid_columnconfigure(0, weight=1)
         self.top_separator.grid_propagate(False)
         self.top_separator.grid(sticky="news")
+        self.toasts = ToastManager(self.make_toast_label, self.master.after, self.master.after_cancel)
 
         # main game grid
         self.rowconfigure(3, weight=1)
 
-        container = tk.Frame(self, bg=COLOR_BLANK)
-        container.grid()
-
+        # filled by build_boards() when the first game starts
+        self.grid_container = tk.Frame(self, bg=COLOR_BLANK)
+        self.grid_container.grid()
+        self.boards = 0
+        self.words = []
         self.labels = []
-        for i in range(MAX_TRIES):
-            row = []
-            for j in range(WORD_LEN):
-                cell = tk.Frame(
-                    container,
-                    width=BOX_SIZE,
-                    height=BOX_SIZE,
-                    highlightthickness=1,
-                    highlightbackground=COLOR_INCORRECT,
-                )
-                cell.grid_propagate(0)
-                cell.grid_rowconfigure(0, weight=1)
-                cell.grid_columnconfigure(0, weight=1)
-                cell.grid(row=i, column=j, padx=PADDING, pady=PADDING)
-                t = tk.Label(
-                    cell,
-                    text="",
-                    justify="center",
-                    font=("Helvetica Neue", 24, "bold"),
-                    bg=COLOR_BLANK,
-                    fg="#d7dadc",
-                    highlightthickness=1,
-                    highlightbackground=COLOR_BLANK,
-                )
-                t.grid(sticky="news")
-                row.append(t)
-            self.labels.append(row)
 
-        # bottom
-        tk.Frame(self, bg=COLOR_BLANK, height=45).grid()
+        # bottom: hint button and panel
+        hint_bar = tk.Frame(self, bg=COLOR_BLANK, height=45)
+        hint_bar.grid(sticky="ew")
+        hint_bar.grid_columnconfigure(1, weight=1)
+        tk.Button(
+            hint_bar,
+            text="Hint",
+            bg=COLOR_INCORRECT,
+            fg="#d7dadc",
+            font=("Helvetica Neue", 11),
+            border=0,
+            cursor="hand2",
+            takefocus=0,
+            command=self.request_hint,
+        ).grid(row=0, column=0, padx=5, pady=8)
+        self.hint_text = tk.StringVar(self, value="")
+        tk.Label(
+            hint_bar,
+            textvariable=self.hint_text,
+            fg="#d7dadc",
+            bg=COLOR_BLANK,
+            anchor="w",
+            font=("Helvetica Neue", 11),
+        ).grid(row=0, column=1, sticky="ew")
 
         #  keyboard
         container = tk.Frame(self, bg=COLOR_BLANK)
@@ -146,6 +262,8 @@ class MainScreen(tk.Frame):
 
         # add all the alphabets
         self.keyboard_buttons = {}
+        self.key_cells = {}
+        self.key_stripes = {}
         for i, keys in enumerate(["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]):
             row = tk.Frame(container, bg=COLOR_BLANK)
             row.grid(row=i, column=0)
@@ -177,7 +295,9 @@ class MainScreen(tk.Frame):
                     command=lambda c=c: self.enter_letter(key=c),
                 )
                 btn.grid(sticky="news")
+                self.view.track(btn, bg=COLOR_BLANK)
                 self.keyboard_buttons[c] = btn
+                self.key_cells[c] = cell
 
         for col in (0, 8):
             text = "ENTER" if col == 0 else "⌫"
@@ -232,8 +352,19 @@ class MainScreen(tk.Frame):
         ).grid(sticky="news", padx=10, pady=10)
         ttk.Separator(self.game_over_dialog).grid(sticky="ew")
 
+        # played/won/streaks and guess distribution
+        self.game_over_stats = tk.StringVar()
+        tk.Label(
+            self.game_over_dialog,
+            textvariable=self.game_over_stats,
+            font=("Courier", 11),
+            justify="left",
+            bg=COLOR_INCORRECT,
+            fg="white",
+        ).grid(sticky="news", padx=10, pady=5)
+
         # yes/no buttons
-        self.game_over_dialog.grid_rowconfigure(4, weight=1)
+        self.game_over_dialog.grid_rowconfigure(5, weight=1)
         f = tk.Frame(self.game_over_dialog, bg=COLOR_INCORRECT)
         f.grid(sticky="news")
         f.grid_columnconfigure(0, weight=1)
@@ -260,88 +391,258 @@ class MainScreen(tk.Frame):
 
     #  game over dialog
     def toast(self, message, duration=2):
+        self.toasts.show(message, duration)
 
-        t = tk.Label(self.top_separator, text=message, font=("Helvetica Neue", 16))
+    def make_toast_label(self):
+        t = tk.Label(self.top_separator, text="", font=("Helvetica Neue", 16))
         t.grid(row=0, column=0, sticky="news", padx=5, pady=5)
-        self.master.after(duration * 1000, lambda: t.grid_remove())
+        return t
+
+    def widget_count(self):
+        """Number of widgets under this screen, should stay flat over any number of games."""
+        count = 0
+        stack = self.winfo_children()
+        while stack:
+            widget = stack.pop()
+            count += 1
+            stack.extend(widget.winfo_children())
+        return count
+
+    def build_boards(self, boards, rows):
+        """(Re)create one grid of rows x WORD_LEN cells per board, and a color stripe per board on every key."""
+        self.view.forget(label for grid in self.labels for row in grid for label in row)
+        for child in self.grid_container.winfo_children():
+            child.destroy()
+        size, font_size = BOARD_SIZES[boards]
+        padding = PADDING if boards == 1 else 1
+        columns = BOARD_COLUMNS[boards]
 
+        self.labels = []
+        for b in range(boards):
+            board = tk.Frame(self.grid_container, bg=COLOR_BLANK)
+            board.grid(row=b // columns, column=b % columns, padx=0 if boards == 1 else 6, pady=2)
+            grid = []
+            for i in range(rows):
+                row = []
+                for j in range(WORD_LEN):
+                    cell = tk.Frame(
+                        board,
+                        width=size,
+                        height=size,
+                        highlightthickness=1,
+                        highlightbackground=COLOR_INCORRECT,
+                    )
+                    cell.grid_propagate(0)
+                    cell.grid_rowconfigure(0, weight=1)
+                    cell.grid_columnconfigure(0, weight=1)
+                    cell.grid(row=i, column=j, padx=padding, pady=padding)
+                    t = tk.Label(
+                        cell,
+                        text="",
+                        justify="center",
+                        font=("Helvetica Neue", font_size, "bold"),
+                        bg=COLOR_BLANK,
+                        fg="#d7dadc",
+                        highlightthickness=1,
+                        highlightbackground=COLOR_BLANK,
+                    )
+                    t.grid(sticky="news")
+                    self.view.track(t, text="", bg=COLOR_BLANK, highlightbackground=COLOR_BLANK)
+                    row.append(t)
+                grid.append(row)
+            self.labels.append(grid)
+
+        # with several boards each key shows one stripe per board
+        for key, cell in self.key_cells.items():
+            if self.key_stripes.get(key):
+                self.view.forget(self.key_stripes[key])
+                self.key_stripes[key][0].master.destroy()
+            self.key_stripes[key] = []
+            if boards > 1:
+                frame = tk.Frame(cell, bg=COLOR_BLANK)
+                frame.grid(row=1, column=0, sticky="ew")
+                for b in range(boards):
+                    stripe = tk.Frame(frame, width=max(2, 38 // boards), height=6, bg=COLOR_BLANK)
+                    stripe.grid(row=0, column=b)
+                    self.view.track(stripe, bg=COLOR_BLANK)
+                    self.key_stripes[key].append(stripe)
+
+        self.boards = boards
+        self.words = [""] * rows
+        # the default size fits one board, larger layouts size the window to fit
+        self.controller.geometry("600x800" if boards == 1 else "")
+
+    @timed("render_keyboard")
     def update_keyboard(self):
         for key, btn in self.keyboard_buttons.items():
-            if key in self.correct_letters:
-                btn["bg"] = COLOR_CORRECT
-            elif key in self.half_correct_letters:
-                btn["bg"] = COLOR_HALF_CORRECT
-            elif key in self.incorrect_letters:
-                btn["bg"] = COLOR_INCORRECT
-            else:
-                btn["bg"] = COLOR_BLANK
+            if self.boards == 1:
+                state = self.key_states[0].get(key)
+                self.view.set(btn, bg=COLOR_BLANK if state is None else STATE_COLORS[state])
+                continue
+            # the key itself stays blank, a color left from a single-board game is cleared
+            self.view.set(btn, bg=COLOR_BLANK)
+            for board_states, stripe in zip(self.key_states, self.key_stripes[key]):
+                state = board_states.get(key)
+                self.view.set(stripe, bg=COLOR_BLANK if state is None else STATE_COLORS[state])
 
+    @timed("render_labels")
     def update_labels(self, colors=None):
+        """Show the current word in row use_word of every board, colors[b] the feedback colors of board b."""
         word = self.words[self.current_word]
-        for i, label in enumerate(self.labels[self.use_word]):
-            try:
-                letter = word[i].upper()
-            except IndexError:
-                letter = ""
-
-            label["text"] = letter
-            if colors:
-                label["bg"] = colors[i]
-                label["highlightbackground"] = colors[i]
-            else:
-                label["bg"] = COLOR_BLANK
-                label["highlightbackground"] = (
-                    COLOR_BORDER_HIGHLIGHT if letter else COLOR_BLANK
-                )
-
+        for b, grid in enumerate(self.labels):
+            board_colors = colors[b] if colors else None
+            if self.done[b] and not board_colors:
+                # solved on an earlier row, later guesses are not shown
+                continue
+            for i, label in enumerate(grid[self.use_word]):
+                try:
+                    letter = word[i].upper()
+                except IndexError:
+                    letter = ""
+
+                if board_colors:
+                    self.view.set(label, text=letter, bg=board_colors[i], highlightbackground=board_colors[i])
+                else:
+                    self.view.set(
+                        label,
+                        text=letter,
+                        bg=COLOR_BLANK,
+                        highlightbackground=COLOR_BORDER_HIGHLIGHT if letter else COLOR_BLANK,
+                    )
+
+    @timed("check_word")
     def check_word(self, event=None):
 
+        if self.session.status != IN_PROGRESS:
+            return
+        self.cancel_hint()
         word = self.words[self.current_word].lower()
-        if len(word) < WORD_LEN or word not in WORD or not word.isalpha():
+        try:
+            if self.boards == 1:
+                code, status = self.session.submit(word)
+                codes = [code]
+            else:
+                codes, status = self.session.submit(word)
+        except HardModeViolation as e:
+            self.toast(f"Hard mode: {e}")
+            return
+        except InvalidGuess:
             self.toast("Please enter a 5 letter valid word")
             return
 
-        colors = [COLOR_BLANK] * WORD_LEN
-        answer_letters = list(self.answer)
-
-        # First pass: mark correct positions (green)
-        for i, letter in enumerate(word):
-            if letter == self.answer[i]:
-                colors[i] = COLOR_CORRECT
-                self.correct_letters.add(letter.upper())
-                answer_letters[i] = None
-
-        # Second pass: mark present letters (yellow)
-        for i, letter in enumerate(word):
-            if colors[i] == COLOR_CORRECT:
+        # render the feedback as colors and keyboard state, per board
+        colors = []
+        for key_states, code in zip(self.key_states, codes):
+            if code is None:
+                colors.append(None)
                 continue
-
-            if letter in answer_letters:
-                colors[i] = COLOR_HALF_CORRECT
-                self.half_correct_letters.add(letter.upper())
-                answer_letters[answer_letters.index(letter)] = None
-            else:
-                colors[i] = COLOR_INCORRECT
-                self.incorrect_letters.add(letter.upper())
+            letter_states = states(code)
+            colors.append([STATE_COLORS[state] for state in letter_states])
+            for letter, state in zip(word.upper(), letter_states):
+                key_states[letter] = max(state, key_states.get(letter, state))
 
         # update display
         self.use_word = self.current_word
         self.update_labels(colors)
+        for b, code in enumerate(codes):
+            if code == ALL_CORRECT:
+                self.done[b] = True
         self.update_keyboard()
 
+        # multi-board games don't fit the log's one-answer records
+        if status != IN_PROGRESS and self.game_log is not None and self.boards == 1:
+            self.game_log.record(self.session)
+
+        if status != IN_PROGRESS:
+            self.record_stats()
+            if self.profile is not None:
+                self.profile.stop()
+
         # check win/lose conditions
-        self.current_word += 1
-        if word == self.answer:
+        if status == WON:
             self.congratulate()
-        elif self.current_word >= MAX_TRIES:
+        elif status == LOST:
             self.humiliate()
         else:
-            toast_message = f"Try again. Attempts left: {MAX_TRIES - self.current_word}"
+            self.current_word += 1
+            toast_message = (
+                f"Try again. Attempts left: {self.session.attempts_left}, "
+                f"possible words: {self.session.remaining}"
+            )
             self.toast(toast_message)
 
+    def request_hint(self):
+        """Show the best guesses; the tree answers at once, the solver runs in the background."""
+        if self.session.status != IN_PROGRESS:
+            return
+        from wordle_hints import HintWorker, analyse, analyse_boards
+
+        if self.hints is None:
+            self.hints = HintWorker()
+        if self.boards > 1:
+            sets = [self.session.candidate_indices(b) for b in self.session.active_boards()]
+            self.hints.request(analyse_boards, DICTIONARY, sets)
+        else:
+            from wordle_tree import tree_hint
+
+            guess = tree_hint(self.session)
+            if guess:
+                self.cancel_hint()
+                self.hint_text.set(f"Best guess: {guess.upper()}  ({self.session.remaining} possible)")
+                return
+            guesses = self.session.legal_guess_indices() if self.session.hard is not None else None
+            self.hints.request(analyse, DICTIONARY, self.session.history(), self.session.candidate_indices(), guesses)
+        self.hint_text.set("Thinking...")
+        if self.hint_poll is None:
+            self.hint_poll = self.after(HINT_POLL_MS, self.poll_hint)
+
+    def poll_hint(self):
+        self.hint_poll = None
+        try:
+            result = self.hints.poll()
+        except ImportError:
+            self.hint_text.set("Hints need numpy: pip install numpy")
+            return
+        except Exception:
+            # whatever failed in the worker, the hint is given up instead of staying on "Thinking..."
+            self.cancel_hint(clear=True)
+            self.toast("No hint available")
+            return
+        if result:
+            guesses = "  ".join(f"{guess.upper()} {bits:.2f}" for guess, bits in result["ranking"])
+            self.hint_text.set(f"{guesses}  ({result['remaining']} possible)")
+        elif self.hints.pending:
+            self.hint_poll = self.after(HINT_POLL_MS, self.poll_hint)
+
+    def cancel_hint(self, clear=False):
+        """Drop a hint still being computed (its result would be stale), and optionally the one shown."""
+        if self.hints is not None and self.hints.pending:
+            self.hints.cancel()
+            clear = True
+        if self.hint_poll is not None:
+            self.after_cancel(self.hint_poll)
+            self.hint_poll = None
+        if clear:
+            self.hint_text.set("")
+
+    def destroy(self):
+        if self.hints is not None:
+            self.hints.close()
+        if self.profile is not None:
+            # an unfinished game still gets its profile written
+            self.profile.stop()
+        if self.game_log is not None:
+            self.game_log.close()
+        if self.stats_poll is not None:
+            self.after_cancel(self.stats_poll)
+        if self.stats is not None:
+            self.stats.close()
+        tk.Frame.destroy(self)
+
     def remove_letter(self, event=None):
 
-        if self.words[self.current_word]:
+        if self.session.status == IN_PROGRESS and self.words[self.current_word]:
+            self.cancel_hint()
             self.words[self.current_word] = self.words[self.current_word][:-1]
             self.use_word = self.current_word
             self.update_labels()
@@ -349,7 +650,8 @@ class MainScreen(tk.Frame):
     def enter_letter(self, event=None, key=None):
 
         key = key or event.keysym.upper()
-        if key in string.ascii_uppercase:
+        if key in string.ascii_uppercase and self.session.status == IN_PROGRESS:
+            self.cancel_hint()
             self.words[self.current_word] += key
             self.use_word = self.current_word
             self.update_labels()
@@ -0,0 +1,310 @@
+"""
+Precomputed decision tree: a hint becomes a pointer walk.
+
+The tree holds the opening guess and, for every feedback code, the node
+with the next guess, down to the last answer. It is built offline from the
+pattern matrix, choosing the max-entropy guess at every node (the same
+rule as wordle_solver, ties in favour of possible answers), and stored as
+a compact binary file next to the pattern cache.
+
+File layout (little endian):
+
+    header  "WDTR", u16 version, u16 reserved, 16 bytes words hash,
+            u32 node count, u32 root offset
+    node    u16 guess index, u16 child count,
+            32 byte bitmap over feedback codes 0..255,
+            u32 child offset per set bit below ALL_CORRECT, in code order
+
+A set bit means the code can occur after this guess; the ALL_CORRECT bit
+marks a guess that can itself be the answer and has no child. The child
+for a code is found by counting the set bits below it (popcount rank), so
+following one feedback is O(1) and needs neither numpy nor the word
+lists in memory beyond dictionary.guesses. Child offsets are relative to
+their node, which makes every subtree position independent: the subtrees
+under the opening guess are built in parallel worker processes, written as
+checkpoint files as they finish and simply concatenated, so an interrupted
+build resumes where it stopped.
+
+python wordle_tree.py --workers 4       # build (about 10 s on one core)
+"""
+
+import argparse
+import mmap
+import os
+import shutil
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from wordle_dictionary import get_dictionary, words_hash
+from wordle_files import write_atomic
+from wordle_score import ALL_CORRECT
+
+TREE_VERSION = 1
+CACHE_DIR = Path(__file__).resolve().parent / ".wordle_cache"
+
+MAGIC = b"WDTR"
+HEADER = struct.Struct("<4sHH16sII")
+NODE = struct.Struct("<HH")
+BITMAP_BYTES = 32
+OFFSET = struct.Struct("<I")
+CHILDREN_AT = NODE.size + BITMAP_BYTES
+
+
+def tree_path(digest, cache_dir=CACHE_DIR):
+    return Path(cache_dir) / f"tree-v{TREE_VERSION}-{digest}.bin"
+
+
+class DecisionTree:
+    """Read-only view of a serialized tree (bytes or an mmap)."""
+
+    def __init__(self, data, guesses):
+        magic, version, _, digest, nodes, root = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != TREE_VERSION:
+            raise ValueError("Not a decision tree file of this version")
+        self.data = data
+        self.guesses = guesses
+        self.digest = digest.decode("ascii")
+        self.nodes = nodes
+        self.root = root
+
+    def guess_at(self, node):
+        """Index into guesses of the guess at this node."""
+        return NODE.unpack_from(self.data, node)[0]
+
+    def _bitmap(self, node):
+        return int.from_bytes(self.data[node + NODE.size:node + CHILDREN_AT], "little")
+
+    def child(self, node, code):
+        """Node to play after feedback code, None if that code ends the game or cannot occur."""
+        bits = self._bitmap(node)
+        if code >= ALL_CORRECT or not bits >> code & 1:
+            return None
+        rank = (bits & ((1 << code) - 1)).bit_count()
+        return node + OFFSET.unpack_from(self.data, node + CHILDREN_AT + OFFSET.size * rank)[0]
+
+    def next_guess(self, history):
+        """
+        The tree's guess after history [(guess, code), ...], or None if
+        the history left the tree (a different guess was played).
+        """
+        node = self.root
+        for guess, code in history:
+            if self.guesses[self.guess_at(node)] != guess:
+                return None
+            node = self.child(node, code)
+            if node is None:
+                return None
+        return self.guesses[self.guess_at(node)]
+
+    def depths(self):
+        """{number of guesses: answers solved with that many}, over the whole tree."""
+        result = {}
+        stack = [(self.root, 1)]
+        while stack:
+            node, depth = stack.pop()
+            bits = self._bitmap(node)
+            if bits >> ALL_CORRECT & 1:
+                result[depth] = result.get(depth, 0) + 1
+            for rank in range(NODE.unpack_from(self.data, node)[1]):
+                offset = OFFSET.unpack_from(self.data, node + CHILDREN_AT + OFFSET.size * rank)[0]
+                stack.append((node + offset, depth + 1))
+        return dict(sorted(result.items()))
+
+
+def load_tree(path, guesses):
+    """Map a tree file read-only."""
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return DecisionTree(data, guesses)
+
+
+_trees = {}
+
+
+def get_tree(dictionary=None, cache_dir=CACHE_DIR):
+    """Tree for the dictionary's word lists, or None if it has not been built."""
+    dictionary = dictionary or get_dictionary()
+    key = (dictionary.digest, str(cache_dir))
+    if key not in _trees:
+        path = tree_path(dictionary.digest, cache_dir)
+        _trees[key] = load_tree(path, dictionary.guesses) if path.exists() else None
+    return _trees[key]
+
+
+def tree_hint(session):
+    """Next guess for a GameSession from the tree, None if there is none to follow."""
+    if session.hard is not None:
+        # the tree ignores hard-mode rules
+        return None
+    return tree_guess(session.dictionary, session.history())
+
+
+def tree_guess(dictionary, history):
+    """Next guess after history ([(guess, code), ...]) from the dictionary's tree, None without one."""
+    tree = get_tree(dictionary)
+    return tree.next_guess(history) if tree else None
+
+
+# --- building ---
+
+def encode_node(guess, codes, children):
+    """
+    Serialize one node followed by its subtrees. codes are the feedback
+    codes that can occur, children the encoded subtree of each code below
+    ALL_CORRECT, in code order.
+    """
+    bits = 0
+    for code in codes:
+        bits |= 1 << code
+    head = NODE.size + BITMAP_BYTES + OFFSET.size * len(children)
+    offsets = []
+    for child in children:
+        offsets.append(head)
+        head += len(child)
+    return b"".join([
+        NODE.pack(guess, len(children)),
+        bits.to_bytes(BITMAP_BYTES, "little"),
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        *children,
+    ])
+
+
+def best_guess(patterns, candidates):
+    """Index of the max-entropy guess for these answer indices."""
+    if len(candidates) <= 2:
+        # a candidate splits two answers as well as any word, and can win
+        return int(candidates[0])
+    from wordle_solver import rank_guesses
+
+    word = rank_guesses(patterns=patterns, candidates=candidates, top=1)[0][0]
+    return patterns.guess_index[word]
+
+
+def split(patterns, guess, candidates):
+    """[(code, answer indices), ...] in code order."""
+    import numpy as np
+
+    row = np.asarray(patterns.matrix[guess, candidates])
+    return [(int(code), candidates[row == code]) for code in np.unique(row)]
+
+
+def build_subtree(patterns, candidates):
+    """Encoded subtree that solves every answer in candidates."""
+    guess = best_guess(patterns, candidates)
+    buckets = split(patterns, guess, candidates)
+    children = [build_subtree(patterns, sub) for code, sub in buckets if code != ALL_CORRECT]
+    return encode_node(guess, [code for code, _ in buckets], children)
+
+
+_worker_patterns = None
+
+
+def _init_worker(answers, guesses, cache_dir):
+    global _worker_patterns
+    import wordle_patterns
+
+    _worker_patterns = wordle_patterns.load(answers, guesses, cache_dir)
+
+
+def _build_part(unit):
+    """Worker entry: build one subtree under the opening guess and checkpoint it."""
+    path, candidates = unit
+    part = build_subtree(_worker_patterns, candidates)
+    # a build killed mid-write must not leave a checkpoint that a rerun would trust
+    write_atomic(path, part)
+    return path
+
+
+def build(answers=None, guesses=None, cache_dir=CACHE_DIR, workers=None, progress=None):
+    """
+    Build the tree for these word lists (default: the shared dictionary)
+    and write it to cache_dir. workers=1 builds in this process, otherwise
+    the subtrees of the opening guess go to a process pool. Finished
+    subtrees are kept in a checkpoint directory until the whole tree is
+    written, and reused when the build is run again. progress(done, total)
+    is called as subtrees finish. Returns the path of the tree file.
+    """
+    import numpy as np
+    import wordle_patterns
+
+    if answers is None or guesses is None:
+        dictionary = get_dictionary()
+        answers, guesses = dictionary.answers, dictionary.guesses
+    patterns = wordle_patterns.load(answers, guesses, cache_dir)
+    digest = words_hash(answers, guesses)
+    path = tree_path(digest, cache_dir)
+    parts_dir = path.with_suffix(".parts")
+    parts_dir.mkdir(parents=True, exist_ok=True)
+
+    root = best_guess(patterns, np.arange(len(answers)))
+    buckets = split(patterns, root, np.arange(len(answers)))
+    parts = {code: parts_dir / f"{code:03d}.bin" for code, _ in buckets if code != ALL_CORRECT}
+    todo = [(parts[code], sub) for code, sub in buckets if code in parts and not parts[code].exists()]
+
+    done = len(parts) - len(todo)
+    if progress:
+        progress(done, len(parts))
+    if workers == 1:
+        for part_path, sub in todo:
+            write_atomic(part_path, build_subtree(patterns, sub))
+            done += 1
+            if progress:
+                progress(done, len(parts))
+    elif todo:
+        # biggest subtrees first, so the pool does not end waiting on one of them
+        todo.sort(key=lambda unit: -len(unit[1]))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(answers, guesses, cache_dir)) as pool:
+            for _ in pool.map(_build_part, todo):
+                done += 1
+                if progress:
+                    progress(done, len(parts))
+
+    children = [parts[code].read_bytes() for code, _ in buckets if code in parts]
+    body = encode_node(root, [code for code, _ in buckets], children)
+    nodes = _count_nodes(body)
+    write_atomic(path, HEADER.pack(MAGIC, TREE_VERSION, 0, digest.encode("ascii"), nodes, HEADER.size) + body)
+    shutil.rmtree(parts_dir)
+    for stale in path.parent.glob("tree-v*.bin"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+    _trees.clear()
+    return path
+
+
+def _count_nodes(body):
+    count = 0
+    stack = [0]
+    while stack:
+        node = stack.pop()
+        count += 1
+        for rank in range(NODE.unpack_from(body, node)[1]):
+            stack.append(node + OFFSET.unpack_from(body, node + CHILDREN_AT + OFFSET.size * rank)[0])
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the decision tree used for instant hints.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    def progress(done, total):
+        print(f"\r{done}/{total} subtrees", end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    path = build(workers=args.workers, progress=progress)
+    elapsed = time.perf_counter() - start
+    dictionary = get_dictionary()
+    tree = load_tree(path, dictionary.guesses)
+    depths = tree.depths()
+    solved = sum(depths.values())
+    average = sum(depth * n for depth, n in depths.items()) / solved
+    print(f"\n{path.name}: {tree.nodes} nodes, {path.stat().st_size} bytes, built in {elapsed:.1f}s")
+    print(f"opening guess {tree.next_guess([])}, {average:.3f} guesses on average, depths {depths}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Dirty-tracking renderer for the Tkinter front end.
+
+Every widget option change is a Tcl round trip, which adds up on slow
+(e.g. remote X) displays and with multi-board layouts of over a thousand
+cells. Renderer keeps the options last pushed to each widget; set() only
+records the wanted values, and one flush per event (scheduled with
+after_idle) configures just the widgets whose options actually changed,
+each with a single configure() call.
+
+Nothing here imports tkinter, any object with configure(**options) works
+as a widget.
+"""
+
+_MISSING = object()
+
+
+class Renderer:
+
+    def __init__(self, schedule):
+        """schedule(func) runs func once the current event is handled, e.g. widget.after_idle."""
+        self.schedule = schedule
+        # widget -> {option: value} as last pushed (or created)
+        self.rendered = {}
+        # widget -> {option: value} wanted at the next flush
+        self.pending = {}
+        self.scheduled = False
+        # configure() calls made, for benchmarks and tests
+        self.configures = 0
+
+    def track(self, widget, **options):
+        """Register a new widget with the options it was created with."""
+        self.rendered[widget] = options
+        self.pending.pop(widget, None)
+
+    def forget(self, widgets):
+        """Drop widgets that are about to be destroyed."""
+        for widget in widgets:
+            self.rendered.pop(widget, None)
+            self.pending.pop(widget, None)
+
+    def set(self, widget, **options):
+        self.pending.setdefault(widget, {}).update(options)
+        if not self.scheduled:
+            self.scheduled = True
+            self.schedule(self.flush)
+
+    def flush(self):
+        """Push the pending changes that differ from what is on screen."""
+        self.scheduled = False
+        pending, self.pending = self.pending, {}
+        for widget, options in pending.items():
+            rendered = self.rendered.setdefault(widget, {})
+            changed = {k: v for k, v in options.items() if rendered.get(k, _MISSING) != v}
+            if changed:
+                widget.configure(**changed)
+                rendered.update(changed)
+                self.configures += 1
+
+
+class ToastManager:
+    """
+    Short messages in one reused label. A new message replaces the one
+    showing and cancels its hide timer, so no widgets or after callbacks
+    pile up however many messages are shown.
+    """
+
+    def __init__(self, make_label, after, after_cancel):
+        """make_label() creates the label (already placed with grid), after/after_cancel as on a Tk widget."""
+        self.make_label = make_label
+        self.after = after
+        self.after_cancel = after_cancel
+        self.label = None
+        self.timer = None
+        # labels created so far, stays at 1
+        self.widget_count = 0
+
+    def show(self, message, duration=2):
+        if self.label is None:
+            self.label = self.make_label()
+            self.widget_count += 1
+        if self.timer is not None:
+            self.after_cancel(self.timer)
+        self.label.configure(text=message)
+        # grid() without options restores the placement grid_remove() remembered
+        self.label.grid()
+        self.timer = self.after(int(duration * 1000), self.hide)
+
+    def hide(self):
+        self.timer = None
+        if self.label is not None:
+            self.label.grid_remove()
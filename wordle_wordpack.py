@@ -0,0 +1,118 @@
+"""
+Packed binary word lists.
+
+The text lists (wordle_ord.txt and allwords.txt inside the zip) are parsed
+once and written as a small binary file that later processes load with
+mmap. Every word is one 25-bit integer, 5 bits per letter (a=0 .. z=25,
+first letter in the lowest bits), stored as little-endian array('I'):
+
+    header  <4sHHIIII  magic "WDLP", version, word length, answer count,
+                       guess count, source key, crc32 of the payload
+    payload            guess codes, answers first (so the first
+                       answer-count codes are the answers)
+
+The source key is a crc32 of the size and mtime of the text files, so the
+pack is rebuilt when they change without reading them; the payload crc
+catches a truncated or corrupted file. load_pack() raises ValueError for
+anything that does not check out, and the caller falls back to the text.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+MAGIC = b"WDLP"
+PACK_VERSION = 1
+HEADER = struct.Struct("<4sHHIIII")
+WORD_LEN = 5
+
+_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+# two letters per lookup: _PAIRS[first | second << 5]
+_PAIRS = ["??"] * 1024
+for _i, _a in enumerate(_LETTERS):
+    for _j, _b in enumerate(_LETTERS):
+        _PAIRS[_i | _j << 5] = _a + _b
+
+
+def encode_word(word):
+    code = 0
+    for i, letter in enumerate(word):
+        code |= (ord(letter) - 97) << (5 * i)
+    return code
+
+
+def decode_word(code):
+    return _PAIRS[code & 1023] + _PAIRS[code >> 10 & 1023] + _LETTERS[code >> 20]
+
+
+def source_key(paths):
+    """crc32 of the size and mtime of each path (missing files count too)."""
+    parts = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            parts.append(f"{st.st_size}:{st.st_mtime_ns}")
+        except OSError:
+            parts.append("-")
+    return zlib.crc32("|".join(parts).encode("ascii"))
+
+
+def pack_words(answers, guesses, key=0):
+    """The file contents for answers and guesses (answers first in guesses)."""
+    if tuple(guesses[:len(answers)]) != tuple(answers):
+        raise ValueError("guesses must start with the answers")
+    for word in guesses:
+        if len(word) != WORD_LEN or not word.isascii() or not word.isalpha() or not word.islower():
+            raise ValueError(f"cannot pack {word!r}")
+    codes = array("I", map(encode_word, guesses))
+    if sys.byteorder == "big":
+        codes.byteswap()
+    payload = codes.tobytes()
+    header = HEADER.pack(MAGIC, PACK_VERSION, WORD_LEN, len(answers), len(guesses), key, zlib.crc32(payload))
+    return header + payload
+
+
+def load_pack(path, key=None):
+    """
+    (answers, guesses) as tuples from a pack file. key, if given, must
+    match the source key it was written with. Raises ValueError if the file
+    is stale, damaged or of another version, OSError if it can't be read.
+    """
+    with open(path, "rb") as f:
+        # mmap raises ValueError for an empty file as well
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) < HEADER.size:
+                raise ValueError("truncated header")
+            magic, version, word_len, n_answers, n_guesses, stored_key, crc = HEADER.unpack_from(mm)
+            if magic != MAGIC or version != PACK_VERSION or word_len != WORD_LEN:
+                raise ValueError("not a version 1 word pack")
+            if key is not None and stored_key != key:
+                raise ValueError("word lists changed")
+            if len(mm) != HEADER.size + 4 * n_guesses or n_answers > n_guesses:
+                raise ValueError("wrong size")
+            codes = array("I")
+            with memoryview(mm) as view:
+                payload = view[HEADER.size:]
+                if zlib.crc32(payload) != crc:
+                    payload.release()
+                    raise ValueError("checksum mismatch")
+                codes.frombytes(payload)
+                payload.release()
+    if sys.byteorder == "big":
+        codes.byteswap()
+    pairs, letters = _PAIRS, _LETTERS
+    # decode_word() inlined, a call per word costs more than the lookups
+    guesses = tuple([pairs[c & 1023] + pairs[c >> 10 & 1023] + letters[c >> 20] for c in codes])
+    return guesses[:n_answers], guesses
+
+
+def write_pack(path, data):
+    """Write atomically: two front ends started together may both rebuild the pack while the other mmaps it."""
+    # only needed when the pack is (re)built, not on a normal start
+    from wordle_files import write_atomic
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_atomic(path, data)